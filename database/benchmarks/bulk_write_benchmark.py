@@ -0,0 +1,70 @@
+"""
+Rows/sec for the per-record vs bulk price write paths on a synthetic price history.
+
+Usage:
+    python database/benchmarks/bulk_write_benchmark.py --tickers 500 --days 1260
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from database.database.StockDatabase import StockDatabase
+from database.database.db_writers import StoreMarketData
+
+
+def synthetic_prices(ticker: str, days: int):
+    start = datetime(2020, 1, 1)
+    return [
+        {
+            'symbol': ticker,
+            'date': (start + timedelta(days=i)).strftime('%Y-%m-%d'),
+            'open': 100.0 + i, 'high': 101.0 + i, 'low': 99.0 + i, 'close': 100.5 + i,
+            'volume': 1_000_000 + i, 'change': 0.5, 'change_percent': 0.005, 'vwap': 100.2 + i
+        }
+        for i in range(days)
+    ]
+
+
+def run(tickers: int, days: int, baseline_tickers: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = StockDatabase(db_name=os.path.join(tmp, 'bench.db'))
+        db.initialize()
+        store = StoreMarketData(db._get_connection())
+        symbols = [f"T{i:04d}" for i in range(tickers)]
+
+        # Per-record path commits every row, so time it on a subset and report rows/sec
+        start = time.perf_counter()
+        rows = 0
+        for symbol in symbols[:baseline_tickers]:
+            for record in synthetic_prices(symbol, days):
+                store.store_price(record)
+                rows += 1
+        single_rate = rows / (time.perf_counter() - start)
+
+        store.conn.execute("DELETE FROM price")
+        store.conn.commit()
+
+        start = time.perf_counter()
+        rows = 0
+        for symbol in symbols:
+            rows += store.store_price_bulk(synthetic_prices(symbol, days))
+        bulk_rate = rows / (time.perf_counter() - start)
+        store.conn.close()
+
+    print(f"per-record store_price : {single_rate:12,.0f} rows/sec ({baseline_tickers} tickers x {days} days)")
+    print(f"store_price_bulk       : {bulk_rate:12,.0f} rows/sec ({tickers} tickers x {days} days)")
+    print(f"speedup                : {bulk_rate / single_rate:12,.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--days", type=int, default=1260)
+    parser.add_argument("--baseline-tickers", type=int, default=5)
+    args = parser.parse_args()
+    run(args.tickers, args.days, args.baseline_tickers)
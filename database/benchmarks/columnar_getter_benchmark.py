@@ -0,0 +1,73 @@
+"""
+Latency and peak memory of getter result formats for a multi-year price read.
+
+Compares the "records" path (dict per row, then pd.DataFrame + pd.to_datetime as the
+factor fetchers do) with the columnar "frame" and "numpy" formats.
+
+Usage:
+    python database/benchmarks/columnar_getter_benchmark.py --tickers 500 --days 1260
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from database.database.db_getters import GetMarketData
+from synthetic_db import build
+
+COLUMNS = ["symbol", "date", "close"]
+
+
+def records_to_frame(getter, symbols):
+    df = pd.DataFrame(getter.get_price_data(symbols, columns=COLUMNS))
+    df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
+def measure(fn, repeat: int):
+    fn()  # warm page cache
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def run(tickers: int, days: int, repeat: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = build(os.path.join(tmp, 'bench.db'), tickers, days)
+        symbols = [f"T{t:04d}" for t in range(tickers)]
+        getter = GetMarketData(db.pool)
+        cases = {
+            "records -> DataFrame": lambda: records_to_frame(getter, symbols),
+            "frame": lambda: getter.with_format("frame").get_price_data(symbols, columns=COLUMNS),
+            "numpy": lambda: getter.with_format("numpy").get_price_data(symbols, columns=COLUMNS),
+        }
+        results = {label: measure(fn, repeat) for label, fn in cases.items()}
+        db.close()
+
+    rows = len(results["frame"][2])
+    print(f"{rows:,} rows ({tickers} tickers x {days} days), columns {COLUMNS}")
+    print(f"{'format':24s} {'seconds':>9s} {'peak MB':>9s}")
+    base_time, base_peak, _ = results["records -> DataFrame"]
+    for label, (elapsed, peak, _) in results.items():
+        print(f"{label:24s} {elapsed:9.3f} {peak / 1e6:9.1f}   ({base_time / elapsed:.1f}x faster, {base_peak / peak:.1f}x less memory)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--days", type=int, default=1260)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.tickers, args.days, args.repeat)
@@ -0,0 +1,114 @@
+"""
+Read latency before and after the StockDatabase schema migration (indexes, WITHOUT ROWID, ANALYZE).
+
+Builds a synthetic price/market cap history in the pre-migration layout (rowid tables,
+primary keys only), times typical reads, migrates it with StockDatabase.initialize and
+times the same reads again.
+
+Usage:
+    python database/benchmarks/query_benchmark.py --tickers 500 --days 1260
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from database.database.StockDatabase import StockDatabase
+
+LEGACY_SCHEMA = """
+CREATE TABLE price (
+    symbol TEXT, date TEXT, open REAL, high REAL, low REAL, close REAL, volume INTEGER,
+    change REAL, change_percent REAL, vwap REAL,
+    PRIMARY KEY (symbol, date)
+);
+CREATE TABLE market_cap (
+    symbol TEXT, date TEXT, market_cap REAL,
+    PRIMARY KEY (symbol, date)
+);
+"""
+
+
+def build_legacy(path: str, tickers: int, days: int):
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    start = datetime(2020, 1, 1)
+    dates = [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days)]
+    rng = random.Random(0)
+    with conn:
+        for t in range(tickers):
+            symbol = f"T{t:04d}"
+            conn.executemany(
+                "INSERT INTO price VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(symbol, d, 100.0, 101.0, 99.0, 100 + rng.random(), 1_000_000, 0.5, 0.005, 100.2) for d in dates]
+            )
+            conn.executemany(
+                "INSERT INTO market_cap VALUES (?, ?, ?)",
+                [(symbol, d, 1e9 * rng.random()) for d in dates]
+            )
+    conn.close()
+    return [f"T{t:04d}" for t in range(tickers)], dates
+
+
+def queries(symbols, dates):
+    as_of = dates[len(dates) // 2]
+    placeholders = ", ".join(["?"] * len(symbols))
+    return {
+        "all symbols on date (price close)": (
+            "SELECT symbol, close FROM price WHERE date = ?", (as_of,)
+        ),
+        "all symbols on date (market cap)": (
+            "SELECT symbol, market_cap FROM market_cap WHERE date = ?", (as_of,)
+        ),
+        "symbol IN (...) on date (price close)": (
+            f"SELECT symbol, close FROM price WHERE symbol IN ({placeholders}) AND date = ?", (*symbols, as_of)
+        ),
+        "symbol IN (...) 1y range (symbol, date, close)": (
+            f"SELECT symbol, date, close FROM price WHERE symbol IN ({placeholders}) AND date >= ? AND date <= ?",
+            (*symbols, dates[-252], dates[-1])
+        ),
+    }
+
+
+def time_queries(path: str, symbols, dates, repeat: int):
+    conn = sqlite3.connect(path)
+    results = {}
+    for label, (sql, params) in queries(symbols, dates).items():
+        conn.execute(sql, params).fetchall()  # warm page cache
+        start = time.perf_counter()
+        for _ in range(repeat):
+            conn.execute(sql, params).fetchall()
+        results[label] = (time.perf_counter() - start) / repeat * 1000
+    conn.close()
+    return results
+
+
+def run(tickers: int, days: int, repeat: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        symbols, dates = build_legacy(path, tickers, days)
+        before = time_queries(path, symbols, dates, repeat)
+
+        start = time.perf_counter()
+        StockDatabase(db_name=path).initialize()
+        migrate_seconds = time.perf_counter() - start
+        after = time_queries(path, symbols, dates, repeat)
+
+    print(f"{tickers} tickers x {days} days, migration took {migrate_seconds:.1f}s")
+    print(f"{'query':48s} {'before ms':>10s} {'after ms':>10s} {'speedup':>8s}")
+    for label in before:
+        print(f"{label:48s} {before[label]:10.2f} {after[label]:10.2f} {before[label] / after[label]:7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--days", type=int, default=1260)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.tickers, args.days, args.repeat)
@@ -0,0 +1,82 @@
+"""
+Synthetic stock database used by the benchmarks.
+
+Fills prices and market cap (business days) plus quarterly earnings, key metrics,
+financial ratios and enterprise values for `tickers` symbols through the regular
+Store* bulk writers, so the schema matches a populated database.
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from database.database.StockDatabase import StockDatabase
+from database.database.db_writers import StoreMarketData, StoreFinancialMetrics, StoreValuation
+
+
+def business_days(start: str, days: int) -> List[str]:
+    current = datetime.strptime(start, '%Y-%m-%d')
+    dates = []
+    while len(dates) < days:
+        if current.weekday() < 5:
+            dates.append(current.strftime('%Y-%m-%d'))
+        current += timedelta(days=1)
+    return dates
+
+
+def build(db_path: str, tickers: int = 100, days: int = 1260, start: str = '2020-01-01', seed: int = 0) -> StockDatabase:
+    db = StockDatabase(db_name=db_path)
+    db.initialize()
+    conn = db._get_connection()
+    market_data, metrics, valuation = StoreMarketData(conn), StoreFinancialMetrics(conn), StoreValuation(conn)
+    rng = random.Random(seed)
+    dates = business_days(start, days)
+    # Quarter ends covering the price history plus one year of look-back
+    quarters = [
+        d.strftime('%Y-%m-%d') for d in
+        (datetime.strptime(start, '%Y-%m-%d') - timedelta(days=365) + timedelta(days=91 * q) for q in range(days // 60 + 8))
+    ]
+
+    for t in range(tickers):
+        symbol = f"T{t:04d}"
+        price, shares = 50 + 100 * rng.random(), 1e8 * (1 + rng.random())
+        prices, caps = [], []
+        for date in dates:
+            price *= 1 + rng.gauss(0.0003, 0.02)
+            prices.append({
+                'symbol': symbol, 'date': date, 'open': price, 'high': price * 1.01, 'low': price * 0.99,
+                'close': price, 'volume': int(1e6 * rng.random()), 'change': 0.0, 'change_percent': 0.0, 'vwap': price
+            })
+            caps.append({'symbol': symbol, 'date': date, 'market_cap': price * shares})
+        market_data.store_price_bulk(prices)
+        market_data.store_market_cap_bulk(caps)
+
+        earnings, key_metrics, ratios, evs = [], [], [], []
+        for date in quarters:
+            eps = rng.gauss(2.0, 1.0)
+            ev = shares * price * (1 + rng.random())
+            earnings.append({'symbol': symbol, 'date': date, 'eps_actual': eps})
+            key_metrics.append({
+                'symbol': symbol, 'date': date, 'reported_currency': 'USD',
+                'earnings_yield': rng.gauss(0.05, 0.03), 'free_cash_flow_yield': rng.gauss(0.04, 0.03),
+                'graham_number': None if rng.random() < 0.1 else 50 * rng.random(),
+                'return_on_equity': rng.gauss(0.15, 0.1), 'return_on_assets': rng.gauss(0.07, 0.05),
+                'enterprise_value': ev
+            })
+            ratios.append({
+                'symbol': symbol, 'date': date, 'reported_currency': 'USD',
+                'price_to_earnings_ratio': rng.uniform(5, 40), 'price_to_book_ratio': rng.uniform(0.5, 10),
+                'price_to_sales_ratio': rng.uniform(0.5, 15), 'price_to_free_cash_flow_ratio': rng.uniform(5, 50),
+                'book_value_per_share': rng.uniform(5, 80)
+            })
+            evs.append({'symbol': symbol, 'date': date, 'enterprise_value': ev})
+        metrics.store_earnings_bulk(earnings)
+        metrics.store_key_metrics_bulk(key_metrics)
+        metrics.store_financial_ratios_bulk(ratios)
+        valuation.store_enterprise_values_bulk(evs)
+
+    conn.execute("ANALYZE")
+    conn.close()
+    return db
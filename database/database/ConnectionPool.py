@@ -0,0 +1,84 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+BUSY_TIMEOUT = 30  # seconds a connection waits on a lock before "database is locked"
+ACQUIRE_TIMEOUT = 60  # seconds a caller waits for a free pooled connection
+
+# Applied to every connection. WAL lets readers run while a writer commits;
+# synchronous=NORMAL is durable in WAL mode apart from the last commits on power loss.
+PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -64000,       # KiB (64 MB) of page cache per connection
+    'mmap_size': 268435456,     # 256 MB memory-mapped reads
+    'temp_store': 'MEMORY',
+}
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply PRAGMAS to a freshly opened connection."""
+    for name, value in PRAGMAS.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+
+class ConnectionPool:
+    """
+    Small pool of configured SQLite connections for one database file.
+
+    Connections are opened lazily up to `size` and may be used from any thread,
+    one borrower at a time:
+
+        with pool.connection() as conn:
+            conn.execute(...)
+    """
+    def __init__(self, db_path: str, size: int = 4):
+        self.db_path = db_path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        return configure_connection(conn)
+
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return self._open()
+                except Exception:
+                    self._opened -= 1
+                    raise
+        return self._idle.get(timeout=ACQUIRE_TIMEOUT)
+
+    def release(self, conn: sqlite3.Connection):
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Close idle connections (connections still borrowed are kept until returned)."""
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+                self._opened -= 1
@@ -10,20 +10,49 @@ import pandas as pd
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from .db_writers import *
+from .ConnectionPool import ConnectionPool, configure_connection, BUSY_TIMEOUT
+from .db_getters.BaseGetter import BaseGetter
+
+# Bump when the schema files change in a way existing databases must be migrated to
+SCHEMA_VERSION = 2
+# Large, narrow tables keyed by (symbol, date); rows are stored in the primary key b-tree
+WITHOUT_ROWID_TABLES = ['price', 'dividend_adjusted_price_data', 'market_cap']
+# Excel's per-sheet row limit (including the header row)
+EXCEL_MAX_ROWS = 1_048_576
+EXPORT_CHUNK_ROWS = 50_000
 
 class StockDatabase:
-    def __init__(self, db_name='../stock_data.db'):
+    def __init__(self, db_name='../stock_data.db', pool_size: int = 4):
         self.db_name = db_name
         self.db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), db_name)
+        self.pool_size = pool_size
+        self._pool: Optional[ConnectionPool] = None
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Shared pool of read connections (WAL, tuned pragmas), opened on first use."""
+        if self._pool is None:
+            self._pool = ConnectionPool(self.db_path, self.pool_size)
+        return self._pool
+
+    def _get_connection(self, check_same_thread: bool = True):
+        """Dedicated connection (e.g. for a writer) with the same pragmas as pooled ones."""
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=check_same_thread)
+        return configure_connection(conn)
 
-    def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+    def close(self):
+        """Close pooled connections."""
+        if self._pool is not None:
+            self._pool.close()
 
     def initialize(self):
         try:
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
             conn = self._get_connection()
             cursor = conn.cursor()
+            version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                self._detach_rowid_tables(conn)
 
             # Initialize schema/execute sql files
             schema_dir = os.path.join(os.path.dirname(__file__), "schema")
@@ -51,49 +80,133 @@ class StockDatabase:
                     pbar.update(1)
             
             conn.commit()
+            # Also picks up tables a previous run detached but failed to copy
+            legacy_tables = self._detached_tables(conn)
+            if version < SCHEMA_VERSION or legacy_tables:
+                self._migrate(conn, legacy_tables, version)
             conn.close()
             print("Database initialization complete.")
         except Exception as e:
             print(f"Failed to initialize database: {str(e)}")
             return False
 
+    def _detach_rowid_tables(self, conn: sqlite3.Connection):
+        """
+        Rename existing rowid versions of WITHOUT_ROWID_TABLES to `<table>__rowid` so the
+        schema files recreate them; `_migrate` copies the rows back.
+        """
+        for table in WITHOUT_ROWID_TABLES:
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            if row is None or 'WITHOUT ROWID' in row[0].upper():
+                continue
+            indexes = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (table,)
+            ).fetchall()
+            for (index,) in indexes:
+                conn.execute(f"DROP INDEX {index}")
+            conn.execute(f"ALTER TABLE {table} RENAME TO {table}__rowid")
+        conn.commit()
+
+    def _detached_tables(self, conn: sqlite3.Connection) -> List[str]:
+        """WITHOUT_ROWID_TABLES whose detached `<table>__rowid` copy still holds rows to migrate."""
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        return [table for table in WITHOUT_ROWID_TABLES if f"{table}__rowid" in names]
+
+    def _migrate(self, conn: sqlite3.Connection, legacy_tables: List[str], version: int):
+        """
+        Copy detached tables into their WITHOUT ROWID versions, drop indexes removed from the
+        schema files since `version`, refresh statistics and stamp the version.
+        """
+        for table in legacy_tables:
+            print(f"Migrating {table} to WITHOUT ROWID...")
+            with conn:
+                conn.execute(
+                    f"INSERT OR IGNORE INTO {table} SELECT * FROM {table}__rowid "
+                    f"WHERE symbol IS NOT NULL AND date IS NOT NULL"
+                )
+                conn.execute(f"DROP TABLE {table}__rowid")
+        if version < 2:
+            # Version 1 also indexed price on (symbol, date, close), which the clustered primary key covers
+            conn.execute("DROP INDEX IF EXISTS idx_price_symbol_date_close")
+            conn.commit()
+        if legacy_tables:
+            conn.execute("VACUUM")
+        # Planner statistics for the new indexes
+        conn.execute("ANALYZE")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+
     def delete(self):
         try:
-            if os.path.exists(self.db_path):
-                os.remove(self.db_path)
+            self.close()
+            for path in (self.db_path, self.db_path + '-wal', self.db_path + '-shm'):
+                if os.path.exists(path):
+                    os.remove(path)
             return True
         except Exception as e:
             print(f"Error deleting database: {e}")
             return False
     
-    def export_to_excel(self, file_path: str):
+    def export_to_excel(self, file_path: str, chunk_rows: int = EXPORT_CHUNK_ROWS):
         """Export all tables in the database to an Excel file, one sheet per table.
-        
+
+        Tables are streamed `chunk_rows` rows at a time, so memory stays bounded by the
+        chunk size rather than the largest table. Tables longer than Excel's sheet limit
+        continue on numbered sheets ("price", "price_2", ...).
+
         Args:
             file_path (str): Path to save the Excel file (e.g., "output.xlsx")
+            chunk_rows (int): Rows read from SQLite and written per chunk
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Get all user-defined tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
-            tables = [row[0] for row in cursor.fetchall()]
-            
+            with self.pool.connection() as conn:
+                # Get all user-defined tables
+                cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+                tables = [row[0] for row in cursor.fetchall()]
+
             if not tables:
                 print("No tables found in the database.")
                 return
-            
+
+            getter = BaseGetter(self.pool)
+            data_rows_per_sheet = EXCEL_MAX_ROWS - 1  # one row for the header
             with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
                 for table in tables:
-                    df = pd.read_sql_query(f"SELECT * FROM {table}", conn)
-                    df.to_excel(writer, sheet_name=table[:31], index=False)  # Sheet name max length is 31
-            
+                    sheet, sheet_rows = 1, 0
+                    columns = None
+                    for chunk in getter.iter_table(table, chunk_rows=chunk_rows):
+                        df = pd.DataFrame(chunk)
+                        columns = df.columns
+                        while len(df):
+                            if sheet_rows == data_rows_per_sheet:
+                                sheet, sheet_rows = sheet + 1, 0
+                            part = df.iloc[:data_rows_per_sheet - sheet_rows]
+                            df = df.iloc[len(part):]
+                            part.to_excel(
+                                writer, sheet_name=self._sheet_name(table, sheet), index=False,
+                                header=sheet_rows == 0, startrow=sheet_rows + (sheet_rows > 0)
+                            )
+                            sheet_rows += len(part)
+                    if columns is None:
+                        # Empty table: still write a sheet with its header
+                        with self.pool.connection() as conn:
+                            names = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+                        pd.DataFrame(columns=names).to_excel(writer, sheet_name=self._sheet_name(table, 1), index=False)
+
             print(f"Export complete: {file_path}")
-            conn.close()
         except Exception as e:
             print(f"Failed to export database to Excel: {e}")
 
+    @staticmethod
+    def _sheet_name(table: str, sheet: int) -> str:
+        # Sheet name max length is 31
+        if sheet == 1:
+            return table[:31]
+        suffix = f"_{sheet}"
+        return table[:31 - len(suffix)] + suffix
+
 if __name__ == "__main__":
     db = StockDatabase()
     db.initialize()
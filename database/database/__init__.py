@@ -1,9 +1,11 @@
 from .StockDatabase import StockDatabase
+from .ConnectionPool import ConnectionPool
 from .services import DatabasePopulator
 from .db_writers import *
 
 __all__ = [
     'StockDatabase',
+    'ConnectionPool',
     'DatabasePopulator',
     'StoreAnalysis',
     'StoreCorporateActions',
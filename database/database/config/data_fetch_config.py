@@ -12,6 +12,34 @@ class DataFetchConfig:
     retry_delay: int = 30
     batch_size: int = 25
     batch_delay: int = 60
+    # Thread pool size for DatabasePopulator.populate_batch (1 = sequential)
+    max_workers: int = 1
+    # Thread pool size for per-variant (sector/industry/indicator) macro fetches
+    variant_workers: int = 8
+    # Only fetch rows newer than what is already stored (see DatabasePopulator.populate_batch)
+    incremental: bool = False
+
+    # On-disk FMP response cache (path None = database/cache/fmp_responses.db).
+    # ttls are seconds per endpoint path; 0 disables caching for that endpoint.
+    http_cache: Dict[str, Any] = field(default_factory=lambda: {
+        'enabled': True,
+        'path': None,
+        'max_mb': 512,
+        'default_ttl': 24 * 60 * 60,
+        'ttls': {
+            'company-screener': 24 * 60 * 60,
+            'historical-price-eod/full': 12 * 60 * 60,
+            'historical-price-eod/dividend-adjusted': 12 * 60 * 60,
+            'historical-market-capitalization': 12 * 60 * 60,
+            'treasury-rates': 12 * 60 * 60,
+            'historical-sector-pe': 7 * 24 * 60 * 60,
+            'historical-industry-pe': 7 * 24 * 60 * 60,
+            'historical-sector-performance': 7 * 24 * 60 * 60,
+            'historical-industry-performance': 7 * 24 * 60 * 60,
+            'economic-indicators': 7 * 24 * 60 * 60,
+            'mergers-acquisitions-latest': 0
+        }
+    })
 
     # 5 years ago
     general_start_date: str = (datetime.now() - timedelta(days=5*365)).strftime('%Y-%m-%d')
@@ -174,6 +202,10 @@ class DataFetchConfig:
             'retry_delay': self.retry_delay,
             'batch_size': self.batch_size,
             'batch_delay': self.batch_delay,
+            'max_workers': self.max_workers,
+            'variant_workers': self.variant_workers,
+            'incremental': self.incremental,
+            'http_cache': self.http_cache,
             'analyst_estimates': self.analyst_estimates,
             'ratings': self.ratings,
             'grades': self.grades,
@@ -9,12 +9,29 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 from database.endpoints.FMPEndpoint import FMPEndpoint
+from database.endpoints.ResponseCache import ResponseCache
 from database.database.config.data_fetch_config import DataFetchConfig
 
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent / 'cache' / 'fmp_responses.db'
+
 class FMPFetcher:
     def __init__(self, config: Optional[DataFetchConfig] = None):
         self.config = config or DataFetchConfig()
-        self.fetcher = FMPEndpoint()
+        self.cache = self._build_cache(self.config.http_cache)
+        self.fetcher = FMPEndpoint(cache=self.cache)
+
+    def _build_cache(self, settings: Dict[str, Any]) -> Optional[ResponseCache]:
+        """Create the on-disk response cache described by `DataFetchConfig.http_cache`."""
+        if not settings.get('enabled', True):
+            return None
+        path = Path(settings.get('path') or DEFAULT_CACHE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return ResponseCache(
+            str(path),
+            ttls=settings.get('ttls'),
+            default_ttl=settings.get('default_ttl', 24 * 60 * 60),
+            max_bytes=int(settings.get('max_mb', 512) * 1024 * 1024)
+        )
     
     def _with_retry(self, func, label: str):
         """Retry mechanism for API calls"""
@@ -109,6 +126,13 @@ class FMPFetcher:
             f"stocks for {ticker}"
         )
 
+    def get_stock_universe(self, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Fetch the company screener snapshot indexed by symbol (downloaded once per TTL)"""
+        return self._with_retry(
+            lambda: self.fetcher.get_company_screener_universe(refresh=refresh),
+            "stock universe"
+        )
+
     def get_employee_count(
         self,
         ticker: str,
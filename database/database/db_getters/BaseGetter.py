@@ -1,15 +1,184 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from contextlib import nullcontext
+import copy
 import sqlite3
+import numpy as np
+import pandas as pd
+from ..ConnectionPool import ConnectionPool
+
+RESULT_FORMATS = ("records", "frame", "numpy")
+FETCH_CHUNK_ROWS = 50_000
+# Text columns parsed to datetime64 in columnar results
+DATE_COLUMNS = {"date", "transaction_date", "accepted_date", "declaration_date", "record_date", "payment_date"}
 
 class BaseGetter:
-    def __init__(self, conn: sqlite3.Connection):
+    """
+    Shared query path for all Get* classes.
+
+    `result_format` selects what every getter method returns:
+        "records": list of dicts, one per row (default)
+        "frame":   pandas DataFrame with float64 numeric columns, datetime64 date
+                   columns and a categorical `symbol` column
+        "numpy":   dict of column name -> NumPy array (same dtypes, `symbol` as object)
+    Columnar formats are built straight from cursor tuples, without a dict per row.
+    """
+    def __init__(self, conn: Union[sqlite3.Connection, ConnectionPool], result_format: str = "records"):
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(f"result_format must be one of {RESULT_FORMATS}, got {result_format!r}")
+        # A pool lets several threads query through the same getter concurrently
         self.conn = conn
+        self.result_format = result_format
+        # Set by `chunked`: methods then return an iterator of chunks of this many rows
+        self.chunk_rows: Optional[int] = None
+
+    def with_format(self, result_format: str) -> "BaseGetter":
+        """Copy of this getter sharing its connection but returning `result_format`."""
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(f"result_format must be one of {RESULT_FORMATS}, got {result_format!r}")
+        getter = copy.copy(self)
+        getter.result_format = result_format
+        return getter
+
+    def _connection(self):
+        if isinstance(self.conn, ConnectionPool):
+            return self.conn.connection()
+        return nullcontext(self.conn)
+
+    def chunked(self, chunk_rows: int = FETCH_CHUNK_ROWS) -> "BaseGetter":
+        """
+        Copy of this getter whose methods return an iterator of chunks instead of one result.
+
+        Each chunk holds at most `chunk_rows` rows in this getter's `result_format`
+        (list of dicts, DataFrame or dict of arrays), so large reads run in bounded memory:
+
+            for frame in getter.with_format("frame").chunked(100_000).get_key_metrics(symbols):
+                ...
+
+        The underlying connection stays borrowed until the iterator is exhausted or closed.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be positive")
+        getter = copy.copy(self)
+        getter.chunk_rows = chunk_rows
+        return getter
+
+    def iter_table(self, table_name: str, columns: Optional[List[str]] = None, chunk_rows: int = FETCH_CHUNK_ROWS) -> Iterator[Any]:
+        """Stream every row of `table_name` in chunks (see `chunked`)."""
+        selected_columns = ", ".join(columns) if columns else "*"
+        return self._iter_chunks(f"SELECT {selected_columns} FROM {table_name}", (), chunk_rows)
+
+    def get_as_of(
+        self,
+        table_name: str,
+        date: str,
+        tickers: Optional[Union[str, List[str]]] = None,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[str] = None
+    ) -> Union[List[Dict[str, Any]], pd.DataFrame, Dict[str, np.ndarray]]:
+        """
+        Latest row per symbol of a (symbol, date) table with date <= `date`, in one query.
+
+        Args:
+            table_name: Table keyed by symbol and date (e.g. "price", "key_metrics")
+            date: As-of date; rows after it are ignored
+            tickers: Symbols to include (default: every symbol in the table)
+            columns: Columns to return (default: all)
+            start_date: Oldest row still considered current; symbols with nothing newer are omitted
+        """
+        if isinstance(tickers, str):
+            tickers = [tickers]
+        selected_columns = ", ".join(f"t.{col}" for col in columns) if columns else "t.*"
+        conditions, params = ["date <= ?"], [date]
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if tickers is not None:
+            conditions.append("symbol IN ({})".format(", ".join(["?"] * len(tickers))))
+            params.extend(tickers)
+        # MAX(date) per symbol is resolved from the (symbol, date) / (date, ...) indexes
+        query = f"""
+            SELECT {selected_columns} FROM {table_name} t
+            JOIN (
+                SELECT symbol, MAX(date) AS latest FROM {table_name}
+                WHERE {" AND ".join(conditions)}
+                GROUP BY symbol
+            ) l ON t.symbol = l.symbol AND t.date = l.latest
+        """
+        return self._fetch_all(query, tuple(params))
+
+    def _fetch_all(self, query: str, params: Tuple = ()) -> Union[List[Dict[str, Any]], pd.DataFrame, Dict[str, np.ndarray], Iterator[Any]]:
+        if self.chunk_rows is not None:
+            return self._iter_chunks(query, params, self.chunk_rows)
+
+        if self.result_format == "records":
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
+                cursor.execute(query, params)
+                return [dict(row) for row in cursor.fetchall()]
+
+        with self._connection() as conn:
+            cursor = conn.execute(query, params)
+            names = [description[0] for description in cursor.description]
+            chunks = {name: [] for name in names}
+            while True:
+                rows = cursor.fetchmany(FETCH_CHUNK_ROWS)
+                if not rows:
+                    break
+                for i, name in enumerate(names):
+                    chunks[name].append(self._to_array([row[i] for row in rows]))
+
+        return self._build_columnar(names, {
+            name: np.concatenate(parts) if parts else np.empty(0, dtype=object)
+            for name, parts in chunks.items()
+        })
+
+    def _iter_chunks(self, query: str, params: Tuple, chunk_rows: int) -> Iterator[Any]:
+        with self._connection() as conn:
+            cursor = conn.execute(query, params)
+            names = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunk_rows)
+                if not rows:
+                    return
+                if self.result_format == "records":
+                    yield [dict(zip(names, row)) for row in rows]
+                else:
+                    yield self._build_columnar(names, {
+                        name: self._to_array([row[i] for row in rows]) for i, name in enumerate(names)
+                    })
+
+    def _build_columnar(self, names: List[str], arrays: Dict[str, np.ndarray]) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        columns = {name: self._finish_column(name, values) for name, values in arrays.items()}
+        if self.result_format == "numpy":
+            return columns
+        frame = pd.DataFrame(columns, columns=names)
+        if "symbol" in frame.columns:
+            frame["symbol"] = frame["symbol"].astype("category")
+        return frame
+
+    @staticmethod
+    def _to_array(values: List[Any]) -> np.ndarray:
+        """float64 when every value is numeric or NULL (NULL -> NaN), otherwise object."""
+        # np.array would happily parse numeric-looking TEXT ("0000320193") as float
+        first = next((value for value in values if value is not None), None)
+        if isinstance(first, (str, bytes)):
+            return np.array(values, dtype=object)
+        try:
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return np.array(values, dtype=object)
 
-    def _fetch_all(self, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
-        self.conn.row_factory = sqlite3.Row
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+    @staticmethod
+    def _finish_column(name: str, values: np.ndarray) -> np.ndarray:
+        if name not in DATE_COLUMNS:
+            return values
+        # Each distinct date string is parsed once, then broadcast through the codes
+        codes, uniques = pd.factorize(values)
+        if values.dtype != object or not len(uniques):
+            return np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ns]")
+        parsed = pd.to_datetime(uniques, format="ISO8601", errors="coerce").values
+        return np.where(codes >= 0, parsed[codes], np.datetime64("NaT"))
 
     def _build_conditions(
         self, tickers: List[str], start_date: Optional[str], end_date: Optional[str]
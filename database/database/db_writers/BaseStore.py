@@ -0,0 +1,70 @@
+import sqlite3
+import logging
+from typing import Dict, Any, List, Callable, Iterable, Optional
+
+class BaseStore:
+    """
+    Shared write path for all Store* classes.
+
+    Single-record `store_*` methods call `_execute`, which commits per row.
+    `_store_bulk` replays a `store_*` method over many records with execution
+    deferred, then flushes every buffered row with `executemany` inside one
+    transaction.
+    """
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self._pending: Optional[Dict[str, List[tuple]]] = None
+
+    def _execute(self, query: str, params: tuple):
+        """Execute and commit a single statement, or buffer it while a bulk write is open."""
+        if self._pending is not None:
+            self._pending.setdefault(query, []).append(params)
+            return
+        self.cursor.execute(query, params)
+        self.conn.commit()
+
+    def _store_bulk(self, store_fn: Callable[[Dict[str, Any]], None], records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store many records through `store_fn` using one transaction.
+
+        Args:
+            store_fn: Bound single-record `store_*` method of this writer
+            records: Records in the same format `store_fn` accepts
+
+        Returns:
+            Number of rows written
+        """
+        self._pending = {}
+        try:
+            for record in records:
+                store_fn(record)
+            pending = self._pending
+        finally:
+            self._pending = None
+
+        row_count = sum(len(rows) for rows in pending.values())
+        if not row_count:
+            return 0
+
+        try:
+            with self.conn:
+                for query, rows in pending.items():
+                    self.cursor.executemany(query, rows)
+            return row_count
+        except Exception as e:
+            logging.warning(f"Bulk {store_fn.__name__} failed, retrying row by row: {e}")
+            return self._store_rows_individually(store_fn.__name__, pending)
+
+    def _store_rows_individually(self, label: str, pending: Dict[str, List[tuple]]) -> int:
+        """Fallback for a failed batch: skip bad rows but keep the rest in a single commit."""
+        stored = 0
+        for query, rows in pending.items():
+            for row in rows:
+                try:
+                    self.cursor.execute(query, row)
+                    stored += 1
+                except Exception as e:
+                    logging.error(f"Error in {label} for row {row[:2]}: {e}")
+        self.conn.commit()
+        return stored
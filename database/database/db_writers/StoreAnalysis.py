@@ -1,15 +1,11 @@
-import sqlite3
 import logging
-from typing import Dict, Any
-
-class StoreAnalysis:
-    def __init__(self, conn: sqlite3.Connection):
-        self.conn = conn
-        self.cursor = conn.cursor()
+from typing import Dict, Any, List
+from .BaseStore import BaseStore
 
+class StoreAnalysis(BaseStore):
     def store_ratings(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO ratings (
                     symbol, date, rating, overall_score, discounted_cash_flow_score,
                     return_on_equity_score, return_on_assets_score, debt_to_equity_score,
@@ -27,13 +23,12 @@ class StoreAnalysis:
                 data.get("price_to_earnings_score"),
                 data.get("price_to_book_score")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing rating for {data.get('symbol')}: {e}")
 
     def store_analyst_estimates(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO analyst_estimates (
                     symbol, date, revenue_low, revenue_high, revenue_avg,
                     ebitda_low, ebitda_high, ebitda_avg, ebit_low, ebit_high, ebit_avg,
@@ -65,6 +60,13 @@ class StoreAnalysis:
                 data.get("num_analysts_revenue"),
                 data.get("num_analysts_eps")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing analyst estimate for {data.get('symbol')} on {data.get('date')}: {e}")
+
+    #region Bulk
+    def store_ratings_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_ratings, records)
+
+    def store_analyst_estimates_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_analyst_estimates, records)
+    #endregion
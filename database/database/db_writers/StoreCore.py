@@ -1,16 +1,12 @@
-import sqlite3
 import logging
-from typing import Dict, Any
-
-class StoreCore:
-    def __init__(self, conn: sqlite3.Connection):
-        self.conn = conn
-        self.cursor = conn.cursor()
+from typing import Dict, Any, List
+from .BaseStore import BaseStore
 
+class StoreCore(BaseStore):
     def store_stock(self, data: Dict[str, Any]):
         """Store a row in the stocks table."""
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO stocks (
                     symbol, company_name, exchange_short_name, industry, sector,
                     country, is_actively_trading, last_updated
@@ -24,7 +20,6 @@ class StoreCore:
                 data.get("country"),
                 data.get("is_actively_trading"),
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing stock: {e}")
 
@@ -35,7 +30,7 @@ class StoreCore:
             data: Dictionary containing 'symbol', 'period_of_report', and 'employee_count' keys
         """
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO employee_count (
                     symbol, period_of_report, employee_count
                 ) VALUES (?, ?, ?)
@@ -44,6 +39,13 @@ class StoreCore:
                 data.get('period_of_report'),
                 data.get('employee_count')
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing employee count: {e}")
+
+    #region Bulk
+    def store_stock_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_stock, records)
+
+    def store_employee_count_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_employee_count, records)
+    #endregion
@@ -1,15 +1,11 @@
-import sqlite3
 import logging
-from typing import Dict, Any
-
-class StoreFinancialMetrics:
-    def __init__(self, conn: sqlite3.Connection):
-        self.conn = conn
-        self.cursor = conn.cursor()
+from typing import Dict, Any, List
+from .BaseStore import BaseStore
 
+class StoreFinancialMetrics(BaseStore):
     def store_financial_ratios(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO financial_ratios (
                     symbol, date, fiscal_year, period, reported_currency,
                     gross_profit_margin, ebit_margin, ebitda_margin, operating_profit_margin,
@@ -61,13 +57,12 @@ class StoreFinancialMetrics:
                 data.get("ebt_per_ebit"), data.get("price_to_fair_value"), data.get("effective_tax_rate"),
                 data.get("enterprise_value_multiple")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing financial ratios for {data.get('symbol')} on {data.get('date')}: {e}")
 
     def store_key_metrics(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO key_metrics (
                     symbol, date, fiscal_year, period, reported_currency,
                     market_cap, enterprise_value, ev_to_sales, ev_to_operating_cash_flow,
@@ -100,13 +95,12 @@ class StoreFinancialMetrics:
                 data.get("fcf_to_equity"), data.get("fcf_to_firm"), data.get("tangible_asset_value"),
                 data.get("net_current_asset_value")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing key metrics for {data.get('symbol')} on {data.get('date')}: {e}")
         
     def store_earnings(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO earnings (
                     symbol, date, eps_actual, eps_estimated, revenue_actual, revenue_estimated
                 ) VALUES (?, ?, ?, ?, ?, ?)
@@ -118,6 +112,16 @@ class StoreFinancialMetrics:
                 data.get("revenue_actual"),
                 data.get("revenue_estimated")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing earnings for {data.get('symbol')} on {data.get('date')}: {e}")
+
+    #region Bulk
+    def store_financial_ratios_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_financial_ratios, records)
+
+    def store_key_metrics_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_key_metrics, records)
+
+    def store_earnings_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_earnings, records)
+    #endregion
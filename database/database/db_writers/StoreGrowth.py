@@ -1,15 +1,11 @@
-import sqlite3
 import logging
-from typing import Dict, Any
-
-class StoreGrowth:
-    def __init__(self, conn: sqlite3.Connection):
-        self.conn = conn
-        self.cursor = conn.cursor()
+from typing import Dict, Any, List
+from .BaseStore import BaseStore
 
+class StoreGrowth(BaseStore):
     def store_balance_sheet_growth(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO balance_sheet_growth (
                     symbol, date, fiscal_year, period, reported_currency,
                     cash_and_cash_equivalents, short_term_investments, cash_and_short_term_investments,
@@ -46,13 +42,12 @@ class StoreGrowth:
                 data.get("accrued_expenses"), data.get("capital_lease_obligations_current"), data.get("additional_paid_in_capital"),
                 data.get("treasury_stock")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing balance sheet growth for {data.get('symbol')} on {data.get('date')}: {e}")
 
     def store_cashflow_statement_growth(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO cashflow_statement_growth (
                     symbol, date, fiscal_year, period, reported_currency,
                     net_income, depreciation_and_amortization, deferred_income_tax,
@@ -89,13 +84,12 @@ class StoreGrowth:
                 data.get("short_term_net_debt_issuance"), data.get("net_stock_issuance"),
                 data.get("preferred_dividends_paid"), data.get("income_taxes_paid"), data.get("interest_paid")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing cashflow statement growth for {data.get('symbol')} on {data.get('date')}: {e}")
 
     def store_financial_statement_growth(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO financial_statement_growth (
                     symbol, date, fiscal_year, period, reported_currency,
                     revenue_growth, gross_profit_growth, ebit_growth, operating_income_growth,
@@ -131,13 +125,12 @@ class StoreGrowth:
                 data.get("ten_y_bottom_line_net_income_growth_per_share"), data.get("five_y_bottom_line_net_income_growth_per_share"),
                 data.get("three_y_bottom_line_net_income_growth_per_share")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing financial statement growth for {data.get('symbol')} on {data.get('date')}: {e}")
 
     def store_income_statement_growth(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO income_statement_growth (
                     symbol, date, fiscal_year, period, reported_currency,
                     revenue, cost_of_revenue, gross_profit, gross_profit_ratio,
@@ -168,6 +161,19 @@ class StoreGrowth:
                 data.get("net_income_from_continuing_operations"), data.get("other_adjustments_to_net_income"),
                 data.get("net_income_deductions")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing income statement growth for {data.get('symbol')} on {data.get('date')}: {e}")
+
+    #region Bulk
+    def store_balance_sheet_growth_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_balance_sheet_growth, records)
+
+    def store_cashflow_statement_growth_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_cashflow_statement_growth, records)
+
+    def store_financial_statement_growth_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_financial_statement_growth, records)
+
+    def store_income_statement_growth_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_income_statement_growth, records)
+    #endregion
@@ -1,15 +1,11 @@
-import sqlite3
 import logging
-from typing import Dict, Any
-
-class StoreMacro:
-    def __init__(self, conn: sqlite3.Connection):
-        self.conn = conn
-        self.cursor = conn.cursor()
+from typing import Dict, Any, List
+from .BaseStore import BaseStore
 
+class StoreMacro(BaseStore):
     def store_economic_indicators(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO economic_indicators (
                     name, date, value
                 ) VALUES (?, ?, ?)
@@ -18,13 +14,12 @@ class StoreMacro:
                 data.get("date"),
                 data.get("value")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing economic indicator for {data.get('name')} on {data.get('date')}: {e}")
 
     def store_industry_pe(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO industry_pe (
                     date, industry, exchange, pe
                 ) VALUES (?, ?, ?, ?)
@@ -34,13 +29,12 @@ class StoreMacro:
                 data.get("exchange"),
                 data.get("pe")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing industry PE for {data.get('industry')} on {data.get('date')}: {e}")
 
     def store_sector_pe(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO sector_pe (
                     date, sector, exchange, pe
                 ) VALUES (?, ?, ?, ?)
@@ -50,13 +44,12 @@ class StoreMacro:
                 data.get("exchange"),
                 data.get("pe")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing sector PE for {data.get('sector')} on {data.get('date')}: {e}")
 
     def store_industry_performance(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO industry_performance (
                     date, industry, exchange, average_change
                 ) VALUES (?, ?, ?, ?)
@@ -66,13 +59,12 @@ class StoreMacro:
                 data.get("exchange"),
                 data.get("average_change")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing industry performance for {data.get('industry')} on {data.get('date')}: {e}")
 
     def store_sector_performance(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO sector_performance (
                     date, sector, exchange, average_change
                 ) VALUES (?, ?, ?, ?)
@@ -82,13 +74,12 @@ class StoreMacro:
                 data.get("exchange"),
                 data.get("average_change")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing sector performance for {data.get('sector')} on {data.get('date')}: {e}")
 
     def store_treasury_rates(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO treasury_rates (
                     date, month_1, month_2, month_3, month_6, year_1, year_2, year_3, year_5, year_7, year_10, year_20, year_30
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -107,13 +98,12 @@ class StoreMacro:
                 data.get("year_20"),
                 data.get("year_30")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing treasury rates for {data.get('date')}: {e}")
         
     def store_mergers_and_acquisitions(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO mergers_acquisitions (
                     symbol, targeted_symbol, transaction_date
                 ) VALUES (?, ?, ?)
@@ -122,6 +112,28 @@ class StoreMacro:
                 data.get("targeted_symbol"),
                 data.get("transaction_date")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing merger/acquisition for {data.get('symbol')}: {e}")
+
+    #region Bulk
+    def store_economic_indicators_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_economic_indicators, records)
+
+    def store_industry_pe_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_industry_pe, records)
+
+    def store_sector_pe_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_sector_pe, records)
+
+    def store_industry_performance_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_industry_performance, records)
+
+    def store_sector_performance_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_sector_performance, records)
+
+    def store_treasury_rates_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_treasury_rates, records)
+
+    def store_mergers_and_acquisitions_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_mergers_and_acquisitions, records)
+    #endregion
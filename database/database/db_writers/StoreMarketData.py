@@ -1,12 +1,8 @@
-import sqlite3
 from typing import Dict, Any, List
 import logging
+from .BaseStore import BaseStore
 
-class StoreMarketData:
-    def __init__(self, conn: sqlite3.Connection):
-        self.conn = conn
-        self.cursor = conn.cursor()
-
+class StoreMarketData(BaseStore):
     def store_price(self, data: Dict[str, Any]):
         """
         Store price data from the processed data dictionary.
@@ -18,7 +14,7 @@ class StoreMarketData:
             symbol = data.get('symbol')
             date = data.get('date')
             
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO price (
                     symbol, date, open, high, low, close, volume,
                     change, change_percent, vwap
@@ -35,7 +31,6 @@ class StoreMarketData:
                 data.get("change_percent"),
                 data.get("vwap")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing price for {symbol} on {date}: {e}")
 
@@ -50,7 +45,7 @@ class StoreMarketData:
             symbol = data.get('symbol')
             date = data.get('date')
             
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO dividends (
                     symbol, date, declaration_date, adj_dividend, dividend, yield, frequency
                 ) VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -63,7 +58,6 @@ class StoreMarketData:
                 data.get("yield"),
                 data.get("frequency")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing dividend for {symbol} on {date}: {e}")
 
@@ -72,7 +66,7 @@ class StoreMarketData:
             symbol = data.get('symbol')
             date = data.get('date')
 
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO splits (
                     symbol, date, numerator, denominator
                 ) VALUES (?, ?, ?, ?)
@@ -82,7 +76,6 @@ class StoreMarketData:
                 data.get("numerator"),
                 data.get("denominator")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing split for {symbol} on {date}: {e}")
 
@@ -97,7 +90,7 @@ class StoreMarketData:
             symbol = data.get('symbol')
             date = data.get('date')
             
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO dividend_adjusted_price_data (
                     symbol, date, adj_open, adj_high, adj_low, adj_close,
                     volume
@@ -111,7 +104,6 @@ class StoreMarketData:
                 data.get("adj_close"),
                 data.get("volume")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing dividend adjusted price for {symbol} on {date}: {e}")
 
@@ -120,7 +112,7 @@ class StoreMarketData:
             symbol = data.get('symbol')
             date = data.get('date')
 
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO market_cap (
                     symbol, date, market_cap
                 ) VALUES (?, ?, ?)
@@ -129,7 +121,6 @@ class StoreMarketData:
                 date,
                 data.get("market_cap")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing market cap for {symbol} on {date}: {e}")
 
@@ -152,7 +143,7 @@ class StoreMarketData:
                 logging.error(f"Missing required fields for share float: symbol={symbol}, date={date}")
                 return
 
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO share_float (
                     symbol, date, free_float, float_shares, outstanding_shares
                 ) VALUES (?, ?, ?, ?, ?)
@@ -163,7 +154,26 @@ class StoreMarketData:
                 data.get("float_shares"),
                 data.get("outstanding_shares")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing share float for {symbol} on {date}: {e}")
             logging.debug(f"Data received: {data}")
+
+    #region Bulk
+    def store_price_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_price, records)
+
+    def store_dividend_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_dividend, records)
+
+    def store_split_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_split, records)
+
+    def store_dividend_adjusted_price_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_dividend_adjusted_price, records)
+
+    def store_market_cap_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_market_cap, records)
+
+    def store_share_float_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_share_float, records)
+    #endregion
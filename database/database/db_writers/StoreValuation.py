@@ -1,15 +1,11 @@
-import sqlite3
 import logging
-from typing import Dict, Any
-
-class StoreValuation:
-    def __init__(self, conn: sqlite3.Connection):
-        self.conn = conn
-        self.cursor = conn.cursor()
+from typing import Dict, Any, List
+from .BaseStore import BaseStore
 
+class StoreValuation(BaseStore):
     def store_enterprise_values(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO enterprise_values (
                     symbol, date, number_of_shares,
                     minus_cash_and_cash_equivalents, add_total_debt, enterprise_value
@@ -22,13 +18,12 @@ class StoreValuation:
                 data.get("add_total_debt"),
                 data.get("enterprise_value")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing enterprise values for {data.get('symbol')} on {data.get('date')}: {e}")
 
     def store_owner_earnings(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO owner_earnings (
                     symbol, date, period, fiscal_year, avg_ppe,
                     growth_capex, maintenance_capex, owners_earnings,
@@ -45,13 +40,12 @@ class StoreValuation:
                 data.get("owners_earnings"),
                 data.get("owners_earnings_per_share")
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing owner earnings for {data.get('symbol')} on {data.get('date')}: {e}")
 
     def store_levered_discounted_cash_flow(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO levered_discounted_cash_flow (
                     symbol, date, dcf
                 ) VALUES (?, ?, ?)
@@ -60,13 +54,12 @@ class StoreValuation:
                 data.get("date"),
                 data.get("dcf"),
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing levered discounted cash flow for {data.get('symbol')} on {data.get('date')}: {e}")
 
     def store_discounted_cash_flow(self, data: Dict[str, Any]):
         try:
-            self.cursor.execute("""
+            self._execute("""
                 INSERT OR REPLACE INTO discounted_cash_flow (
                     symbol, date, dcf
                 ) VALUES (?, ?, ?)
@@ -75,6 +68,19 @@ class StoreValuation:
                 data.get("date"),
                 data.get("dcf"),
             ))
-            self.conn.commit()
         except Exception as e:
             logging.error(f"Error storing discounted cash flow for {data.get('symbol')} on {data.get('date')}: {e}")
+
+    #region Bulk
+    def store_enterprise_values_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_enterprise_values, records)
+
+    def store_owner_earnings_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_owner_earnings, records)
+
+    def store_levered_discounted_cash_flow_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_levered_discounted_cash_flow, records)
+
+    def store_discounted_cash_flow_bulk(self, records: List[Dict[str, Any]]) -> int:
+        return self._store_bulk(self.store_discounted_cash_flow, records)
+    #endregion
@@ -1,3 +1,4 @@
+from .BaseStore import BaseStore
 from .StoreCore import StoreCore
 from .StoreMarketData import StoreMarketData
 from .StoreValuation import StoreValuation
@@ -8,6 +9,7 @@ from .StoreAnalysisData import StoreAnalysisData
 from .StoreMacro import StoreMacro
 
 __all__ = [
+    'BaseStore',
     'StoreCore',
     'StoreMarketData',
     'StoreValuation',
@@ -1,5 +1,6 @@
 from typing import Callable, List, Dict, Any, Optional, Union, Tuple
 from datetime import datetime
+import math
 from .utils import Utils
 import logging
 
@@ -69,3 +70,13 @@ class BaseProcessor:
             return None
         return data
 
+    def _limit_since(self, config_key: str, start_date: Optional[str], periods_per_year: Optional[int] = None) -> int:
+        """Configured `limit`, reduced to the reporting periods needed to reach back to `start_date`."""
+        config_section = getattr(self.config, config_key)
+        limit = config_section['limit']
+        if not start_date:
+            return limit
+        if periods_per_year is None:
+            periods_per_year = 1 if config_section.get('period', 'annual') == 'annual' else 4
+        years = (datetime.now() - datetime.strptime(start_date, '%Y-%m-%d')).days / 365.25
+        return max(1, min(limit, math.ceil(years * periods_per_year) + 1))
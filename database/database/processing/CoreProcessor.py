@@ -19,6 +19,15 @@ class CoreProcessor(BaseProcessor):
             label='stocks'
         )
 
+    def process_stock_universe(self, tickers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Translate screener rows for `tickers` (or every screened symbol) from one snapshot."""
+        universe = self.data_fetcher.get_stock_universe() or {}
+        if tickers is not None:
+            entries = [universe[ticker.upper()] for ticker in tickers if ticker.upper() in universe]
+        else:
+            entries = list(universe.values())
+        return [record for entry in entries for record in CoreTranslator.translate_stocks(entry)]
+
     def process_employee_count(self, ticker: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
         return self.process_generic(
             ticker,
@@ -14,7 +14,7 @@ class FinancialMetricsProcessor(BaseProcessor):
             config_key='key_metrics',
             fetch_fn=lambda: self.data_fetcher.get_key_metrics(
                 ticker,
-                limit=self.config.key_metrics['limit'],
+                limit=self._limit_since('key_metrics', start_date),
                 period=self.config.key_metrics['period']
             ),
             translate_fn=FinancialMetricsTranslator.translate_key_metrics,
@@ -29,7 +29,7 @@ class FinancialMetricsProcessor(BaseProcessor):
             config_key='financial_ratios',
             fetch_fn=lambda: self.data_fetcher.get_financial_ratios(
                 ticker,
-                limit=self.config.financial_ratios['limit'],
+                limit=self._limit_since('financial_ratios', start_date),
                 period=self.config.financial_ratios['period']
             ),
             translate_fn=FinancialMetricsTranslator.translate_financial_ratios,
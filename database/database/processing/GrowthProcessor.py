@@ -14,7 +14,7 @@ class GrowthProcessor(BaseProcessor):
             config_key='financial_statement_growth',
             fetch_fn=lambda: self.data_fetcher.get_financial_statement_growth(
                 ticker,
-                limit=self.config.financial_statement_growth['limit'],
+                limit=self._limit_since('financial_statement_growth', start_date),
                 period=self.config.financial_statement_growth['period']
             ),
             translate_fn=GrowthTranslator.translate_financial_statement_growth,
@@ -29,7 +29,7 @@ class GrowthProcessor(BaseProcessor):
             config_key='income_statement_growth',
             fetch_fn=lambda: self.data_fetcher.get_income_statement_growth(
                 ticker,
-                limit=self.config.income_statement_growth['limit'],
+                limit=self._limit_since('income_statement_growth', start_date),
                 period=self.config.income_statement_growth['period']
             ),
             translate_fn=GrowthTranslator.translate_income_statement_growth,
@@ -44,7 +44,7 @@ class GrowthProcessor(BaseProcessor):
             config_key='balance_sheet_growth',
             fetch_fn=lambda: self.data_fetcher.get_balance_sheet_growth(
                 ticker,
-                limit=self.config.balance_sheet_growth['limit'],
+                limit=self._limit_since('balance_sheet_growth', start_date),
                 period=self.config.balance_sheet_growth['period']
             ),
             translate_fn=GrowthTranslator.translate_balance_sheet_growth,
@@ -59,7 +59,7 @@ class GrowthProcessor(BaseProcessor):
             config_key='cashflow_statement_growth',
             fetch_fn=lambda: self.data_fetcher.get_cashflow_statement_growth(
                 ticker,
-                limit=self.config.cashflow_statement_growth['limit'],
+                limit=self._limit_since('cashflow_statement_growth', start_date),
                 period=self.config.cashflow_statement_growth['period']
             ),
             translate_fn=GrowthTranslator.translate_cashflow_statement_growth,
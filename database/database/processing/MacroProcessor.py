@@ -6,14 +6,14 @@ class MacroProcessor(BaseProcessor):
         super().__init__(data_fetcher.config)
         self.data_fetcher = data_fetcher
 
-    def process_economic_indicators(self, start_date=None, end_date=None):
+    def process_economic_indicators(self, name=None, start_date=None, end_date=None):
         return self.process_generic(
             None,
             start_date,
             end_date,
             config_key='economic_indicators',
             fetch_fn=lambda: self.data_fetcher.get_economic_indicators(
-                name=None,
+                name=name,
                 from_date=start_date,
                 to_date=end_date
             ),
@@ -36,7 +36,7 @@ class ValuationProcessor(BaseProcessor):
             config_key='enterprise_values',
             fetch_fn=lambda: self.data_fetcher.get_enterprise_values(
                 ticker,
-                limit=self.config.enterprise_values['limit'],
+                limit=self._limit_since('enterprise_values', start_date),
                 period=self.config.enterprise_values['period']
             ),
             translate_fn=ValuationTranslator.translate_enterprise_values,
@@ -51,7 +51,7 @@ class ValuationProcessor(BaseProcessor):
             config_key='owner_earnings',
             fetch_fn=lambda: self.data_fetcher.get_owner_earnings(
                 ticker,
-                limit=self.config.owner_earnings['limit']
+                limit=self._limit_since('owner_earnings', start_date, periods_per_year=4)
             ),
             translate_fn=ValuationTranslator.translate_owner_earnings,
             label="owner earnings"
@@ -24,4 +24,7 @@ CREATE TABLE IF NOT EXISTS analyst_estimates (
     num_analysts_eps INTEGER,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_analyst_estimates_date ON analyst_estimates (date);
\ No newline at end of file
@@ -12,4 +12,7 @@ CREATE TABLE IF NOT EXISTS ratings (
     price_to_book_score INTEGER,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_ratings_date ON ratings (date);
\ No newline at end of file
@@ -8,4 +8,7 @@ CREATE TABLE IF NOT EXISTS grades (
     strong_sell INTEGER,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_grades_date ON grades (date);
\ No newline at end of file
@@ -8,4 +8,7 @@ CREATE TABLE IF NOT EXISTS earnings (
     revenue_estimated REAL,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_earnings_date ON earnings (date);
\ No newline at end of file
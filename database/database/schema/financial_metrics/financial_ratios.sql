@@ -84,4 +84,7 @@ CREATE TABLE IF NOT EXISTS financial_ratios (
 
     PRIMARY KEY (symbol, date, reported_currency),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_financial_ratios_date ON financial_ratios (date);
\ No newline at end of file
@@ -49,4 +49,7 @@ CREATE TABLE IF NOT EXISTS key_metrics (
     net_current_asset_value REAL,
     PRIMARY KEY (symbol, date, reported_currency),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_key_metrics_date ON key_metrics (date);
\ No newline at end of file
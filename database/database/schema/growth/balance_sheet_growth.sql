@@ -63,4 +63,7 @@ CREATE TABLE IF NOT EXISTS balance_sheet_growth (
 
     PRIMARY KEY (symbol, date, reported_currency),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_balance_sheet_growth_date ON balance_sheet_growth (date);
\ No newline at end of file
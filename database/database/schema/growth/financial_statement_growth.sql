@@ -50,4 +50,7 @@ CREATE TABLE IF NOT EXISTS financial_statement_growth (
 
     PRIMARY KEY (symbol, date, reported_currency),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_financial_statement_growth_date ON financial_statement_growth (date);
\ No newline at end of file
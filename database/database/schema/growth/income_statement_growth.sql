@@ -39,3 +39,6 @@ CREATE TABLE IF NOT EXISTS income_statement_growth (
     PRIMARY KEY (symbol, date, reported_currency),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
 );
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_income_statement_growth_date ON income_statement_growth (date);
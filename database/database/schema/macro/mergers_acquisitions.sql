@@ -5,4 +5,7 @@ CREATE TABLE IF NOT EXISTS mergers_acquisitions (
     transaction_date TEXT,
     PRIMARY KEY (symbol, targeted_symbol, transaction_date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Date-range reads without a symbol filter
+CREATE INDEX IF NOT EXISTS idx_mergers_acquisitions_transaction_date ON mergers_acquisitions (transaction_date);
\ No newline at end of file
@@ -9,4 +9,7 @@ CREATE TABLE IF NOT EXISTS dividend_adjusted_price_data (
     volume INTEGER,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+) WITHOUT ROWID;
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_dividend_adjusted_price_data_date ON dividend_adjusted_price_data (date);
\ No newline at end of file
@@ -9,4 +9,7 @@ CREATE TABLE IF NOT EXISTS dividends (
     frequency TEXT,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_dividends_date ON dividends (date);
\ No newline at end of file
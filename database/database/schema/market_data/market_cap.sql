@@ -5,4 +5,7 @@ CREATE TABLE IF NOT EXISTS market_cap (
     market_cap REAL,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+) WITHOUT ROWID;
+
+-- Cross-sectional reads (all symbols on a date); covering via the market_cap column
+CREATE INDEX IF NOT EXISTS idx_market_cap_date ON market_cap (date, symbol, market_cap);
\ No newline at end of file
@@ -12,4 +12,7 @@ CREATE TABLE IF NOT EXISTS price (
     vwap REAL,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+) WITHOUT ROWID;
+
+-- Cross-sectional close reads (all symbols on a date); per-symbol reads use the clustered primary key
+CREATE INDEX IF NOT EXISTS idx_price_date_close ON price (date, symbol, close);
\ No newline at end of file
@@ -7,4 +7,7 @@ CREATE TABLE IF NOT EXISTS share_float (
     outstanding_shares INTEGER,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_share_float_date ON share_float (date);
\ No newline at end of file
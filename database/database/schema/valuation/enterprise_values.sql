@@ -8,4 +8,7 @@ CREATE TABLE IF NOT EXISTS enterprise_values (
     enterprise_value REAL,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_enterprise_values_date ON enterprise_values (date);
\ No newline at end of file
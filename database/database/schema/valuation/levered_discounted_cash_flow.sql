@@ -5,4 +5,7 @@ CREATE TABLE IF NOT EXISTS levered_discounted_cash_flow (
     dcf REAL,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_levered_discounted_cash_flow_date ON levered_discounted_cash_flow (date);
\ No newline at end of file
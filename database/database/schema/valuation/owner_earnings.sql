@@ -11,4 +11,7 @@ CREATE TABLE IF NOT EXISTS owner_earnings (
     owners_earnings_per_share REAL,
     PRIMARY KEY (symbol, date),
     FOREIGN KEY (symbol) REFERENCES stocks(symbol)
-);
\ No newline at end of file
+);
+
+-- Cross-sectional reads (all symbols on a date)
+CREATE INDEX IF NOT EXISTS idx_owner_earnings_date ON owner_earnings (date);
\ No newline at end of file
@@ -1,22 +1,51 @@
+import copy
 from ..StockDatabase import StockDatabase
 from ..db_getters import *
+from ..db_getters.BaseGetter import FETCH_CHUNK_ROWS
 from ..data_fetchers.WikiFetcher import WikiFetcher
 
+GETTER_ATTRIBUTES = [
+    'analysis', 'core', 'analyst_data', 'financial_metrics',
+    'growth', 'macro', 'market_data', 'valuation'
+]
+
 class DatabaseGetter:
-    def __init__(self, db: StockDatabase):
+    def __init__(self, db: StockDatabase, result_format: str = "records"):
+        """
+        Args:
+            db: Database to read from
+            result_format: "records" (list of dicts), "frame" (DataFrame) or "numpy"
+                (dict of arrays); see BaseGetter
+        """
         self.db = db
-        conn = self.db._get_connection()
+        self.result_format = result_format
+        # Getters borrow a pooled connection per query, so they are safe to share across threads
+        conn = self.db.pool
 
         # All getter categories
-        self.analysis = GetAnalysis(conn)
-        self.core = GetCore(conn)
-        self.analyst_data = GetAnalystData(conn)
-        self.financial_metrics = GetFinancialMetrics(conn)
-        self.growth = GetGrowth(conn)
-        self.macro = GetMacroData(conn)
-        self.market_data = GetMarketData(conn)
-        self.valuation = GetValuation(conn)
+        self.analysis = GetAnalysis(conn, result_format)
+        self.core = GetCore(conn, result_format)
+        self.analyst_data = GetAnalystData(conn, result_format)
+        self.financial_metrics = GetFinancialMetrics(conn, result_format)
+        self.growth = GetGrowth(conn, result_format)
+        self.macro = GetMacroData(conn, result_format)
+        self.market_data = GetMarketData(conn, result_format)
+        self.valuation = GetValuation(conn, result_format)
 
         wiki_fetcher = WikiFetcher()
         self.ticker = wiki_fetcher.get_sp500_tickers()
 
+    def with_format(self, result_format: str) -> "DatabaseGetter":
+        """Copy of this getter (same pool and tickers) whose getters return `result_format`."""
+        getter = copy.copy(self)
+        getter.result_format = result_format
+        for name in GETTER_ATTRIBUTES:
+            setattr(getter, name, getattr(self, name).with_format(result_format))
+        return getter
+
+    def chunked(self, chunk_rows: int = FETCH_CHUNK_ROWS) -> "DatabaseGetter":
+        """Copy of this getter whose getters stream results in chunks of `chunk_rows` rows."""
+        getter = copy.copy(self)
+        for name in GETTER_ATTRIBUTES:
+            setattr(getter, name, getattr(self, name).chunked(chunk_rows))
+        return getter
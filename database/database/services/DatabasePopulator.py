@@ -7,6 +7,9 @@ from ..db_writers import *
 from ..processing import *
 from ..data_fetchers.FMPFetcher import FMPFetcher
 from ..data_fetchers.WikiFetcher import WikiFetcher
+from database.endpoints.FMPConstants import SECTORS, INDUSTRIES, ECONOMIC_INDICATORS
+from .DatabaseWriter import DatabaseWriter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 import os
 
@@ -19,6 +22,22 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Tables refreshed from their latest stored date in incremental mode. Prices and market
+# cap are requested from that date; statement tables request only the periods since it.
+INCREMENTAL_TABLES = [
+    'price',
+    'dividend_adjusted_price_data',
+    'market_cap',
+    'key_metrics',
+    'financial_ratios',
+    'financial_statement_growth',
+    'income_statement_growth',
+    'balance_sheet_growth',
+    'cashflow_statement_growth',
+    'enterprise_values',
+    'owner_earnings'
+]
+
 class DatabasePopulator:
     """
     Service class responsible for orchestrating the database population process.
@@ -27,7 +46,11 @@ class DatabasePopulator:
     def __init__(self, db: StockDatabase):
         self.db = db
         self.fmp_fetcher = FMPFetcher()
-        conn = self.db._get_connection()
+        # Concurrent ingestion hands this connection to a single writer thread
+        conn = self.db._get_connection(check_same_thread=False)
+        self._writer: Optional[DatabaseWriter] = None
+        # {table: {symbol: first missing date}}, loaded for incremental runs only
+        self._refresh_points: Dict[str, Dict[str, str]] = {}
 
         # Processors
         self.analysis_processor = AnalysisProcessor(self.fmp_fetcher)
@@ -79,13 +102,18 @@ class DatabasePopulator:
         finally:
             logging.getLogger().setLevel(logging.INFO)
 
-    def populate_sp500(self):
+    def populate_sp500(self, max_workers: Optional[int] = None, incremental: Optional[bool] = None):
         """Populate the database with S&P 500 data."""
         wiki_fetcher = WikiFetcher()
         tickers = wiki_fetcher.get_sp500_tickers()
-        self.populate_batch(tickers)
+        self.populate_batch(tickers, max_workers, incremental)
 
-    def populate(self, tickers: Optional[List[str]] = None):
+    def populate(
+        self,
+        tickers: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        incremental: Optional[bool] = None
+    ):
         """
         Populate the database with data for the specified tickers.
         If no tickers are provided, uses S&P 500 tickers.
@@ -96,11 +124,24 @@ class DatabasePopulator:
         else:
             logging.info(f"Populating data for provided tickers: {tickers}")
 
-        self.populate_batch(tickers)
+        self.populate_batch(tickers, max_workers, incremental)
 
-    def populate_batch(self, tickers: List[str]):
+    def populate_batch(
+        self,
+        tickers: List[str],
+        max_workers: Optional[int] = None,
+        incremental: Optional[bool] = None
+    ):
         """
-        Process a batch of tickers sequentially with progress bar.
+        Process a batch of tickers with progress bar.
+
+        With `max_workers` (default `DataFetchConfig.max_workers`) above 1, FMP fetches for
+        different tickers/tables run on a thread pool while a single writer thread stores
+        the results. All workers share one FMP endpoint, so its rate limit stays global.
+
+        With `incremental` (default `DataFetchConfig.incremental`), tables in
+        INCREMENTAL_TABLES only fetch rows newer than the latest date already stored for
+        each ticker; tickers without stored rows still get their full history.
         """
         operations = [
             (self.populate_core, "Core Data"),
@@ -111,26 +152,22 @@ class DatabasePopulator:
             (self.populate_market_data, "Market Data"),
             (self.populate_valuation, "Valuation Data")
         ]
+        if max_workers is None:
+            max_workers = self.fmp_fetcher.config.max_workers
+        if incremental is None:
+            incremental = self.fmp_fetcher.config.incremental
+        self._refresh_points = self._load_refresh_points(tickers) if incremental else {}
 
         # Store original logging level
         original_level = logging.getLogger().getEffectiveLevel()
         logging.getLogger().setLevel(logging.ERROR)
         
-        ticker_errors = {}
+        ticker_errors = {ticker: [] for ticker in tickers}
         try:
-            description = "Overall Progress"
-            with tqdm(total=len(tickers), desc=description, position=0, leave=False, colour="green") as ticker_pbar:
-                for ticker in tickers:
-                    ticker_errors[ticker] = []
-                    for operation, label in operations:
-                        try:
-                            ticker_pbar.set_description(f"{description} - {ticker} - {label}")
-                            operation(ticker, None)
-                            logging.info(f"Successfully processed {label} for {ticker}")
-                        except Exception as e:
-                            error_msg = f"Failed to process {label}: {str(e)}"
-                            ticker_errors[ticker].append(error_msg)
-                    ticker_pbar.update(1)
+            if max_workers > 1:
+                self._run_concurrent(tickers, operations, ticker_errors, max_workers)
+            else:
+                self._run_sequential(tickers, operations, ticker_errors)
 
             # Errors
             for ticker, errors in ticker_errors.items():
@@ -142,6 +179,81 @@ class DatabasePopulator:
         finally:
             # Restore original logging level
             logging.getLogger().setLevel(original_level)
+            self._refresh_points = {}
+
+        if self.fmp_fetcher.cache is not None:
+            logging.info(f"FMP response cache: {self.fmp_fetcher.cache.stats()}")
+
+    def _load_refresh_points(self, tickers: List[str]) -> Dict[str, Dict[str, str]]:
+        """Day after the newest stored date for every (table, ticker) that already has rows."""
+        wanted = set(tickers)
+        refresh_points = {}
+        with self.db.pool.connection() as conn:
+            for table in INCREMENTAL_TABLES:
+                rows = conn.execute(f"SELECT symbol, MAX(date) FROM {table} GROUP BY symbol").fetchall()
+                refresh_points[table] = {
+                    symbol: (datetime.strptime(last[:10], '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+                    for symbol, last in rows
+                    if symbol in wanted and last
+                }
+        logging.info(
+            f"Incremental refresh: {sum(len(points) for points in refresh_points.values())} "
+            f"(ticker, table) pairs already stored"
+        )
+        return refresh_points
+
+    def _run_sequential(self, tickers: List[str], operations: List[tuple], ticker_errors: Dict[str, List[str]]):
+        description = "Overall Progress"
+        with tqdm(total=len(tickers), desc=description, position=0, leave=False, colour="green") as ticker_pbar:
+            for ticker in tickers:
+                for operation, label in operations:
+                    try:
+                        ticker_pbar.set_description(f"{description} - {ticker} - {label}")
+                        operation(ticker, None)
+                        logging.info(f"Successfully processed {label} for {ticker}")
+                    except Exception as e:
+                        error_msg = f"Failed to process {label}: {str(e)}"
+                        ticker_errors[ticker].append(error_msg)
+                ticker_pbar.update(1)
+
+    def _run_concurrent(
+        self,
+        tickers: List[str],
+        operations: List[tuple],
+        ticker_errors: Dict[str, List[str]],
+        max_workers: int
+    ):
+        """Fan (ticker, operation) fetches out to a thread pool; writes go through one writer thread."""
+        remaining = {ticker: len(operations) for ticker in tickers}
+        self._writer = DatabaseWriter(max_pending=max_workers * 4)
+        self._writer.start()
+        try:
+            description = f"Overall Progress ({max_workers} workers)"
+            with tqdm(total=len(tickers), desc=description, position=0, leave=False, colour="green") as ticker_pbar, \
+                    ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="populate") as pool:
+                futures = {
+                    pool.submit(operation, ticker, None): (ticker, label)
+                    for ticker in tickers
+                    for operation, label in operations
+                }
+                for future in as_completed(futures):
+                    ticker, label = futures[future]
+                    try:
+                        future.result()
+                        logging.info(f"Successfully processed {label} for {ticker}")
+                    except Exception as e:
+                        ticker_errors[ticker].append(f"Failed to process {label}: {str(e)}")
+                    remaining[ticker] -= 1
+                    if remaining[ticker] == 0:
+                        ticker_pbar.set_description(f"{description} - {ticker}")
+                        ticker_pbar.update(1)
+        finally:
+            self._writer.close()
+            # Writes fail on the writer thread, after their fetch already reported success
+            for ticker, error in self._writer.failures:
+                if ticker in ticker_errors:
+                    ticker_errors[ticker].append(error)
+            self._writer = None
 
     #region Populate Functions
     #region Populate Groups
@@ -200,30 +312,33 @@ class DatabasePopulator:
         ticker: str,
         date: Optional[str],
         processor_fn: Callable[[str, Optional[str], Optional[str]], Optional[List[Dict[str, Any]]]],
-        store_fn: Callable[[Dict[str, Any]], None],
-        label: str
+        store_fn: Callable[[List[Dict[str, Any]]], int],
+        label: str,
+        table: Optional[str] = None
     ):
-        """Generic processor + store pipeline"""
+        """
+        Generic processor + bulk store pipeline (one transaction per ticker/table).
+
+        During an incremental run, `table` selects the refresh point loaded for the
+        ticker, so only rows after the newest stored date are requested and written.
+        """
         try:
+            if date is None and table in self._refresh_points:
+                date = self._refresh_points[table].get(ticker)
+                if date is not None and date > datetime.now().strftime('%Y-%m-%d'):
+                    logging.info(f"{label} for {ticker} is up to date")
+                    return
             records = processor_fn(ticker, date)
             if records:
                 logging.info(f"Processing {len(records)} {label} records for {ticker}")
+                rows = []
                 for record in records:
                     if not isinstance(record, dict):
                         logging.warning(f"Skipping non-dictionary record for {ticker}: {record}")
                         continue
-                        
-                    data = {
-                        'symbol': ticker,
-                        **record
-                    }
-                    # Only add date if it exists in the record
-                    if 'date' in record:
-                        data['date'] = record['date']
-                        
-                    logging.debug(f"Storing {label} data: {data}")
-                    store_fn(data)
-                logging.info(f"Successfully stored {len(records)} {label} records for {ticker}")
+                    rows.append({'symbol': ticker, **record})
+
+                self._store(store_fn, rows, f"{label} for {ticker}", key=ticker)
             else:
                 logging.warning(f"No {label} data available for {ticker}")
         except Exception as e:
@@ -234,32 +349,82 @@ class DatabasePopulator:
         self,
         date: Optional[str],
         processor_fn: Callable[[Optional[str]], Optional[List[Dict[str, Any]]]],
-        store_fn: Callable[[Dict[str, Any]], None],
+        store_fn: Callable[[List[Dict[str, Any]]], int],
         label: str
     ):
-        """Generic processor + store pipeline for macro (non-ticker) data."""
+        """Generic processor + bulk store pipeline for macro (non-ticker) data."""
         try:
             records = processor_fn(date)
             if records:
                 logging.info(f"Processing {len(records)} {label} macro records")
+                rows = []
                 for record in records:
                     if not isinstance(record, dict):
                         logging.warning(f"Skipping non-dictionary macro record: {record}")
                         continue
+                    rows.append({**record})
 
-                    # Only add date if it exists in the record
-                    data = {**record}
-                    if 'date' in record:
-                        data['date'] = record['date']
-
-                    logging.debug(f"Storing {label} macro data: {data}")
-                    store_fn(data)
-                logging.info(f"Successfully stored {len(records)} {label} macro records")
+                self._store(store_fn, rows, f"{label} macro")
             else:
                 logging.warning(f"No {label} macro data available")
         except Exception as e:
             logging.error(f"Failed to process macro {label}: {e}")
             logging.exception("Full traceback:")
+
+    def _populate_macro_variants(
+        self,
+        date: Optional[str],
+        variants: List[str],
+        processor_fn: Callable[[str, Optional[str]], Optional[List[Dict[str, Any]]]],
+        store_fn: Callable[[List[Dict[str, Any]]], int],
+        label: str
+    ):
+        """
+        Macro pipeline for tables keyed by a variant (sector, industry, indicator name).
+        Variants are fetched concurrently under the shared rate limiter and each one is
+        stored as soon as it completes; failed variants are reported without aborting the rest.
+        """
+        failures = {}
+        workers = max(1, min(self.fmp_fetcher.config.variant_workers, len(variants)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="variant") as pool:
+            futures = {pool.submit(processor_fn, variant, date): variant for variant in variants}
+            for future in as_completed(futures):
+                variant = futures[future]
+                try:
+                    records = future.result()
+                except Exception as e:
+                    failures[variant] = str(e)
+                    continue
+                if not records:
+                    failures[variant] = "no data returned"
+                    continue
+                rows = [record for record in records if isinstance(record, dict)]
+                self._store(store_fn, rows, f"{label} macro ({variant})")
+
+        if failures:
+            logging.error(f"{label}: {len(failures)}/{len(variants)} variants failed")
+            for variant, error in failures.items():
+                logging.error(f"  - {variant}: {error}")
+        else:
+            logging.info(f"Successfully processed all {len(variants)} {label} variants")
+        return failures
+
+    def _store(
+        self,
+        store_fn: Callable[[List[Dict[str, Any]]], int],
+        rows: List[Dict[str, Any]],
+        label: str,
+        key: Optional[str] = None
+    ):
+        """
+        Write rows directly, or hand them to the writer thread during concurrent ingestion;
+        `key` (the ticker) attributes a failed write in `_run_concurrent`'s errors.
+        """
+        if self._writer is not None:
+            self._writer.submit(store_fn, rows, label, key)
+            return
+        stored = store_fn(rows)
+        logging.info(f"Successfully stored {stored} {label} records")
     #endregion
 
     #region Analysis
@@ -268,7 +433,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.analysis_processor.process_analyst_estimates,
-            store_fn=self.store_analysis.store_analyst_estimates,
+            store_fn=self.store_analysis.store_analyst_estimates_bulk,
             label="analyst estimates"
         )
 
@@ -277,7 +442,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.analysis_processor.process_ratings,
-            store_fn=self.store_analysis.store_ratings,
+            store_fn=self.store_analysis.store_ratings_bulk,
             label="ratings"
         )
     #endregion
@@ -288,7 +453,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.analyst_data_processor.process_grades,
-            store_fn=self.store_analysis_data.store_grades,
+            store_fn=self.store_analysis_data.store_grades_bulk,
             label="grades"
         )
 
@@ -297,7 +462,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.analyst_data_processor.process_grades_consensus,
-            store_fn=self.store_analysis_data.store_grades_consensus,
+            store_fn=self.store_analysis_data.store_grades_consensus_bulk,
             label="grades consensus"
         )
 
@@ -306,7 +471,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.analyst_data_processor.process_price_target_consensus,
-            store_fn=self.store_analysis_data.store_price_target_consensus,
+            store_fn=self.store_analysis_data.store_price_target_consensus_bulk,
             label="price target consensus"
         )
 
@@ -315,7 +480,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.analyst_data_processor.process_price_target_summary,
-            store_fn=self.store_analysis_data.store_price_target_summary,
+            store_fn=self.store_analysis_data.store_price_target_summary_bulk,
             label="price target summary"
         )
     #endregion
@@ -326,16 +491,35 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.core_processor.process_stocks,
-            store_fn=self.store_core.store_stock,
+            store_fn=self.store_core.store_stock_bulk,
             label="stock metadata"
         )
 
+    def populate_stock_universe(self, tickers: Optional[List[str]] = None):
+        """
+        Store `stocks` rows for many tickers (every screened symbol if None) in one pass
+        over a single screener snapshot and one bulk write.
+        """
+        try:
+            rows = self.core_processor.process_stock_universe(tickers)
+            if rows:
+                self._store(self.store_core.store_stock_bulk, rows, "stock metadata (universe)")
+            else:
+                logging.warning("No stock metadata available in screener snapshot")
+            if tickers is not None:
+                missing = set(t.upper() for t in tickers) - set(row['symbol'].upper() for row in rows)
+                if missing:
+                    logging.warning(f"No screener entry for {len(missing)} tickers: {sorted(missing)}")
+        except Exception as e:
+            logging.error(f"Failed to process stock universe: {e}")
+            logging.exception("Full traceback:")
+
     def populate_employee_count(self, ticker: str, date: Optional[str]):
         self._populate_table(
             ticker=ticker,
             date=date,
             processor_fn=self.core_processor.process_employee_count,
-            store_fn=self.store_core.store_employee_count,
+            store_fn=self.store_core.store_employee_count_bulk,
             label="employee count"
         )
     #endregion
@@ -346,8 +530,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.financial_metrics_processor.process_key_metrics,
-            store_fn=self.store_financial_metrics.store_key_metrics,
-            label="key metrics"
+            store_fn=self.store_financial_metrics.store_key_metrics_bulk,
+            label="key metrics",
+            table="key_metrics"
         )
     
     def populate_financial_ratios(self, ticker: str, date: Optional[str]):
@@ -355,8 +540,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.financial_metrics_processor.process_financial_ratios,
-            store_fn=self.store_financial_metrics.store_financial_ratios,
-            label="key financial ratios"
+            store_fn=self.store_financial_metrics.store_financial_ratios_bulk,
+            label="key financial ratios",
+            table="financial_ratios"
         )
 
     def populate_earnings(self, ticker: str, date: Optional[str]):
@@ -364,7 +550,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.financial_metrics_processor.process_earnings,
-            store_fn=self.store_financial_metrics.store_earnings,
+            store_fn=self.store_financial_metrics.store_earnings_bulk,
             label="earnings"
         )
     #endregion
@@ -375,8 +561,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.growth_processor.process_financial_statement_growth,
-            store_fn=self.store_growth.store_financial_statement_growth,
-            label="financial statement growth"
+            store_fn=self.store_growth.store_financial_statement_growth_bulk,
+            label="financial statement growth",
+            table="financial_statement_growth"
         )
 
     def populate_cashflow_statement_growth(self, ticker: str, date: Optional[str]):
@@ -384,8 +571,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.growth_processor.process_cashflow_statement_growth,
-            store_fn=self.store_growth.store_cashflow_statement_growth,
-            label="cashflow statement growth"
+            store_fn=self.store_growth.store_cashflow_statement_growth_bulk,
+            label="cashflow statement growth",
+            table="cashflow_statement_growth"
         )
 
     def populate_balance_sheet_growth(self, ticker: str, date: Optional[str]):
@@ -393,8 +581,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.growth_processor.process_balance_sheet_growth,
-            store_fn=self.store_growth.store_balance_sheet_growth,
-            label="balance sheet growth"
+            store_fn=self.store_growth.store_balance_sheet_growth_bulk,
+            label="balance sheet growth",
+            table="balance_sheet_growth"
         )
 
     def populate_income_statement_growth(self, ticker: str, date: Optional[str]):
@@ -402,8 +591,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.growth_processor.process_income_statement_growth,
-            store_fn=self.store_growth.store_income_statement_growth,
-            label="income statement growth"
+            store_fn=self.store_growth.store_income_statement_growth_bulk,
+            label="income statement growth",
+            table="income_statement_growth"
         )
     #endregion
 
@@ -413,7 +603,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.market_data_processor.process_dividends,
-            store_fn=self.store_market_data.store_dividend,
+            store_fn=self.store_market_data.store_dividend_bulk,
             label="dividends"
         )
 
@@ -422,8 +612,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.market_data_processor.process_dividend_adjusted_prices,
-            store_fn=self.store_market_data.store_dividend_adjusted_price,
-            label="dividend adjusted prices"
+            store_fn=self.store_market_data.store_dividend_adjusted_price_bulk,
+            label="dividend adjusted prices",
+            table="dividend_adjusted_price_data"
         )
 
     def populate_price(self, ticker: str, date: Optional[str]):
@@ -431,8 +622,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.market_data_processor.process_prices,
-            store_fn=self.store_market_data.store_price,
-            label="price"
+            store_fn=self.store_market_data.store_price_bulk,
+            label="price",
+            table="price"
         )
 
     def populate_market_cap(self, ticker: str, date: Optional[str]):
@@ -440,8 +632,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.market_data_processor.process_market_cap,
-            store_fn=self.store_market_data.store_market_cap,
-            label="market cap"
+            store_fn=self.store_market_data.store_market_cap_bulk,
+            label="market cap",
+            table="market_cap"
         )
 
     def populate_share_float(self, ticker: str, date: Optional[str]):
@@ -449,7 +642,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.market_data_processor.process_share_float,
-            store_fn=self.store_market_data.store_share_float,
+            store_fn=self.store_market_data.store_share_float_bulk,
             label="share float"
         )
 
@@ -458,7 +651,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.market_data_processor.process_splits,
-            store_fn=self.store_market_data.store_split,
+            store_fn=self.store_market_data.store_split_bulk,
             label="splits"
         )
 
@@ -470,7 +663,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.valuation_processor.process_discounted_cash_flow,
-            store_fn=self.store_valuation.store_discounted_cash_flow,
+            store_fn=self.store_valuation.store_discounted_cash_flow_bulk,
             label="discounted cash flow"
         )
 
@@ -479,7 +672,7 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.valuation_processor.process_levered_discounted_cash_flow,
-            store_fn=self.store_valuation.store_levered_discounted_cash_flow,
+            store_fn=self.store_valuation.store_levered_discounted_cash_flow_bulk,
             label="levered discounted cash flow"
         )
 
@@ -488,8 +681,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.valuation_processor.process_owner_earnings,
-            store_fn=self.store_valuation.store_owner_earnings,
-            label="owner earnings"
+            store_fn=self.store_valuation.store_owner_earnings_bulk,
+            label="owner earnings",
+            table="owner_earnings"
         )
 
     def populate_enterprise_values(self, ticker: str, date: Optional[str]):
@@ -497,8 +691,9 @@ class DatabasePopulator:
             ticker=ticker,
             date=date,
             processor_fn=self.valuation_processor.process_enterprise_values,
-            store_fn=self.store_valuation.store_enterprise_values,
-            label="enterprise values"
+            store_fn=self.store_valuation.store_enterprise_values_bulk,
+            label="enterprise values",
+            table="enterprise_values"
         )
     #endregion
 
@@ -507,39 +702,43 @@ class DatabasePopulator:
         self._populate_macro_table(
             date=date,
             processor_fn=self.macro_processor.process_mergers_acquisitions,
-            store_fn=self.store_macro.store_mergers_and_acquisitions,
+            store_fn=self.store_macro.store_mergers_and_acquisitions_bulk,
             label="mergers and acquisitions"
         )
 
     def populate_industry_pe(self, date: Optional[str]):
-        self._populate_macro_table(
+        self._populate_macro_variants(
             date=date,
+            variants=self._macro_variants('industry_pe', 'industry', INDUSTRIES),
             processor_fn=self.macro_processor.process_industry_pe,
-            store_fn=self.store_macro.store_industry_pe,
+            store_fn=self.store_macro.store_industry_pe_bulk,
             label="industry pe"
         )
     
     def populate_sector_pe(self, date: Optional[str]):
-        self._populate_macro_table(
+        self._populate_macro_variants(
             date=date,
+            variants=self._macro_variants('sector_pe', 'sector', SECTORS),
             processor_fn=self.macro_processor.process_sector_pe,
-            store_fn=self.store_macro.store_sector_pe,
+            store_fn=self.store_macro.store_sector_pe_bulk,
             label="sector pe"
         )
     
     def populate_industry_performance(self, date: Optional[str]):
-        self._populate_macro_table(
+        self._populate_macro_variants(
             date=date,
+            variants=self._macro_variants('industry_performance', 'industry', INDUSTRIES),
             processor_fn=self.macro_processor.process_industry_performance,
-            store_fn=self.store_macro.store_industry_performance,
+            store_fn=self.store_macro.store_industry_performance_bulk,
             label="industry performance"
         )
     
     def populate_sector_performance(self, date: Optional[str]):
-        self._populate_macro_table(
+        self._populate_macro_variants(
             date=date,
+            variants=self._macro_variants('sector_performance', 'sector', SECTORS),
             processor_fn=self.macro_processor.process_sector_performance,
-            store_fn=self.store_macro.store_sector_performance,
+            store_fn=self.store_macro.store_sector_performance_bulk,
             label="sector performance"
         )
     
@@ -547,17 +746,24 @@ class DatabasePopulator:
         self._populate_macro_table(
             date=date,
             processor_fn=self.macro_processor.process_treasury_rates,
-            store_fn=self.store_macro.store_treasury_rates,
+            store_fn=self.store_macro.store_treasury_rates_bulk,
             label="treasury rates"
         )
     
     def populate_economic_indicators(self, date: Optional[str]):
-        self._populate_macro_table(
+        self._populate_macro_variants(
             date=date,
+            variants=self._macro_variants('economic_indicators', 'name', ECONOMIC_INDICATORS),
             processor_fn=self.macro_processor.process_economic_indicators,
-            store_fn=self.store_macro.store_economic_indicators,
+            store_fn=self.store_macro.store_economic_indicators_bulk,
             label="economic indicators"
-        )  
+        )
 
+    def _macro_variants(self, config_key: str, variant_key: str, defaults: List[str]) -> List[str]:
+        """Variants configured for a macro table (e.g. DataFetchConfig.industry_pe['industry']), else all."""
+        configured = getattr(self.fmp_fetcher.config, config_key).get(variant_key)
+        if configured:
+            return [configured] if isinstance(configured, str) else list(configured)
+        return defaults
     #endregion
     #endregion
\ No newline at end of file
@@ -0,0 +1,49 @@
+import logging
+import queue
+import threading
+from typing import Dict, Any, List, Callable, Optional, Tuple
+
+class DatabaseWriter:
+    """
+    Single writer thread for concurrent ingestion.
+
+    Fetch workers hand finished rows to `submit`; the writer thread is the only
+    thread that calls the store functions, so the SQLite connection behind them
+    is never used concurrently. Writes that raise are logged and kept in `failures`
+    as (key, message) pairs, so callers can report them once the writer is closed.
+    """
+    def __init__(self, max_pending: int = 64):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self.failures: List[Tuple[Optional[str], str]] = []
+        self._thread = threading.Thread(target=self._run, name="DatabaseWriter", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def submit(
+        self,
+        store_fn: Callable[[List[Dict[str, Any]]], int],
+        rows: List[Dict[str, Any]],
+        label: str,
+        key: Optional[str] = None
+    ):
+        """Queue rows for `store_fn`; blocks when the writer falls behind. `key` tags a failed write."""
+        self._queue.put((store_fn, rows, label, key))
+
+    def close(self):
+        """Flush everything queued so far and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            store_fn, rows, label, key = item
+            try:
+                stored = store_fn(rows)
+                logging.info(f"Successfully stored {stored} {label} records")
+            except Exception as e:
+                logging.error(f"Failed to store {label}: {e}")
+                self.failures.append((key, f"Failed to store {label}: {e}"))
@@ -0,0 +1,65 @@
+from functools import partial
+from .ParquetSnapshot import ParquetSnapshot
+
+# Getter category -> method -> snapshot table, mirroring the (tickers, start_date, end_date, columns) Get* methods
+SNAPSHOT_GETTERS = {
+    'analysis': {
+        'get_analyst_estimates': 'analyst_estimates',
+        'get_ratings': 'ratings',
+    },
+    'core': {
+        'get_employee_counts': 'employee_count',
+    },
+    'financial_metrics': {
+        'get_earnings': 'earnings',
+        'get_financial_ratios': 'financial_ratios',
+        'get_key_metrics': 'key_metrics',
+    },
+    'growth': {
+        'get_balance_sheet_growth': 'balance_sheet_growth',
+        'get_cashflow_statement_growth': 'cashflow_statement_growth',
+        'get_financial_statement_growth': 'financial_statement_growth',
+        'get_income_statement_growth': 'income_statement_growth',
+    },
+    'market_data': {
+        'get_price_data': 'price',
+        'get_dividend_adjusted_prices': 'dividend_adjusted_price_data',
+        'get_dividends': 'dividends',
+        'get_market_cap': 'market_cap',
+        'get_share_float': 'share_float',
+        'get_splits': 'splits',
+    },
+    'valuation': {
+        'get_discounted_cash_flow': 'discounted_cash_flow',
+        'get_levered_discounted_cash_flow': 'levered_discounted_cash_flow',
+        'get_enterprise_values': 'enterprise_values',
+        'get_owner_earnings': 'owner_earnings',
+    },
+}
+
+class SnapshotCategory:
+    """One getter category (e.g. `market_data`) whose methods read from a Parquet snapshot."""
+    def __init__(self, snapshot: ParquetSnapshot, methods: dict):
+        self.get_as_of = snapshot.read_as_of
+        for method, table in methods.items():
+            setattr(self, method, partial(snapshot.read, table))
+
+
+class ParquetGetter:
+    """
+    Drop-in for `DatabaseGetter(db, result_format="frame")` over a Parquet snapshot.
+
+    Exposes the same categories and symbol/date getter methods, e.g.
+    `ParquetGetter(snapshot).market_data.get_price_data(symbols, start, end, columns)`,
+    with column and predicate pushdown into the Parquet scan.
+    """
+    def __init__(self, snapshot: ParquetSnapshot):
+        self.snapshot = snapshot
+        self.result_format = "frame"
+        for category, methods in SNAPSHOT_GETTERS.items():
+            setattr(self, category, SnapshotCategory(snapshot, methods))
+
+    def with_format(self, result_format: str) -> "ParquetGetter":
+        if result_format != "frame":
+            raise ValueError("ParquetGetter only returns DataFrames (result_format='frame')")
+        return self
@@ -0,0 +1,272 @@
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Union
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # Optional: only needed for Parquet snapshots
+    pa = ds = None
+
+from ..StockDatabase import StockDatabase, SCHEMA_VERSION
+from ..db_getters.BaseGetter import BaseGetter, DATE_COLUMNS
+
+SNAPSHOT_CHUNK_ROWS = 250_000
+PARTITION_COLUMNS = ("year", "symbol")
+MANIFEST_FILE = "_snapshot.json"
+
+class ParquetSnapshot:
+    """
+    Columnar snapshot of the stock database, one Parquet dataset per table:
+
+        <root>/_snapshot.json
+        <root>/price/year=2023/part-00000-0.parquet
+        <root>/stocks/part-00000-0.parquet
+
+    Tables with a `date` column are hive-partitioned by its year (optionally also by
+    symbol); the rest are written unpartitioned. Column types follow the SQLite schema:
+    REAL/INTEGER as float64, date columns as timestamps and other TEXT as strings.
+
+    `read` applies column projection and symbol/date predicates inside the Parquet
+    scan, skipping whole year partitions and row groups outside the requested range.
+    """
+    def __init__(self, root: str):
+        if pa is None:
+            raise ImportError("ParquetSnapshot requires pyarrow (pip install pyarrow)")
+        self.root = root
+        self._datasets: Dict[str, Any] = {}
+
+    #region Export / import
+    def export(
+        self,
+        db: StockDatabase,
+        tables: Optional[List[str]] = None,
+        partition_by: Iterable[str] = ("year",),
+        chunk_rows: int = SNAPSHOT_CHUNK_ROWS
+    ) -> Dict[str, int]:
+        """
+        Write `tables` (default: all) to the snapshot, streaming `chunk_rows` rows at a time.
+
+        Each exported table replaces its previous snapshot. Returns rows written per table.
+        """
+        partition_by = list(partition_by)
+        unknown = set(partition_by) - set(PARTITION_COLUMNS)
+        if unknown:
+            raise ValueError(f"partition_by must be drawn from {PARTITION_COLUMNS}, got {sorted(unknown)}")
+
+        tables = tables or self._database_tables(db)
+        getter = BaseGetter(db.pool, "frame")
+        counts = {}
+        for table in tables:
+            path = os.path.join(self.root, table)
+            if os.path.exists(path):
+                shutil.rmtree(path)
+            self._datasets.pop(table, None)
+            try:
+                schema = self._arrow_schema(db, table)
+                # "year" is derived from `date`; tables without one are written unpartitioned
+                partitions = [col for col in partition_by if (col == "year" and "date" in schema.names) or (col == "symbol" and col in schema.names)]
+                if "year" in partitions:
+                    schema = schema.append(pa.field("year", pa.int32()))
+                rows = 0
+                for i, frame in enumerate(getter.iter_table(table, chunk_rows=chunk_rows)):
+                    arrow_table = self._to_arrow(frame, schema, "year" in partitions)
+                    ds.write_dataset(
+                        arrow_table, path, format="parquet",
+                        partitioning=partitions or None, partitioning_flavor="hive" if partitions else None,
+                        basename_template=f"part-{i:05d}-{{i}}.parquet",
+                        existing_data_behavior="overwrite_or_ignore"
+                    )
+                    rows += len(frame)
+                counts[table] = rows
+                logging.info(f"Exported {rows} {table} rows to {path}")
+            except Exception as e:
+                logging.error(f"Failed to export {table} to Parquet: {e}")
+
+        self._update_manifest(counts, partition_by)
+        return counts
+
+    def import_into(self, db: StockDatabase, tables: Optional[List[str]] = None, chunk_rows: int = SNAPSHOT_CHUNK_ROWS) -> Dict[str, int]:
+        """
+        Load snapshot tables into `db` (schema must already be initialized), upserting
+        `chunk_rows` rows per batch. Dates are written back as ISO strings.
+        """
+        counts = {}
+        conn = db._get_connection()
+        try:
+            for table in tables or self.tables():
+                dataset = self._dataset(table)
+                if dataset is None:
+                    continue
+                try:
+                    db_columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+                    columns = [col for col in db_columns if col in dataset.schema.names]
+                    query = f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+                    rows = 0
+                    for batch in dataset.to_batches(columns=columns, batch_size=chunk_rows):
+                        frame = batch.to_pandas()
+                        for col in frame.columns.intersection(list(DATE_COLUMNS)):
+                            frame[col] = self._format_dates(frame[col])
+                        frame = frame.astype(object).where(frame.notna(), None)
+                        conn.executemany(query, frame.itertuples(index=False, name=None))
+                        rows += len(frame)
+                    conn.commit()
+                    counts[table] = rows
+                    logging.info(f"Imported {rows} {table} rows from {self.root}")
+                except Exception as e:
+                    conn.rollback()
+                    logging.error(f"Failed to import {table} from Parquet: {e}")
+        finally:
+            conn.close()
+        return counts
+    #endregion
+
+    #region Reading
+    def tables(self) -> List[str]:
+        """Tables present in the snapshot."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if os.path.isdir(os.path.join(self.root, name))
+        )
+
+    def manifest(self) -> Dict[str, Any]:
+        path = os.path.join(self.root, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def read(
+        self,
+        table: str,
+        tickers: Optional[Union[str, List[str]]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Rows of `table` for `tickers` between `start_date` and `end_date` (inclusive),
+        shaped like the "frame" getter format (datetime64 dates, categorical symbol).
+        """
+        dataset = self._dataset(table)
+        if dataset is None:
+            return pd.DataFrame(columns=columns or [])
+        names = dataset.schema.names
+        if isinstance(tickers, str):
+            tickers = [tickers]
+
+        conditions = []
+        if tickers is not None:
+            conditions.append(ds.field("symbol").isin(tickers))
+        if "date" in names:
+            if start_date:
+                start = pd.Timestamp(start_date)
+                conditions.append(ds.field("date") >= pa.scalar(start, pa.timestamp("ns")))
+                if "year" in names:
+                    # Partition predicates prune whole directories before any file is opened
+                    conditions.append(ds.field("year") >= start.year)
+            if end_date:
+                end = pd.Timestamp(end_date)
+                conditions.append(ds.field("date") <= pa.scalar(end, pa.timestamp("ns")))
+                if "year" in names:
+                    conditions.append(ds.field("year") <= end.year)
+        predicate = None
+        for condition in conditions:
+            predicate = condition if predicate is None else predicate & condition
+
+        selected = columns or [name for name in names if name != "year"]
+        frame = dataset.to_table(columns=selected, filter=predicate).to_pandas()
+        if "symbol" in frame.columns:
+            frame["symbol"] = frame["symbol"].astype("category")
+        return frame
+
+    def read_as_of(
+        self,
+        table: str,
+        date: str,
+        tickers: Optional[Union[str, List[str]]] = None,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Latest row per symbol with date <= `date` (and >= `start_date`), like BaseGetter.get_as_of."""
+        selected = list(columns) if columns else None
+        if selected is not None:
+            selected += [col for col in ("symbol", "date") if col not in selected]
+        frame = self.read(table, tickers, start_date, date, selected)
+        if frame.empty:
+            return frame
+        latest = frame.sort_values("date", kind="stable").drop_duplicates("symbol", keep="last").reset_index(drop=True)
+        return latest[columns] if columns else latest
+    #endregion
+
+    #region Helpers
+    def _dataset(self, table: str):
+        if table not in self._datasets:
+            path = os.path.join(self.root, table)
+            if not os.path.isdir(path):
+                return None
+            self._datasets[table] = ds.dataset(path, format="parquet", partitioning="hive")
+        return self._datasets[table]
+
+    @staticmethod
+    def _database_tables(db: StockDatabase) -> List[str]:
+        with db.pool.connection() as conn:
+            cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+            return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _arrow_schema(db: StockDatabase, table: str):
+        fields = []
+        with db.pool.connection() as conn:
+            for _, name, declared, *_ in conn.execute(f"PRAGMA table_info({table})"):
+                declared = (declared or "").upper()
+                if name in DATE_COLUMNS:
+                    arrow_type = pa.timestamp("ns")
+                elif "TEXT" in declared or "CHAR" in declared:
+                    arrow_type = pa.string()
+                else:
+                    # Same as the columnar getters: numeric columns as float64 (NULL -> NaN)
+                    arrow_type = pa.float64()
+                fields.append(pa.field(name, arrow_type))
+        return pa.schema(fields)
+
+    @staticmethod
+    def _to_arrow(frame: pd.DataFrame, schema, with_year: bool):
+        frame = frame.copy()
+        for field in schema:
+            if field.name == "year":
+                continue
+            if pa.types.is_string(field.type):
+                # All-NULL chunks come back as float NaN; text columns must stay strings
+                if frame[field.name].dtype != object:
+                    frame[field.name] = frame[field.name].astype(object).where(frame[field.name].notna(), None)
+            elif pa.types.is_timestamp(field.type):
+                frame[field.name] = pd.to_datetime(frame[field.name])
+        if with_year:
+            frame["year"] = frame["date"].dt.year.fillna(0).astype("int32")
+        return pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+
+    @staticmethod
+    def _format_dates(values: pd.Series) -> pd.Series:
+        if values.dropna().empty:
+            return values
+        has_time = (values.dropna() != values.dropna().dt.normalize()).any()
+        return values.dt.strftime("%Y-%m-%d %H:%M:%S" if has_time else "%Y-%m-%d")
+
+    def _update_manifest(self, counts: Dict[str, int], partition_by: List[str]):
+        os.makedirs(self.root, exist_ok=True)
+        manifest = self.manifest()
+        manifest.setdefault("tables", {})
+        now = datetime.now().isoformat(timespec="seconds")
+        for table, rows in counts.items():
+            manifest["tables"][table] = {"rows": rows, "partition_by": partition_by, "exported_at": now}
+        manifest["schema_version"] = SCHEMA_VERSION
+        with open(os.path.join(self.root, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2)
+    #endregion
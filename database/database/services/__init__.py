@@ -1,7 +1,13 @@
 from .DatabasePopulator import DatabasePopulator
 from .DatabaseGetter import DatabaseGetter
+from .DatabaseWriter import DatabaseWriter
+from .ParquetSnapshot import ParquetSnapshot
+from .ParquetGetter import ParquetGetter
 
 __all__ = [
     'DatabasePopulator',
-    'DatabaseGetter'
+    'DatabaseGetter',
+    'DatabaseWriter',
+    'ParquetSnapshot',
+    'ParquetGetter'
 ]
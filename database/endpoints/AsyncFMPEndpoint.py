@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    import aiohttp
+except ImportError:  # Optional: only needed for AsyncFMPEndpoint
+    aiohttp = None
+
+from .FMPEndpoint import FMPEndpoint, API_KEY, BASE_URL, MAX_RETRIES, RETRY_DELAY, SCREENER_TTL
+from .RateLimiter import RateLimiter
+from .ResponseCache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENCY = 10  # in-flight requests / pooled keep-alive connections
+KEEPALIVE_TIMEOUT = 30
+
+class AsyncFMPEndpoint(FMPEndpoint):
+    """
+    asyncio variant of FMPEndpoint backed by one pooled aiohttp session.
+
+    Only the request helpers (`get_json`, `_fetch_symbol_data`, `_fetch_list_data`)
+    are overridden as coroutines; every public `get_*` method is inherited and simply
+    returns their result, so the method surface is identical and each call is awaited:
+
+        async with AsyncFMPEndpoint() as fmp:
+            metrics, prices = await asyncio.gather(
+                fmp.get_key_metrics("AAPL", limit=5),
+                fmp.get_price_volume_data("MSFT", from_date="2024-01-01"),
+            )
+    """
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        max_concurrency: int = MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None
+    ):
+        if aiohttp is None:
+            raise ImportError("AsyncFMPEndpoint requires aiohttp (pip install aiohttp)")
+        super().__init__(base_url, rate_limiter, cache)
+        self.max_concurrency = max_concurrency
+        self._client: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._screener_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncFMPEndpoint":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _get_client(self) -> "aiohttp.ClientSession":
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=KEEPALIVE_TIMEOUT)
+            self._client = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def close(self):
+        """Close pooled connections (both the aiohttp client and the inherited sync session)."""
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        self.session.close()
+
+    async def _rate_limit(self):
+        """Wait for a slot from the shared rate limiter without blocking the event loop."""
+        wait = self.rate_limiter.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def get_json(self, url: str, params: dict = None, retries: int = MAX_RETRIES) -> Any:
+        """Async counterpart of FMPEndpoint.get_json (same retry, cache and error semantics)."""
+        client = await self._get_client()
+        # aiohttp rejects None values, which requests silently dropped
+        query = {k: str(v) for k, v in (params or {}).items() if v is not None}
+        validators = {}
+        if self.cache is not None:
+            cached, validators = self.cache.lookup(url, query)
+            if cached is not None:
+                return cached
+        query["apikey"] = API_KEY
+
+        async with self._semaphore:
+            for attempt in range(retries):
+                await self._rate_limit()
+                try:
+                    status, data, etag, last_modified = await self._request(client, url, query, validators)
+                    if status == 304 and validators:
+                        data = self.cache.revalidate(url, query)
+                        if data is not None:
+                            return data
+                        # Entry evicted since lookup: nothing to revalidate, so download it in full
+                        logger.info(f"Cached response for {url} evicted before revalidation; refetching")
+                        validators = {}
+                        await self._rate_limit()
+                        status, data, etag, last_modified = await self._request(client, url, query, validators)
+                    if not data:
+                        logger.warning(f"Empty response from {url}")
+                        return None
+                    if self.cache is not None:
+                        self.cache.store(url, query, data, etag=etag, last_modified=last_modified)
+                    return data
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    if attempt == retries - 1:
+                        logger.error(f"Failed to fetch data from {url} after {retries} attempts: {str(e)}")
+                        return None
+                    await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+
+    @staticmethod
+    async def _request(client: "aiohttp.ClientSession", url: str, query: dict, headers: dict):
+        """One GET; returns (status, decoded JSON or None for a 304, ETag, Last-Modified)."""
+        async with client.get(url, params=query, headers=headers or None) as response:
+            if response.status == 304:
+                return response.status, None, None, None
+            if response.status == 401:
+                raise ValueError("Invalid API key. Please check your FMP_API_KEY environment variable.")
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+            return response.status, data, response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+    async def fetch(self, ticker: str) -> Dict[str, Any]:
+        """Async counterpart of FMPEndpoint.fetch; the underlying requests run concurrently."""
+        try:
+            (
+                company_info, key_metrics, financial_ratios, income_growth,
+                balance_growth, cashflow_growth, dcf, levered_dcf
+            ) = await asyncio.gather(
+                self.get_company_screener(ticker),
+                self.get_key_metrics(ticker, limit=1),
+                self.get_financial_ratios(ticker, limit=1),
+                self.get_income_statement_growth(ticker, limit=1),
+                self.get_balance_sheet_growth(ticker, limit=1),
+                self.get_cashflow_statement_growth(ticker, limit=1),
+                self.get_discounted_cash_flow(ticker),
+                self.get_levered_discounted_cash_flow(ticker)
+            )
+
+            return {
+                "company_info": company_info,
+                "key_metrics": key_metrics[0] if key_metrics else {},
+                "financial_ratios": financial_ratios[0] if financial_ratios else {},
+                "growth_metrics": {
+                    "income": income_growth[0] if income_growth else {},
+                    "balance": balance_growth[0] if balance_growth else {},
+                    "cashflow": cashflow_growth[0] if cashflow_growth else {}
+                },
+                "valuation": {
+                    "dcf": dcf,
+                    "levered_dcf": levered_dcf
+                }
+            }
+        except Exception as e:
+            logger.error(f"Error fetching data for {ticker}: {str(e)}")
+            return {}
+
+    async def _fetch_list_data(
+        self,
+        endpoint: str,
+        base_params: Dict[str, Any] = None,
+        variants: Optional[List[str]] = None,
+        variant_param: Optional[str] = None,
+        other_params: Optional[Dict[str, Any]] = None
+    ) -> List[dict]:
+        """Async counterpart of FMPEndpoint._fetch_list_data; variants are requested concurrently."""
+        base_params = base_params or {}
+        other_params = other_params or {}
+        url = f"{self.base_url}/{endpoint}"
+
+        if variants:
+            responses = await asyncio.gather(*(
+                self.get_json(url, params={**base_params, **other_params, variant_param: v})
+                for v in variants
+            ))
+        else:
+            responses = [await self.get_json(url, params={**base_params, **other_params})]
+
+        results = []
+        for v, data in zip(variants or [None], responses):
+            if data is None and variants:
+                logger.warning(f"Skipping {variant_param}={v} for {endpoint}: no data returned")
+            if isinstance(data, list):
+                results.extend(data)
+        return results
+
+    async def _fetch_symbol_data(
+        self,
+        endpoint: str,
+        symbol: str,
+        extra_params: Optional[Dict[str, Any]] = None
+    ) -> List[dict]:
+        params = {"symbol": symbol}
+        if extra_params:
+            params.update(extra_params)
+
+        url = f"{self.base_url}/{endpoint}"
+        data = await self.get_json(url, params=params)
+        return data if isinstance(data, list) else []
+
+    #region Core
+    async def get_company_screener(self, symbol: str) -> dict:
+        """Fetch filtered exchange variant data for a symbol from screener list."""
+        universe = await self.get_company_screener_universe()
+        return universe.get(symbol.upper(), {})
+
+    async def get_company_screener_universe(self, refresh: bool = False) -> Dict[str, dict]:
+        """Async counterpart of FMPEndpoint.get_company_screener_universe.
+
+        Concurrent callers share one in-flight download.
+        """
+        stale = self._screener is None or time.time() - self._screener_loaded > SCREENER_TTL
+        if refresh or stale:
+            if self._screener_task is None or self._screener_task.done():
+                self._screener_task = asyncio.ensure_future(self._load_screener())
+            await self._screener_task
+        return self._screener or {}
+
+    async def _load_screener(self):
+        data = await self.get_json(f"{self.base_url}/company-screener")
+        if isinstance(data, list):
+            self._screener = self._index_screener(data)
+            self._screener_loaded = time.time()
+    #endregion
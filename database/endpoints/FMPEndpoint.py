@@ -2,12 +2,17 @@ import os
 import requests
 import time
 import logging
+import threading
 from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from dotenv import load_dotenv
 from datetime import datetime
 from .base import FinancialDataEndpoint
 from .FMPConstants import EXCHANGES, SECTORS, INDUSTRIES, ECONOMIC_INDICATORS
+from .RateLimiter import RateLimiter, TokenBucketRateLimiter, SQLiteRateLimiter
+from .ResponseCache import ResponseCache
 
 # Configure logging to write to a file
 log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
@@ -24,25 +29,62 @@ API_KEY = os.getenv("FMP_API_KEY")
 BASE_URL = "https://financialmodelingprep.com/stable"
 MAX_RETRIES = 3
 RETRY_DELAY = 1
-RATE_LIMIT_DELAY = 0.1  # 100ms
+POOL_MAXSIZE = 20  # keep-alive connections kept per host
+VARIANT_WORKERS = 8  # concurrent requests when fanning out over sectors/industries/indicators
+SCREENER_TTL = 24 * 60 * 60  # seconds an in-memory company-screener snapshot is reused
+
+# FMP plan quota; set FMP_RATE_LIMIT_DB to share one budget between processes
+RATE_LIMIT_PER_MINUTE = float(os.getenv("FMP_RATE_LIMIT_PER_MINUTE", 300))
+RATE_LIMIT_PER_SECOND = float(os.getenv("FMP_RATE_LIMIT_PER_SECOND", 10))
+RATE_LIMIT_BURST = int(os.getenv("FMP_RATE_LIMIT_BURST", 10))
+RATE_LIMIT_DB = os.getenv("FMP_RATE_LIMIT_DB")
+
+def _default_rate_limiter() -> RateLimiter:
+    if RATE_LIMIT_DB:
+        return SQLiteRateLimiter(RATE_LIMIT_DB, RATE_LIMIT_PER_SECOND, RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST)
+    return TokenBucketRateLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST)
+
+# Shared by every endpoint in the process unless one is passed explicitly
+DEFAULT_RATE_LIMITER = _default_rate_limiter()
 
 class FMPEndpoint(FinancialDataEndpoint):
-    def __init__(self):
-        """Initialize the FMP endpoint with API key validation."""
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None
+    ):
+        """Initialize the FMP endpoint with API key validation.
+
+        Args:
+            base_url: FMP API root.
+            rate_limiter: Limiter shared by all requests (defaults to the process-wide one).
+            cache: Optional on-disk response cache consulted before every request.
+        """
         if not API_KEY:
             raise ValueError("FMP_API_KEY environment variable is not set")
-        self.last_request_time = 0
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.cache = cache
+        self._screener: Optional[Dict[str, dict]] = None
+        self._screener_loaded = 0.0
+        self._screener_lock = threading.Lock()
+
+        # Reuse TCP/TLS connections across requests (and worker threads)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def _rate_limit(self):
-        """Implement rate limiting to avoid API throttling."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < RATE_LIMIT_DELAY:
-            time.sleep(RATE_LIMIT_DELAY - time_since_last_request)
-        self.last_request_time = time.time()
+        """Wait for a slot from the shared rate limiter to avoid API throttling."""
+        self.rate_limiter.acquire()
 
     def get_json(self, url: str, params: dict = None, retries: int = MAX_RETRIES) -> Any:
         """Make an HTTP GET request and return the JSON response.
+
+        Fresh responses in `self.cache` are returned without a request (and without
+        using rate limit budget); stale ones are revalidated with a conditional GET.
         
         Args:
             url: The URL to make the request to.
@@ -55,14 +97,29 @@ class FMPEndpoint(FinancialDataEndpoint):
         Raises:
             ValueError: If the API key is invalid.
         """
-        self._rate_limit()
         if params is None:
             params = {}
+        validators = {}
+        if self.cache is not None:
+            cached, validators = self.cache.lookup(url, params)
+            if cached is not None:
+                return cached
+
+        self._rate_limit()
         params["apikey"] = API_KEY
 
         for attempt in range(retries):
             try:
-                response = requests.get(url, params=params)
+                response = self.session.get(url, params=params, headers=validators or None)
+                if response.status_code == 304 and validators:
+                    data = self.cache.revalidate(url, params)
+                    if data is not None:
+                        return data
+                    # Entry evicted since lookup: nothing to revalidate, so download it in full
+                    logger.info(f"Cached response for {url} evicted before revalidation; refetching")
+                    validators = {}
+                    self._rate_limit()
+                    response = self.session.get(url, params=params)
                 if response.status_code == 401:
                     raise ValueError("Invalid API key. Please check your FMP_API_KEY environment variable.")
                 response.raise_for_status()
@@ -70,6 +127,12 @@ class FMPEndpoint(FinancialDataEndpoint):
                 if not data:
                     logger.warning(f"Empty response from {url}")
                     return None
+                if self.cache is not None:
+                    self.cache.store(
+                        url, params, data,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified")
+                    )
                 return data
             except (RequestException, ValueError) as e:
                 if attempt == retries - 1:
@@ -90,7 +153,7 @@ class FMPEndpoint(FinancialDataEndpoint):
             A dictionary containing the fundamental data for the ticker.
         """
         try:
-            company_info = self.get_exchange_variant(ticker)
+            company_info = self.get_company_screener(ticker)
             key_metrics = self.get_key_metrics(ticker, limit=1)
             financial_ratios = self.get_financial_ratios(ticker, limit=1)
             income_growth = self.get_income_statement_growth(ticker, limit=1)
@@ -148,15 +211,28 @@ class FMPEndpoint(FinancialDataEndpoint):
         other_params = other_params or {}
 
         if variants:
-            for v in variants:
-                params = {**base_params, **other_params, variant_param: v}
-                url = f"{BASE_URL}/{endpoint}"
-                data = self.get_json(url, params=params)
+            url = f"{self.base_url}/{endpoint}"
+
+            def fetch_variant(v):
+                # get_json logs and swallows request errors, returning None
+                data = self.get_json(url, params={**base_params, **other_params, variant_param: v})
+                if data is None:
+                    logger.warning(f"Skipping {variant_param}={v} for {endpoint}: no data returned")
+                return data
+
+            if len(variants) == 1:
+                # Callers that fan out themselves (DatabasePopulator) pass one variant at a time
+                responses = [fetch_variant(variants[0])]
+            else:
+                # Requests still pass through the shared rate limiter; results keep variant order
+                with ThreadPoolExecutor(max_workers=min(VARIANT_WORKERS, len(variants))) as pool:
+                    responses = list(pool.map(fetch_variant, variants))
+            for data in responses:
                 if isinstance(data, list):
                     results.extend(data)
         else:
             params = {**base_params, **other_params}
-            url = f"{BASE_URL}/{endpoint}"
+            url = f"{self.base_url}/{endpoint}"
             data = self.get_json(url, params=params)
             if isinstance(data, list):
                 results.extend(data)
@@ -173,19 +249,38 @@ class FMPEndpoint(FinancialDataEndpoint):
         if extra_params:
             params.update(extra_params)
 
-        url = f"{BASE_URL}/{endpoint}"
+        url = f"{self.base_url}/{endpoint}"
         data = self.get_json(url, params=params)
         return data if isinstance(data, list) else []
 
     #region Core
     def get_company_screener(self, symbol: str) -> dict:
         """Fetch filtered exchange variant data for a symbol from screener list."""
-        url = f"{BASE_URL}/company-screener"
-        data = self.get_json(url)
-        if not isinstance(data, list):
-            return {}
-        
-        return next((entry for entry in data if entry.get("symbol", "").upper() == symbol.upper()), {})
+        return self.get_company_screener_universe().get(symbol.upper(), {})
+
+    def get_company_screener_universe(self, refresh: bool = False) -> Dict[str, dict]:
+        """Screener list indexed by upper-case symbol.
+
+        The list is downloaded once and reused for `SCREENER_TTL` seconds, so per-ticker
+        lookups are dict hits instead of one full download and scan per symbol.
+        """
+        with self._screener_lock:
+            if refresh or self._screener is None or time.time() - self._screener_loaded > SCREENER_TTL:
+                data = self.get_json(f"{self.base_url}/company-screener")
+                if not isinstance(data, list):
+                    # Don't pin a failed download; the next call retries
+                    return self._screener or {}
+                self._screener = self._index_screener(data)
+                self._screener_loaded = time.time()
+            return self._screener
+
+    @staticmethod
+    def _index_screener(data: List[dict]) -> Dict[str, dict]:
+        return {
+            entry["symbol"].upper(): entry
+            for entry in data
+            if isinstance(entry, dict) and entry.get("symbol")
+        }
 
 
     def get_historical_employee_count(self, symbol: str, limit: int = None) -> list[dict]:
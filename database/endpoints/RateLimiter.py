@@ -0,0 +1,136 @@
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+class RateLimiter(ABC):
+    """Base class for request rate limiters shared by FMP endpoints.
+
+    Limiters hand out reservations rather than sleeping themselves, so the same
+    limiter can back both the threaded and the asyncio endpoint.
+    """
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """Reserve one request slot.
+
+        Returns:
+            Seconds the caller must wait before sending the request (0 if it may go now).
+        """
+        pass
+
+    def acquire(self):
+        """Block the calling thread until a request slot is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Thread-safe token bucket with optional per-second and per-minute limits.
+
+    Each configured limit is its own bucket refilled at `limit / period` tokens per
+    second and capped at `burst` tokens; a request needs a token from every bucket.
+    Sustained throughput therefore runs at the tightest limit instead of a fixed gap.
+
+    Args:
+        per_second: Maximum sustained requests per second.
+        per_minute: Maximum sustained requests per minute (the FMP plan quota).
+        burst: Bucket capacity, i.e. how many requests may go back to back after idling.
+            Defaults to `per_second` (or 1 if only a per-minute limit is set).
+    """
+
+    def __init__(self, per_second: Optional[float] = None, per_minute: Optional[float] = None, burst: Optional[int] = None):
+        if not per_second and not per_minute:
+            raise ValueError("At least one of per_second or per_minute must be set")
+        self.rates = [rate for rate in (per_second, per_minute / 60 if per_minute else None) if rate]
+        self.burst = float(burst or max(int(per_second or 1), 1))
+        self._lock = threading.Lock()
+        self._tokens = [self.burst] * len(self.rates)
+        self._updated = [time.monotonic()] * len(self.rates)
+
+    def reserve(self) -> float:
+        with self._lock:
+            wait = self._take(self._tokens, self._updated, time.monotonic())
+        return wait
+
+    def _take(self, tokens: List[float], updated: List[float], now: float) -> float:
+        """Refill every bucket to `now`, take one token from each and return the wait.
+
+        Buckets may go negative; that debt is what queues later callers behind
+        earlier reservations.
+        """
+        wait = 0.0
+        for i, rate in enumerate(self.rates):
+            tokens[i] = min(self.burst, tokens[i] + (now - updated[i]) * rate)
+            updated[i] = now
+            if tokens[i] < 1:
+                wait = max(wait, (1 - tokens[i]) / rate)
+        for i in range(len(self.rates)):
+            tokens[i] -= 1
+        return wait
+
+
+class SQLiteRateLimiter(TokenBucketRateLimiter):
+    """Token bucket whose state lives in a SQLite row, shared by every process using `db_path`.
+
+    Each reservation runs in a `BEGIN IMMEDIATE` transaction, so concurrent ingestion
+    processes draw from one budget. Wall-clock time is used since the state is
+    compared across processes.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        per_second: Optional[float] = None,
+        per_minute: Optional[float] = None,
+        burst: Optional[int] = None,
+        name: str = "fmp"
+    ):
+        super().__init__(per_second, per_minute, burst)
+        self.db_path = db_path
+        self.name = name
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limiter (
+                    name TEXT,
+                    bucket INTEGER,
+                    tokens REAL,
+                    updated REAL,
+                    PRIMARY KEY (name, bucket)
+                )
+            """)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def reserve(self) -> float:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            state = {
+                bucket: (tokens, updated)
+                for bucket, tokens, updated in conn.execute(
+                    "SELECT bucket, tokens, updated FROM rate_limiter WHERE name = ?", (self.name,)
+                )
+            }
+            tokens = [state.get(i, (self.burst, now))[0] for i in range(len(self.rates))]
+            updated = [state.get(i, (self.burst, now))[1] for i in range(len(self.rates))]
+            wait = self._take(tokens, updated, now)
+            conn.executemany(
+                "INSERT OR REPLACE INTO rate_limiter (name, bucket, tokens, updated) VALUES (?, ?, ?, ?)",
+                [(self.name, i, tokens[i], updated[i]) for i in range(len(self.rates))]
+            )
+            conn.execute("COMMIT")
+            return wait
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
@@ -0,0 +1,204 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+COMPRESSION_LEVEL = 6
+
+class ResponseCache:
+    """Persistent, size-bounded cache of decoded JSON responses stored in one SQLite file.
+
+    Entries are keyed by endpoint path plus sorted query params (the API key is never
+    part of the key), stored zlib-compressed and expire after a per-endpoint TTL.
+    Expired entries that carried an `ETag`/`Last-Modified` validator are kept so the
+    caller can revalidate them with a conditional request instead of a full download.
+    When the stored payload exceeds `max_bytes`, least recently used entries are evicted.
+
+    Args:
+        path: SQLite file holding the cache.
+        ttls: Seconds to keep responses per endpoint path (e.g. {"company-screener": 86400}).
+            A TTL of 0 disables caching for that endpoint.
+        default_ttl: TTL for endpoints not listed in `ttls`.
+        max_bytes: Upper bound on the compressed size of all stored responses.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.path = path
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT,
+                payload BLOB,
+                size INTEGER,
+                etag TEXT,
+                last_modified TEXT,
+                created REAL,
+                accessed REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed)")
+
+    @staticmethod
+    def endpoint_of(url: str) -> str:
+        """Endpoint path used for TTL lookup, e.g. '.../stable/sector-pe-snapshot' -> 'sector-pe-snapshot'."""
+        path = urlparse(url).path.strip("/")
+        return path[len("stable/"):] if path.startswith("stable/") else path
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Stable cache key for a request; `apikey` and unset params are ignored."""
+        items = sorted(
+            (str(k), str(v)) for k, v in (params or {}).items()
+            if v is not None and k.lower() != "apikey"
+        )
+        return f"{ResponseCache.endpoint_of(url)}?{json.dumps(items, separators=(',', ':'))}"
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(self.endpoint_of(url), self.default_ttl)
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Dict[str, str]]:
+        """Return `(data, validators)` for a request.
+
+        `data` is the cached response when a fresh entry exists, otherwise None. For a
+        stale entry with validators, `validators` holds the conditional request headers
+        (`If-None-Match`/`If-Modified-Since`) to send; after a 304 call `revalidate`.
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return None, {}
+
+        key = self.make_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, etag, last_modified, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None, {}
+
+            payload, etag, last_modified, created = row
+            if now - created <= ttl:
+                self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                self.hits += 1
+                return self._decode(payload), {}
+
+            self.misses += 1
+        validators = {}
+        if etag:
+            validators["If-None-Match"] = etag
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+        return None, validators
+
+    def revalidate(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Mark a stale entry fresh after a 304 response and return its data."""
+        key = self.make_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET created = ?, accessed = ? WHERE key = ?", (now, now, key))
+            # The earlier lookup counted this as a miss; it was served without a download
+            self.misses -= 1
+            self.hits += 1
+            self.revalidated += 1
+        return self._decode(row[0])
+
+    def store(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """Compress and store a decoded response, then evict LRU entries over `max_bytes`."""
+        if self.ttl_for(url) <= 0:
+            return
+        try:
+            payload = zlib.compress(json.dumps(data, separators=(',', ':')).encode("utf-8"), COMPRESSION_LEVEL)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Not caching response from {url}: {str(e)}")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (key, endpoint, payload, size, etag, last_modified, created, accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (self.make_key(url, params), self.endpoint_of(url), payload, len(payload), etag, last_modified, now, now)
+            )
+            self._evict()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        evict = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if total - freed <= self.max_bytes:
+                break
+            evict.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+        self.evictions += len(evict)
+
+    def _decode(self, payload: bytes) -> Any:
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+    def clear(self, endpoint: Optional[str] = None):
+        """Drop every entry, or only those of one endpoint path."""
+        with self._lock:
+            if endpoint is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus the current size of the cache file."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size
+        }
+
+    def close(self):
+        self._conn.close()
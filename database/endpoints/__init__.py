@@ -1,7 +1,15 @@
 from .FMPEndpoint import FMPEndpoint
+from .AsyncFMPEndpoint import AsyncFMPEndpoint
 from .WikiEndpoint import WikiEndpoint
+from .RateLimiter import RateLimiter, TokenBucketRateLimiter, SQLiteRateLimiter
+from .ResponseCache import ResponseCache
 
 __all__ = [
     'FMPEndpoint',
-    'WikiEndpoint'
+    'AsyncFMPEndpoint',
+    'WikiEndpoint',
+    'RateLimiter',
+    'TokenBucketRateLimiter',
+    'SQLiteRateLimiter',
+    'ResponseCache'
 ]
@@ -0,0 +1,34 @@
+"""
+DatabasePopulator concurrent ingestion: failed writes on the writer thread are reported per ticker.
+
+Usage:
+    python -m pytest database/tests
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from database.database.services import DatabasePopulator
+
+
+def test_run_concurrent_records_writer_failures():
+    # Only the writer hand-off is exercised, so skip the database and FMP setup
+    populator = DatabasePopulator.__new__(DatabasePopulator)
+    populator._writer = None
+    stored = []
+
+    def store_price(rows):
+        if rows[0]["symbol"] == "BAD":
+            raise ValueError("disk I/O error")
+        stored.extend(rows)
+        return len(rows)
+
+    def populate_price(ticker, date):
+        populator._store(store_price, [{"symbol": ticker}], f"Price for {ticker}", key=ticker)
+
+    ticker_errors = {"GOOD": [], "BAD": []}
+    populator._run_concurrent(["GOOD", "BAD"], [(populate_price, "Market Data")], ticker_errors, max_workers=2)
+
+    assert stored == [{"symbol": "GOOD"}]
+    assert ticker_errors == {"GOOD": [], "BAD": ["Failed to store Price for BAD: disk I/O error"]}
+    assert populator._writer is None
@@ -0,0 +1,245 @@
+"""
+FMPEndpoint and AsyncFMPEndpoint against a local stub server replaying canned FMP JSON.
+
+Usage:
+    python -m pytest database/tests
+"""
+import asyncio
+import importlib
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from database.endpoints import AsyncFMPEndpoint, FMPEndpoint, ResponseCache, TokenBucketRateLimiter
+
+# The package re-exports the classes under their module names, so fetch the modules themselves
+sync_module = importlib.import_module("database.endpoints.FMPEndpoint")
+async_module = importlib.import_module("database.endpoints.AsyncFMPEndpoint")
+
+API_KEY = "test-key"
+ETAG = '"v1"'
+
+# Canned responses by endpoint path; variant endpoints answer per query value
+CANNED = {
+    "key-metrics": [{"symbol": "AAPL", "date": "2024-09-28", "marketCap": 3.4e12}],
+    "discounted-cash-flow": [{"symbol": "AAPL", "date": "2024-09-28", "dcf": 150.0}],
+    "historical-sector-pe": lambda query: [{"date": "2024-01-02", "sector": query["sector"], "pe": 20.0}],
+}
+
+
+class StubFMP(BaseHTTPRequestHandler):
+    """
+    Replays CANNED as JSON with an ETag (304 when the client sends it back), records
+    each request with its If-None-Match header and tracks how many are in flight.
+    """
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        endpoint = url.path.strip("/")
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        with server.lock:
+            server.requests.append((endpoint, query))
+            server.validators.append(self.headers.get("If-None-Match"))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if query.get("apikey") != API_KEY:
+                return self._send(401, {"Error Message": "Invalid API KEY"})
+            if endpoint not in CANNED:
+                return self._send(404, {"Error Message": f"Unknown endpoint {endpoint}"})
+            if self.headers.get("If-None-Match") == ETAG:
+                return self._send(304, None)
+            body = CANNED[endpoint]
+            self._send(200, body(query) if callable(body) else body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send(self, status, body):
+        payload = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubFMP)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.validators = []
+    httpd.in_flight = httpd.max_in_flight = 0
+    httpd.delay = 0.0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setattr(sync_module, "API_KEY", API_KEY)
+    monkeypatch.setattr(async_module, "API_KEY", API_KEY)
+    monkeypatch.setattr(sync_module, "RETRY_DELAY", 0)
+    monkeypatch.setattr(async_module, "RETRY_DELAY", 0)
+
+
+def limiter():
+    return TokenBucketRateLimiter(per_second=1000, burst=1000)
+
+
+def stale_cache(path, url, params, data) -> ResponseCache:
+    """Cache holding `data` for the request, already past its TTL but carrying the stub's ETag."""
+    cache = ResponseCache(str(path), default_ttl=0.01)
+    cache.store(url, params, data, etag=ETAG)
+    time.sleep(0.02)
+    return cache
+
+
+def test_get_json_uses_base_url(server):
+    fmp = FMPEndpoint(base_url=server.base_url, rate_limiter=limiter())
+    data = fmp.get_json(f"{server.base_url}/key-metrics", params={"symbol": "AAPL"})
+
+    assert data == CANNED["key-metrics"]
+    assert server.requests == [("key-metrics", {"symbol": "AAPL", "apikey": API_KEY})]
+
+
+def test_get_json_returns_none_after_retries(server):
+    fmp = FMPEndpoint(base_url=server.base_url, rate_limiter=limiter())
+
+    assert fmp.get_json(f"{server.base_url}/missing", retries=2) is None
+    assert len(server.requests) == 2
+
+
+def test_get_json_revalidates_stale_entry(server, tmp_path):
+    url = f"{server.base_url}/key-metrics"
+    cache = stale_cache(tmp_path / "cache.db", url, {"symbol": "AAPL"}, [{"symbol": "AAPL", "cached": True}])
+    fmp = FMPEndpoint(base_url=server.base_url, rate_limiter=limiter(), cache=cache)
+
+    assert fmp.get_json(url, params={"symbol": "AAPL"}) == [{"symbol": "AAPL", "cached": True}]
+    assert server.validators == [ETAG]
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_get_json_refetches_when_entry_evicted_before_304(server, tmp_path, monkeypatch):
+    url = f"{server.base_url}/key-metrics"
+    cache = stale_cache(tmp_path / "cache.db", url, {"symbol": "AAPL"}, [{"symbol": "AAPL", "cached": True}])
+    revalidate = cache.revalidate
+
+    def evict_then_revalidate(*args):
+        cache.clear()
+        return revalidate(*args)
+
+    monkeypatch.setattr(cache, "revalidate", evict_then_revalidate)
+    fmp = FMPEndpoint(base_url=server.base_url, rate_limiter=limiter(), cache=cache)
+
+    assert fmp.get_json(url, params={"symbol": "AAPL"}) == CANNED["key-metrics"]
+    assert server.validators == [ETAG, None]
+
+
+def test_async_refetches_when_entry_evicted_before_304(server, tmp_path, monkeypatch):
+    url = f"{server.base_url}/key-metrics"
+    cache = stale_cache(tmp_path / "cache.db", url, {"symbol": "AAPL"}, [{"symbol": "AAPL", "cached": True}])
+    revalidate = cache.revalidate
+
+    def evict_then_revalidate(*args):
+        cache.clear()
+        return revalidate(*args)
+
+    monkeypatch.setattr(cache, "revalidate", evict_then_revalidate)
+
+    async def main():
+        async with AsyncFMPEndpoint(base_url=server.base_url, rate_limiter=limiter(), cache=cache) as fmp:
+            return await fmp.get_json(url, params={"symbol": "AAPL"})
+
+    assert asyncio.run(main()) == CANNED["key-metrics"]
+    assert server.validators == [ETAG, None]
+
+
+def test_fetch_list_data_keeps_variant_order(server):
+    fmp = FMPEndpoint(base_url=server.base_url, rate_limiter=limiter())
+    sectors = ["Technology", "Energy", "Utilities"]
+    rows = fmp._fetch_list_data("historical-sector-pe", {"from": "2024-01-01"}, sectors, "sector")
+
+    assert [row["sector"] for row in rows] == sectors
+    assert all(query["from"] == "2024-01-01" for _, query in server.requests)
+
+
+def test_fetch_list_data_single_variant_skips_pool(server, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a one-variant fetch should not start a thread pool")
+
+    monkeypatch.setattr(sync_module, "ThreadPoolExecutor", no_pool)
+    fmp = FMPEndpoint(base_url=server.base_url, rate_limiter=limiter())
+    rows = fmp._fetch_list_data("historical-sector-pe", variants=["Energy"], variant_param="sector")
+
+    assert [row["sector"] for row in rows] == ["Energy"]
+
+
+def test_fetch_list_data_warns_on_failed_variant(server, caplog):
+    fmp = FMPEndpoint(base_url=server.base_url, rate_limiter=limiter())
+    with caplog.at_level("WARNING", logger=sync_module.logger.name):
+        rows = fmp._fetch_list_data("historical-industry-pe", variants=["Software", "Banks"], variant_param="industry")
+
+    assert rows == []
+    assert "Skipping industry=Software for historical-industry-pe" in caplog.text
+    assert "Skipping industry=Banks for historical-industry-pe" in caplog.text
+
+
+def test_async_inherits_get_methods(server):
+    async def main():
+        async with AsyncFMPEndpoint(base_url=server.base_url, rate_limiter=limiter()) as fmp:
+            return await asyncio.gather(
+                fmp.get_key_metrics("AAPL", limit=1),
+                fmp.get_discounted_cash_flow("AAPL"),
+            )
+
+    metrics, dcf = asyncio.run(main())
+
+    assert metrics == CANNED["key-metrics"]
+    assert dcf == CANNED["discounted-cash-flow"]
+    assert {endpoint for endpoint, _ in server.requests} == {"key-metrics", "discounted-cash-flow"}
+
+
+def test_async_fetch_list_data(server):
+    sectors = ["Technology", "Energy", "Utilities", "Financial Services"]
+
+    async def main():
+        async with AsyncFMPEndpoint(base_url=server.base_url, rate_limiter=limiter()) as fmp:
+            return await fmp._fetch_list_data("historical-sector-pe", variants=sectors, variant_param="sector")
+
+    rows = asyncio.run(main())
+
+    assert [row["sector"] for row in rows] == sectors
+
+
+def test_async_concurrency_is_bounded(server):
+    server.delay = 0.05
+
+    async def main():
+        async with AsyncFMPEndpoint(base_url=server.base_url, max_concurrency=2, rate_limiter=limiter()) as fmp:
+            return await asyncio.gather(*(fmp.get_key_metrics(f"T{i}") for i in range(8)))
+
+    results = asyncio.run(main())
+
+    assert all(result == CANNED["key-metrics"] for result in results)
+    assert len(server.requests) == 8
+    assert server.max_in_flight == 2
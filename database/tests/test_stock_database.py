@@ -0,0 +1,87 @@
+"""
+StockDatabase schema migration: rowid price tables become WITHOUT ROWID tables.
+
+Usage:
+    python -m pytest database/tests
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from database.database.StockDatabase import StockDatabase, SCHEMA_VERSION
+
+SCHEMA_DIR = Path(sys.modules[StockDatabase.__module__].__file__).parent / "schema"
+LEGACY_SCHEMA = """
+CREATE TABLE price (
+    symbol TEXT, date TEXT, open REAL, high REAL, low REAL, close REAL, volume INTEGER,
+    change REAL, change_percent REAL, vwap REAL,
+    PRIMARY KEY (symbol, date)
+);
+CREATE INDEX idx_price_date ON price (date);
+"""
+ROWS = [
+    (symbol, f"2024-01-0{day}", 1.0, 1.0, 1.0, 100.0 + day, 10, 0.0, 0.0, 1.0)
+    for symbol in ("AAA", "BBB") for day in range(1, 6)
+]
+
+
+def legacy_db(path: Path) -> Path:
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany("INSERT INTO price VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", ROWS)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def table_sql(conn: sqlite3.Connection, name: str):
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()
+    return row and row[0]
+
+
+def test_initialize_migrates_rowid_tables(tmp_path):
+    path = legacy_db(tmp_path / "stocks.db")
+    StockDatabase(db_name=str(path)).initialize()
+
+    conn = sqlite3.connect(path)
+    assert "WITHOUT ROWID" in table_sql(conn, "price").upper()
+    assert table_sql(conn, "price__rowid") is None
+    assert conn.execute("SELECT COUNT(*) FROM price").fetchone()[0] == len(ROWS)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_initialize_finishes_interrupted_migration(tmp_path):
+    path = legacy_db(tmp_path / "stocks.db")
+    db = StockDatabase(db_name=str(path))
+    # A run that detached the rowid table and stamped the version but never copied the rows
+    conn = db._get_connection()
+    db._detach_rowid_tables(conn)
+    conn.executescript((SCHEMA_DIR / "market_data" / "prices.sql").read_text())
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+    conn.close()
+
+    db.initialize()
+
+    conn = sqlite3.connect(path)
+    assert table_sql(conn, "price__rowid") is None
+    assert conn.execute("SELECT COUNT(*) FROM price").fetchone()[0] == len(ROWS)
+
+
+def test_initialize_drops_version_1_indexes(tmp_path):
+    path = tmp_path / "stocks.db"
+    StockDatabase(db_name=str(path)).initialize()
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE INDEX idx_price_symbol_date_close ON price (symbol, date, close)")
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    StockDatabase(db_name=str(path)).initialize()
+
+    conn = sqlite3.connect(path)
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_price_symbol_date_close" not in indexes
+    assert "idx_price_date_close" in indexes
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
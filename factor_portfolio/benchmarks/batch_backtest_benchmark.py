@@ -0,0 +1,66 @@
+"""
+Strategy grids: one Backtester.simulate per variant vs Backtester.run_batch.
+
+Evaluates a grid of top quantiles x weighting x long-short x rebalance frequency on a
+synthetic (symbols x dates) frame, once as a loop building a Backtester and calling
+simulate per variant (re-ranking each time) and once with run_batch over shared ranks,
+and checks both give the same results.
+
+Usage:
+    python factor_portfolio/benchmarks/batch_backtest_benchmark.py --symbols 500 --dates 1250 --quantiles 10
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from factor_pipeline.pipeline import Backtester
+
+
+def run(symbols: int, dates: int, quantiles: int, block_size: int):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "symbol": np.repeat([f"T{s:04d}" for s in range(symbols)], dates),
+        "date": np.tile(pd.bdate_range("2020-01-01", periods=dates), symbols),
+        "value_score": rng.standard_normal(symbols * dates).cumsum() / 50,
+        "next_return": rng.normal(0.0003, 0.02, symbols * dates),
+    })
+    grid = {
+        "top_quantile": list(np.linspace(0.05, 0.5, quantiles)),
+        "weight_type": ["equal", "score"],
+        "long_short": [False, True],
+        "rebalance": ["weekly", "monthly", "quarterly", "threshold"],
+        "cost_bps": 5.0,
+    }
+    variants = Backtester._expand_strategies(grid)
+    print(f"{len(df):,} rows ({symbols} symbols x {dates} dates), {len(variants)} strategy variants")
+
+    start = time.perf_counter()
+    looped = []
+    for spec in variants.to_dict("records"):
+        result = Backtester(df).simulate(**spec)
+        looped.append(result["cumulative"].iloc[-1])
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = Backtester(df).run_batch(grid, block_size=block_size)
+    batch_time = time.perf_counter() - start
+
+    np.testing.assert_allclose(table["final_value"].values, looped)
+    print(f"{'simulate per variant':28s} {loop_time:8.2f} s")
+    print(f"{'run_batch':28s} {batch_time:8.2f} s   ({loop_time / batch_time:.1f}x)")
+    print(table.sort_values("sharpe", ascending=False).head(10).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--dates", type=int, default=1250)
+    parser.add_argument("--quantiles", type=int, default=10)
+    parser.add_argument("--block-size", type=int, default=16)
+    args = parser.parse_args()
+    run(args.symbols, args.dates, args.quantiles, args.block_size)
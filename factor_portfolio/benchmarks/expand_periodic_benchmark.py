@@ -0,0 +1,122 @@
+"""
+Periodic-to-daily alignment: per-symbol loop vs one merge_asof by symbol.
+
+Aligns quarterly earnings, key metrics, financial ratios and enterprise values to the
+daily price calendar, as ValueFactorFetch does, with the previous per-symbol
+implementation and with BaseFetcher.expand_periodic_sources, and checks both agree.
+
+Usage:
+    python factor_portfolio/benchmarks/expand_periodic_benchmark.py --tickers 500 --days 1260
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+sys.path.append(str(Path(__file__).parent.parent))
+from database.benchmarks.synthetic_db import build
+from database.database.db_getters import GetMarketData, GetFinancialMetrics, GetValuation
+from fetchers.fetchers.BaseFetcher import BaseFetcher
+
+
+def legacy_expand(price_df: pd.DataFrame, periodic_df: pd.DataFrame) -> pd.DataFrame:
+    """The per-symbol implementation expand_periodic_data replaced."""
+    price_df = price_df.copy()
+    periodic_df = periodic_df.copy()
+    price_df["date"] = pd.to_datetime(price_df["date"])
+    periodic_df["date"] = pd.to_datetime(periodic_df["date"])
+    price_df.sort_values(["symbol", "date"], inplace=True)
+    periodic_df.sort_values(["symbol", "date"], inplace=True)
+    value_cols = [col for col in periodic_df.columns if col not in {"symbol", "date"}]
+    expanded = []
+    for symbol in price_df["symbol"].unique():
+        price_sym = price_df[price_df["symbol"] == symbol].copy()
+        periodic_sym = periodic_df[periodic_df["symbol"] == symbol].copy()
+        if periodic_sym.empty:
+            price_sym.set_index(["symbol", "date"], inplace=True)
+            expanded.append(price_sym)
+            continue
+        merged = pd.merge_asof(
+            price_sym.sort_values("date"),
+            periodic_sym[["date"] + value_cols].sort_values("date"),
+            on="date",
+            direction="backward"
+        )
+        merged["symbol"] = symbol
+        merged.set_index(["symbol", "date"], inplace=True)
+        expanded.append(merged)
+    return pd.concat(expanded).sort_index()
+
+
+def legacy_combine(prices: pd.DataFrame, sources) -> pd.DataFrame:
+    df = prices.set_index(["symbol", "date"])
+    for src in sources:
+        aligned = legacy_expand(prices, src).drop(columns=["close"], errors="ignore")
+        overlap = df.columns.intersection(aligned.columns)
+        if len(overlap):
+            aligned = aligned.drop(columns=overlap)
+        df = df.join(aligned, how="left")
+    return df.sort_index()
+
+
+class Aligner(BaseFetcher):
+    """BaseFetcher without the database connection, for the alignment methods only."""
+    def __init__(self):
+        pass
+
+    def fetch(self, symbol, start_date, end_date):
+        raise NotImplementedError
+
+
+def run(tickers: int, days: int, repeat: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = build(os.path.join(tmp, 'bench.db'), tickers, days)
+        symbols = [f"T{t:04d}" for t in range(tickers)]
+        market_data = GetMarketData(db.pool, "frame")
+        metrics = GetFinancialMetrics(db.pool, "frame")
+        valuation = GetValuation(db.pool, "frame")
+        prices = market_data.get_price_data(symbols, columns=["symbol", "date", "close"])
+        prices["symbol"] = prices["symbol"].astype(str)
+        sources = [
+            metrics.get_earnings(symbols, columns=["symbol", "date", "eps_actual"]),
+            metrics.get_key_metrics(symbols, columns=["symbol", "date", "earnings_yield", "graham_number", "enterprise_value"]),
+            metrics.get_financial_ratios(symbols, columns=["symbol", "date", "price_to_earnings_ratio", "price_to_book_ratio"]),
+            valuation.get_enterprise_values(symbols, columns=["symbol", "date", "enterprise_value"]),
+        ]
+        for src in sources:
+            src["symbol"] = src["symbol"].astype(str)
+        db.close()
+
+    aligner = Aligner()
+    cases = {
+        "per-symbol loop": lambda: legacy_combine(prices, sources),
+        "merge_asof by symbol": lambda: aligner.expand_periodic_sources(prices, sources),
+    }
+    results = {}
+    for label, fn in cases.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = fn()
+        results[label] = ((time.perf_counter() - start) / repeat, result)
+
+    legacy, vectorized = results["per-symbol loop"][1], results["merge_asof by symbol"][1]
+    pd.testing.assert_frame_equal(legacy, vectorized)
+
+    print(f"{len(prices):,} price rows ({tickers} tickers x {days} days), {len(sources)} periodic sources")
+    base = results["per-symbol loop"][0]
+    for label, (elapsed, _) in results.items():
+        print(f"{label:24s} {elapsed:8.3f} s   ({base / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--days", type=int, default=1260)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.tickers, args.days, args.repeat)
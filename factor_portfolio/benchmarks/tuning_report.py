@@ -0,0 +1,77 @@
+"""
+Tuning report: wall time, fits and best score of every Tuner search type on one dataset.
+
+Builds a synthetic (symbols x dates) panel of z-scored value features whose forward
+return carries a small nonlinear signal, and tunes one model with each search type
+on the same purged date folds (Tuner.compare).
+
+Usage:
+    python factor_portfolio/benchmarks/tuning_report.py --symbols 200 --dates 500 --model xgboost
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from tuning import SEARCH_TYPES, Tuner
+
+FEATURES = [
+    "z_price_to_earnings_ratio", "z_price_to_book_ratio", "z_price_to_sales_ratio",
+    "z_price_to_free_cash_flow_ratio", "z_free_cash_flow_yield", "z_earnings_yield",
+    "z_graham_number", "z_return_on_equity", "z_return_on_assets",
+]
+PARAM_GRIDS = {
+    "xgboost": {
+        "n_estimators": [50, 100, 200],
+        "max_depth": [2, 3, 4, 6],
+        "learning_rate": [0.03, 0.1, 0.3],
+        "subsample": [0.7, 1.0],
+    },
+    "random_forest": {
+        "n_estimators": [25, 50, 100],
+        "max_depth": [3, 5, 8],
+        "min_samples_leaf": [1, 10, 50],
+        "max_features": ["sqrt", 0.5, 1.0],
+    },
+}
+
+
+def synthetic_panel(symbols: int, dates: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    index = pd.MultiIndex.from_product(
+        [[f"T{s:04d}" for s in range(symbols)], pd.bdate_range("2020-01-01", periods=dates)], names=["symbol", "date"]
+    )
+    X = pd.DataFrame(rng.standard_normal((len(index), len(FEATURES))), index=index, columns=FEATURES)
+    signal = 0.004 * np.tanh(X[FEATURES[0]]) + 0.003 * X[FEATURES[5]] * (X[FEATURES[7]] > 0)
+    y = pd.Series(signal + rng.normal(0, 0.02, len(index)), index=index, name="next_return")
+    return X, y
+
+
+def run(symbols: int, dates: int, model: str, cv: int, n_iter: int, resource: str, n_jobs: int):
+    X, y = synthetic_panel(symbols, dates)
+    grid = PARAM_GRIDS[model]
+    n_grid = int(np.prod([len(values) for values in grid.values()]))
+    print(f"{len(X):,} rows ({symbols} symbols x {dates} dates), {model}, {n_grid} grid candidates, {cv} purged date folds")
+
+    tuner = Tuner(model, grid, cv=cv, scoring="neg_mean_squared_error", n_iter=n_iter, n_jobs=n_jobs, resource=resource)
+    report = tuner.compare(X, y, SEARCH_TYPES)
+    report["cv_score"] *= 1e4
+    report["best_score"] *= 1e4
+    with pd.option_context("display.width", 200, "display.max_colwidth", 80):
+        print(report.rename(columns={"best_score": "best_score(1e-4)", "cv_score": "cv_score(1e-4)"}).to_string(index=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--dates", type=int, default=500)
+    parser.add_argument("--model", choices=list(PARAM_GRIDS), default="xgboost")
+    parser.add_argument("--cv", type=int, default=3)
+    parser.add_argument("--n-iter", type=int, default=20)
+    parser.add_argument("--resource", choices=["n_samples", "n_estimators"], default="n_samples")
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    args = parser.parse_args()
+    run(args.symbols, args.dates, args.model, args.cv, args.n_iter, args.resource, args.n_jobs)
@@ -1,18 +1,31 @@
 # base_trainer.py
 from abc import ABC, abstractmethod
 import os
+import time
 from datetime import datetime
 from typing import Optional
 import joblib
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs, parallel_config
+from sklearn.base import clone
 from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from xgboost import XGBRegressor
 import pandas as pd
+from factor_pipeline.pipeline import rebalance as rebalancing
+
+# Fitted walk-forward window models, keyed by estimator, params and training data
+DEFAULT_WALK_FORWARD_CACHE_DIR = "models/walk_forward"
+DEFAULT_WALK_FORWARD_CACHE_MAX_BYTES = 1024 ** 3
+# Estimator params that set threads, not the fitted model; left out of cache keys
+THREAD_PARAMS = ("n_jobs", "nthread", "thread_count")
 
 class BaseTrainer(ABC):
     """
     Abstract trainer class for regression or ML-based factor training.
     """
+    # Column holding model predictions in walk-forward output
+    score_col = "score"
 
     def __init__(self, model_path: Optional[str], model_type: str, model_params: dict):
         self.model_path = model_path
@@ -62,6 +75,110 @@ class BaseTrainer(ABC):
             "model_weights": self.get_model_weights()
         }
 
+    def walk_forward(
+        self,
+        df: pd.DataFrame,
+        training_cols: list[str],
+        target_col: str = "next_return",
+        rebalance: str = "monthly",
+        train_dates: Optional[int] = None,
+        min_train_dates: int = 20,
+        gap: int = 0,
+        n_jobs: int = -1,
+        cache_dir: Optional[str] = DEFAULT_WALK_FORWARD_CACHE_DIR,
+        cache_max_bytes: int = DEFAULT_WALK_FORWARD_CACHE_MAX_BYTES,
+    ) -> pd.DataFrame:
+        """
+        Out-of-sample scores from a model retrained at every rebalance date on prior data only.
+
+        At each rebalance date R (first date of each `rebalance` period) a fresh copy of the
+        model is fit on the rows dated before R (less `gap` dates, for targets that take
+        longer than a date to realize) and scores the rows from R up to the next rebalance.
+
+        Args:
+            train_dates: None trains on every prior date (expanding window); N on the last
+                N dates (rolling window)
+            min_train_dates: Rebalance dates with fewer training dates are skipped
+            n_jobs: Windows fitted in parallel (joblib loky processes); -1 uses every core.
+                With more than one process each fit is single-threaded (estimator n_jobs=1
+                and one BLAS/OpenMP thread) so the processes do not oversubscribe the CPU
+            cache_dir: Fitted window models are kept here and reloaded when the estimator,
+                its params and the window's training data are unchanged; None disables
+            cache_max_bytes: Least recently used cached models are deleted once `cache_dir`
+                holds more than this
+
+        Returns:
+            The scored rows: date, symbol, target_col, `score_col` and rebalance_date,
+            ready for Backtester(result, score_col=self.score_col, return_col=target_col)
+        """
+        started = time.perf_counter()
+        # preprocess_data may transform df in place; a second call on the same frame would
+        # then train on different arrays and miss every cached window
+        X, y = self.preprocess_data(df.copy(), training_cols, target_col)
+        dates = self._labels(df, X.index, "date")
+        symbols = self._labels(df, X.index, "symbol")
+
+        # Rows sorted by date so every training and test window is a contiguous slice
+        date_codes, unique_dates = pd.factorize(dates, sort=True)
+        order = np.argsort(date_codes, kind="stable")
+        X_sorted = X.to_numpy(dtype=float)[order]
+        y_sorted = y.to_numpy(dtype=float)[order]
+        row_starts = np.searchsorted(date_codes[order], np.arange(len(unique_dates) + 1))
+
+        rebalance_positions = np.flatnonzero(rebalancing.calendar(unique_dates, rebalance))
+        windows = []
+        for k, position in enumerate(rebalance_positions):
+            train_end = position - gap
+            train_start = 0 if train_dates is None else max(0, train_end - train_dates)
+            if train_end - train_start < min_train_dates:
+                continue
+            test_end = rebalance_positions[k + 1] if k + 1 < len(rebalance_positions) else len(unique_dates)
+            windows.append((position, (row_starts[train_start], row_starts[train_end]), (row_starts[position], row_starts[test_end])))
+        if not windows:
+            raise ValueError("No rebalance date has enough prior data to train on")
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        estimator = self.model
+        inner_threads = None
+        if effective_n_jobs(n_jobs) > 1 and len(windows) > 1:
+            # One thread per window fit; the windows themselves use the cores
+            estimator = clone(self.model)
+            thread_params = {name: 1 for name in THREAD_PARAMS if name in estimator.get_params()}
+            estimator.set_params(**thread_params)
+            inner_threads = 1
+        with parallel_config(backend="loky", inner_max_num_threads=inner_threads):
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(_fit_window)(estimator, X_sorted, y_sorted, train, test, cache_dir)
+                for _, train, test in windows
+            )
+        if cache_dir:
+            _prune_cache(cache_dir, cache_max_bytes)
+
+        frames = []
+        for (position, _, (test_start, test_stop)), (predictions, _) in zip(windows, results):
+            rows = order[test_start:test_stop]
+            frames.append(pd.DataFrame({
+                "date": dates[rows],
+                "symbol": symbols[rows],
+                target_col: y_sorted[test_start:test_stop],
+                self.score_col: predictions,
+                "rebalance_date": unique_dates[position],
+            }, index=X.index[rows]))
+        self.last_walk_forward = {
+            "windows": len(windows),
+            "cached": sum(cached for _, cached in results),
+            "seconds": time.perf_counter() - started,
+        }
+        return pd.concat(frames)
+
+    @staticmethod
+    def _labels(df: pd.DataFrame, index: pd.Index, name: str) -> np.ndarray:
+        """`name` (index level or column of df) for the rows in `index`."""
+        if name in index.names:
+            return index.get_level_values(name).to_numpy()
+        return df.loc[index, name].to_numpy()
+
     @abstractmethod
     def fit(self, X: pd.DataFrame, y: pd.Series) -> dict:
         pass
@@ -69,3 +186,42 @@ class BaseTrainer(ABC):
     @abstractmethod
     def preprocess_data(self, df: pd.DataFrame, training_cols: list[str], target_col: str = "next_return"):
         pass
+
+
+def _fit_window(estimator, X: np.ndarray, y: np.ndarray, train: tuple, test: tuple, cache_dir: Optional[str]):
+    """Fits (or reloads) one walk-forward window's model and predicts its test rows."""
+    X_train, y_train = X[train[0]:train[1]], y[train[0]:train[1]]
+    path = None
+    if cache_dir:
+        params = {k: v for k, v in estimator.get_params().items() if k not in THREAD_PARAMS}
+        # Parallel workers receive large arrays as memmaps, which hash differently from the same ndarray
+        key = joblib.hash((type(estimator).__name__, params, np.asarray(X_train), np.asarray(y_train)))
+        path = os.path.join(cache_dir, f"{key}.pkl")
+        if os.path.exists(path):
+            model = joblib.load(path)
+            # Marks the entry as recently used for _prune_cache
+            os.utime(path)
+            return model.predict(X[test[0]:test[1]]), True
+
+    model = clone(estimator).fit(X_train, y_train)
+    if path:
+        # Written under a temporary name so a concurrent reader never sees a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        joblib.dump(model, tmp_path)
+        os.replace(tmp_path, path)
+    return model.predict(X[test[0]:test[1]]), False
+
+
+def _prune_cache(cache_dir: str, max_bytes: int):
+    """Deletes the least recently used cached window models until `cache_dir` holds at most `max_bytes`."""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(".pkl"):
+            info = os.stat(os.path.join(cache_dir, name))
+            entries.append((info.st_mtime, info.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(os.path.join(cache_dir, name))
+        total -= size
@@ -1,11 +1,13 @@
 import pandas as pd
 from factor_pipeline.base.BaseFactor import BaseFactor
+from factor_pipeline.pipeline.Panel import Panel
 import joblib
 
 class ValueFactor(BaseFactor):
     """
     Computes value factor scores using different modes (rule, statistical, ml).
-    Requires z-scored input data.
+    Requires z-scored input data, as a long DataFrame or a Panel (which yields a
+    date x symbol score array).
     """
 
     def __init__(self, config: dict):
@@ -32,4 +34,7 @@ class ValueFactor(BaseFactor):
     def _compute_ml(self, data: pd.DataFrame) -> pd.Series:
         if self.model is None:
             raise RuntimeError("ML model not loaded.")
+        if isinstance(data, Panel):
+            # One predict over every present (date, symbol) cell
+            return data.apply_rows(self.model.predict, self.features)
         return pd.Series(self.model.predict(data[self.features]), index=data.index)
@@ -7,6 +7,7 @@ class ValueFactorTrainer(BaseTrainer):
     """
     Trains a regression model to predict next-period returns based on value signals.
     """
+    score_col = "value_score"
 
     def __init__(self, model_path: str, model_type: str, model_params: dict):
         super().__init__(model_path, model_type, model_params)
@@ -1,29 +1,175 @@
+from itertools import product
+from typing import Dict, List, Union
+import numpy as np
 import pandas as pd
+from . import selection
+from . import rebalance as rebalancing
+from .Panel import Panel
+from .utils import compute_cagr, compute_sharpe, compute_drawdown, infer_periods_per_year
+
+# Strategy spec keys accepted by Backtester.run_batch and their defaults
+BATCH_DEFAULTS = {
+    "top_quantile": 0.2,
+    "weight_type": "equal",
+    "long_short": False,
+    "rebalance": "monthly",
+    "threshold": None,
+    "cost_bps": 0.0,
+}
 
 class Backtester:
     """
     Simple backtester to track portfolio performance using factor scores.
+
+    `return_col` holds each row's forward return (date t to the next date), as
+    FeatureTransformer.compute_forward_return produces. The input is not copied.
     """
 
-    def __init__(self, df: pd.DataFrame, score_col: str = "value_score", return_col: str = "next_return"):
-        self.df = df.copy()
+    def __init__(self, df: Union[pd.DataFrame, Panel], score_col: str = "value_score", return_col: str = "next_return"):
+        self.df = df
         self.score_col = score_col
         self.return_col = return_col
+        # Dense (date x symbol) scores and returns, built once and reused by every run
+        panel = df if isinstance(df, Panel) else Panel.from_frame(self.df, [score_col, return_col])
+        self.dates, self.symbols = panel.dates, panel.symbols
+        self.scores = panel[score_col].astype(float, copy=False)
+        self.returns = panel[return_col].astype(float, copy=False)
+        self._ranks = None
 
-    def run(self, top_quantile: float = 0.2, weight_type: str = "equal") -> pd.Series:
-        df = self.df.copy()
-        df["rank"] = df.groupby("date")[self.score_col].rank(ascending=False, pct=True)
-        df["selected"] = df["rank"] <= top_quantile
-
-        if weight_type == "equal":
-            df["weight"] = df.groupby("date")["selected"].transform(lambda x: 1 / x.sum()) * df["selected"]
-        elif weight_type == "score":
-            df["weight"] = df[self.score_col] * df["selected"]
-            df["weight"] /= df.groupby("date")["weight"].transform("sum")
-        else:
-            raise ValueError("weight_type must be 'equal' or 'score'")
-
-        df["weighted_return"] = df["weight"] * df[self.return_col]
-        monthly_return = df.groupby("date")["weighted_return"].sum()
+    def run(self, top_quantile: float = 0.2, weight_type: str = "equal", top_n: int = None) -> pd.Series:
+        """Cumulative growth of the top `top_quantile` (or `top_n`) portfolio, rebalanced every date."""
+        weights = self.target_weights(top_quantile, weight_type, top_n)
+        monthly_return = pd.Series(selection.portfolio_returns(weights, self.returns), index=self.dates)
         cumulative = (1 + monthly_return).cumprod()
         return cumulative
+
+    def target_weights(self, top_quantile: float = 0.2, weight_type: str = "equal", top_n: int = None, long_short: bool = False) -> np.ndarray:
+        """
+        (date x symbol) weights of the top `top_quantile` (or `top_n`) scores on each date,
+        less the bottom ones for `long_short` (long leg sums to 1, short leg to -1).
+        """
+        if weight_type not in ("equal", "score"):
+            raise ValueError("weight_type must be 'equal' or 'score'")
+        if top_n is None:
+            return selection.quantile_weights(self.scores, top_quantile, weight_type == "score", long_short, self._average_ranks())
+        weights = np.nan_to_num(selection.weights(selection.top_n(self.scores, top_n), self.scores, weight_type))
+        if long_short:
+            weights -= np.nan_to_num(selection.weights(selection.top_n(-self.scores, top_n), -self.scores, weight_type))
+        return weights
+
+    def simulate(
+        self,
+        top_quantile: float = 0.2,
+        weight_type: str = "equal",
+        top_n: int = None,
+        long_short: bool = False,
+        rebalance: str = "monthly",
+        threshold: float = None,
+        cost_bps: float = 0.0,
+    ) -> pd.DataFrame:
+        """
+        Backtest that only trades on a rebalance calendar and lets holdings drift in between.
+
+        Args:
+            long_short: Also short the bottom quantile (or bottom `top_n`)
+            rebalance: "daily", "weekly", "monthly", "quarterly", "annual" (first date of
+                each period) or "threshold" (trade only when weights drift)
+            threshold: Drift from target (sum |held - target| / 2) that triggers an
+                off-calendar trade; defaults to 5% for rebalance="threshold", off otherwise
+            cost_bps: Transaction cost per unit of turnover, in basis points
+
+        Returns:
+            Per-date gross_return, cost, net_return, turnover, rebalanced and cumulative (net growth)
+        """
+        if rebalance == "threshold" and threshold is None:
+            threshold = rebalancing.DEFAULT_DRIFT_THRESHOLD
+        targets = self.target_weights(top_quantile, weight_type, top_n, long_short)
+        result = rebalancing.simulate(targets, self.returns, rebalancing.calendar(self.dates, rebalance), threshold, cost_bps)
+        result = pd.DataFrame(result, index=self.dates)
+        result["cumulative"] = (1 + result["net_return"]).cumprod()
+        return result
+
+    def run_grid(self, quantiles, weight_type: str = "equal") -> pd.DataFrame:
+        """Cumulative growth for many top quantiles at once: one column per quantile."""
+        returns = selection.quantile_sweep(self.scores, self.returns, quantiles, weight_type)
+        return pd.DataFrame((1 + returns).cumprod(axis=1).T, index=self.dates, columns=np.ravel(quantiles))
+
+    def run_batch(self, strategies: Union[Dict[str, list], List[dict]], block_size: int = 16) -> pd.DataFrame:
+        """
+        Simulates many strategy variants against the shared score ranks and return matrix.
+
+        Args:
+            strategies: Either a list of specs or a dict of lists expanded to every combination.
+                Spec keys (defaults in BATCH_DEFAULTS): top_quantile, weight_type, long_short,
+                rebalance, threshold, cost_bps, as in `simulate`
+            block_size: Distinct target portfolios (quantile, weighting, long-short) built at
+                once; bounds memory at about block_size x dates x symbols floats
+
+        Returns:
+            One row per variant: its spec (with the threshold actually used) plus cagr,
+            sharpe, max_drawdown, final_value, turnover (total) and trades
+        """
+        specs = self._expand_strategies(strategies)
+        if not specs["weight_type"].isin(["equal", "score"]).all():
+            raise ValueError("weight_type must be 'equal' or 'score'")
+        ranks = self._average_ranks()
+        calendars = {freq: rebalancing.calendar(self.dates, freq) for freq in specs["rebalance"].unique()}
+        # Threshold-rebalanced variants without a threshold use the default drift trigger;
+        # recorded in the specs so the results show what was run
+        uses_default = (specs["rebalance"] == "threshold") & specs["threshold"].isna()
+        specs.loc[uses_default, "threshold"] = rebalancing.DEFAULT_DRIFT_THRESHOLD
+        # No threshold means never trading off-calendar
+        threshold = specs["threshold"].to_numpy(dtype=float)
+        specs_threshold = np.where(np.isnan(threshold), np.inf, threshold)
+
+        # Variants differing only in calendar, threshold or costs share one target matrix
+        target_keys = ["top_quantile", "weight_type", "long_short"]
+        target_codes = specs.groupby(target_keys, sort=False).ngroup().to_numpy()
+        target_specs = specs[target_keys].drop_duplicates()
+        net_returns = np.zeros((len(specs), len(self.dates)))
+        turnover = np.zeros(len(specs))
+        trades = np.zeros(len(specs), dtype=int)
+        for start in range(0, len(target_specs), block_size):
+            block = target_specs.iloc[start:start + block_size]
+            targets = selection.quantile_weights(
+                self.scores,
+                block["top_quantile"].to_numpy(dtype=float),
+                (block["weight_type"] == "score").to_numpy(),
+                block["long_short"].to_numpy(dtype=bool),
+                ranks,
+            )
+            variants = np.flatnonzero((target_codes >= start) & (target_codes < start + len(block)))
+            masks = np.stack([calendars[freq] for freq in specs["rebalance"].iloc[variants]])
+            result = rebalancing.simulate(
+                targets, self.returns, masks, specs_threshold[variants],
+                specs["cost_bps"].to_numpy(dtype=float)[variants], target_index=target_codes[variants] - start,
+            )
+            net_returns[variants] = result["net_return"]
+            turnover[variants] = result["turnover"].sum(axis=-1)
+            trades[variants] = result["rebalanced"].sum(axis=-1)
+
+        returns = pd.DataFrame(net_returns.T, index=self.dates)
+        cumulative = (1 + returns).cumprod()
+        specs["cagr"] = compute_cagr(cumulative).to_numpy()
+        specs["sharpe"] = compute_sharpe(returns, periods_per_year=infer_periods_per_year(self.dates)).to_numpy()
+        specs["max_drawdown"] = compute_drawdown(cumulative).min().to_numpy()
+        specs["final_value"] = cumulative.iloc[-1].to_numpy()
+        specs["turnover"] = turnover
+        specs["trades"] = trades
+        return specs
+
+    def _average_ranks(self) -> np.ndarray:
+        """Per-date ascending score ranks, computed once and shared by every variant."""
+        if self._ranks is None:
+            self._ranks = selection.average_ranks(self.scores)
+        return self._ranks
+
+    @staticmethod
+    def _expand_strategies(strategies: Union[Dict[str, list], List[dict]]) -> pd.DataFrame:
+        if isinstance(strategies, dict):
+            grid = {key: value if isinstance(value, (list, tuple)) else [value] for key, value in strategies.items()}
+            strategies = [dict(zip(grid, values)) for values in product(*grid.values())]
+        unknown = {key for spec in strategies for key in spec} - set(BATCH_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Unknown strategy keys: {sorted(unknown)}")
+        return pd.DataFrame([{**BATCH_DEFAULTS, **spec} for spec in strategies], columns=list(BATCH_DEFAULTS))
@@ -1,31 +1,160 @@
+import numpy as np
 import pandas as pd
-from scipy.stats import zscore
+from scipy.special import ndtri
+from .selection import average_ranks
+from .Panel import Panel
+
+ZSCORE_METHODS = ("standard", "mad", "rank_gauss")
+# Scales the median absolute deviation to the standard deviation of a normal distribution
+MAD_SCALE = 1.4826
 
 class FeatureTransformer:
     """
     Handles z-score normalization, winsorization, lagging, and feature engineering.
+
+    Cross-sectional transforms (per date) run on a dense (date, symbol, column) array
+    built once for all requested columns, so no Python function is called per date group.
+    NaNs are ignored when computing statistics and stay NaN in the output.
+    Every method also accepts a Panel, whose fields already are that layout, and
+    updates its fields in place.
     """
 
     @staticmethod
-    def zscore_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
-        for col in columns:
-            df["z_" + col] = df.groupby("date")[col].transform(zscore)
+    def zscore_columns(df: pd.DataFrame, columns: list[str], method: str = "standard") -> pd.DataFrame:
+        """
+        Adds a per-date z-score column "z_<col>" for each column.
+
+        method:
+            "standard":   (x - mean) / std (population std, as scipy.stats.zscore)
+            "mad":        (x - median) / (1.4826 * median absolute deviation), robust to outliers
+            "rank_gauss": normal quantile of the per-date rank, (rank - 0.5) / n
+        """
+        if method not in ZSCORE_METHODS:
+            raise ValueError(f"method must be one of {ZSCORE_METHODS}, got {method!r}")
+        if isinstance(df, Panel):
+            scores = FeatureTransformer._zscore_panel(df.stack(columns), method)
+            for i, col in enumerate(columns):
+                df["z_" + col] = scores[..., i]
+            return df
+
+        panel, rows, group, pos = FeatureTransformer._date_panel(df, columns)
+        scores = FeatureTransformer._zscore_panel(panel, method)
+        out = FeatureTransformer._scatter(scores, np.full((len(df), len(columns)), np.nan), rows, group, pos)
+        for i, col in enumerate(columns):
+            df["z_" + col] = out[:, i]
         return df
 
     @staticmethod
-    def winsorize(df: pd.DataFrame, columns: list[str], lower: float = 0.01, upper: float = 0.99) -> pd.DataFrame:
-        for col in columns:
-            lower_val = df[col].quantile(lower)
-            upper_val = df[col].quantile(upper)
-            df[col] = df[col].clip(lower_val, upper_val)
+    def winsorize(df: pd.DataFrame, columns: list[str], lower: float = 0.01, upper: float = 0.99, by_date: bool = True) -> pd.DataFrame:
+        """Clips each column to its [lower, upper] quantiles, per date by default or over the whole frame."""
+        if isinstance(df, Panel):
+            if by_date:
+                clipped = FeatureTransformer._winsorize_panel(df.stack(columns), lower, upper)
+                for i, col in enumerate(columns):
+                    df[col] = clipped[..., i]
+            else:
+                for col in columns:
+                    lower_val, upper_val = np.nanquantile(df[col], [lower, upper])
+                    df[col] = np.clip(df[col], lower_val, upper_val)
+            return df
+        if not by_date:
+            for col in columns:
+                lower_val = df[col].quantile(lower)
+                upper_val = df[col].quantile(upper)
+                df[col] = df[col].clip(lower_val, upper_val)
+            return df
+
+        panel, rows, group, pos = FeatureTransformer._date_panel(df, columns)
+        clipped = FeatureTransformer._winsorize_panel(panel, lower, upper)
+        # Rows without a date are not part of any cross-section and keep their values
+        out = FeatureTransformer._scatter(clipped, df[columns].to_numpy(dtype=float), rows, group, pos)
+        for i, col in enumerate(columns):
+            df[col] = out[:, i]
         return df
 
     @staticmethod
     def lag_column(df: pd.DataFrame, group_col: str, column: str, lag: int = 1) -> pd.DataFrame:
+        if isinstance(df, Panel):
+            # Lags step along the panel's date axis, so a symbol's missing dates count as periods
+            df[f"{column}_lag{lag}"] = df.shift(column, lag)
+            return df
         df[f"{column}_lag{lag}"] = df.groupby(group_col)[column].shift(lag)
         return df
 
     @staticmethod
     def compute_forward_return(df: pd.DataFrame, price_col: str = "close", horizon: int = 1) -> pd.DataFrame:
+        if isinstance(df, Panel):
+            with np.errstate(invalid="ignore", divide="ignore"):
+                df["next_return"] = df.shift(price_col, -horizon) / df[price_col] - 1
+            return df
         df["next_return"] = df.groupby("symbol")[price_col].shift(-horizon) / df[price_col] - 1
         return df
+
+    @staticmethod
+    def _zscore_panel(panel: np.ndarray, method: str) -> np.ndarray:
+        """Z-scores a (date, row, column) panel across rows (axis 1)."""
+        valid = ~np.isnan(panel)
+        counts = valid.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if method == "standard":
+                mean = np.nansum(panel, axis=1) / counts
+                centered = panel - mean[:, None, :]
+                std = np.sqrt(np.nansum(centered ** 2, axis=1) / counts)
+                scores = centered / std[:, None, :]
+            elif method == "mad":
+                median = FeatureTransformer._quantiles(np.sort(panel, axis=1), counts, 0.5)
+                deviations = np.abs(panel - median[:, None, :])
+                mad = FeatureTransformer._quantiles(np.sort(deviations, axis=1), counts, 0.5)
+                scores = (panel - median[:, None, :]) / (MAD_SCALE * mad[:, None, :])
+            else:
+                ranks = average_ranks(panel.transpose(0, 2, 1)).transpose(0, 2, 1)
+                scores = ndtri((ranks - 0.5) / counts[:, None, :])
+        # Constant cross-sections have no spread to scale by
+        scores[~np.isfinite(scores)] = np.nan
+        return scores
+
+    @staticmethod
+    def _winsorize_panel(panel: np.ndarray, lower: float, upper: float) -> np.ndarray:
+        """Clips a (date, row, column) panel to each (date, column) [lower, upper] quantile."""
+        counts = (~np.isnan(panel)).sum(axis=1)
+        ordered = np.sort(panel, axis=1)
+        lower_val = FeatureTransformer._quantiles(ordered, counts, lower)
+        upper_val = FeatureTransformer._quantiles(ordered, counts, upper)
+        return np.clip(panel, lower_val[:, None, :], upper_val[:, None, :])
+
+    @staticmethod
+    def _date_panel(df: pd.DataFrame, columns: list[str]):
+        """
+        Dense (dates, max rows per date, columns) float array of df[columns], NaN padded,
+        plus the coordinates (rows, group, pos) mapping each dated row into it.
+        """
+        dates = df["date"] if "date" in df.columns else df.index.get_level_values("date")
+        codes, uniques = pd.factorize(np.asarray(dates))
+        rows = np.flatnonzero(codes >= 0)
+        rows = rows[np.argsort(codes[rows], kind="stable")]
+        group = codes[rows]
+        sizes = np.bincount(group, minlength=len(uniques))
+        starts = np.cumsum(sizes) - sizes
+        pos = np.arange(len(rows)) - starts[group]
+
+        panel = np.full((len(uniques), sizes.max(initial=0), len(columns)), np.nan)
+        panel[group, pos] = df[columns].to_numpy(dtype=float)[rows]
+        return panel, rows, group, pos
+
+    @staticmethod
+    def _scatter(panel: np.ndarray, out: np.ndarray, rows: np.ndarray, group: np.ndarray, pos: np.ndarray) -> np.ndarray:
+        """Writes panel values back into `out` (one row per df row) at the dated rows."""
+        out[rows] = panel[group, pos]
+        return out
+
+    @staticmethod
+    def _quantiles(ordered: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+        """Per (date, column) quantile with linear interpolation, from a panel sorted along axis 1 (NaNs last)."""
+        position = q * (counts - 1)
+        low = np.floor(position).clip(min=0).astype(int)
+        high = np.minimum(low + 1, np.maximum(counts - 1, 0))
+        low_val = np.take_along_axis(ordered, low[:, None, :], axis=1)[:, 0, :]
+        high_val = np.take_along_axis(ordered, high[:, None, :], axis=1)[:, 0, :]
+        result = low_val + (high_val - low_val) * (position - low)
+        result[counts == 0] = np.nan
+        return result
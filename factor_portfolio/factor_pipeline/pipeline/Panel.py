@@ -0,0 +1,160 @@
+from typing import Callable, Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+
+class Panel:
+    """
+    Dense (date x symbol) view of the pipeline's long (symbol, date) frames.
+
+    Each field is a 2-D array over shared `dates` and `symbols` axes with NaN for missing
+    values; `present` marks the (date, symbol) cells that had a row in the long frame, so
+    `Panel.from_frame(df).to_frame()` gives back the same rows. Cross-sectional operations
+    become axis-1 reductions instead of groupbys.
+
+    When the long frame is a complete sorted grid (every symbol on every date, ordered by
+    symbol then date or by date then symbol), fields are reshaped views of the frame's
+    columns and `to_frame` hands the arrays back without copying.
+    """
+
+    def __init__(self, dates: pd.Index, symbols: pd.Index, fields: Dict[str, np.ndarray] = None, present: np.ndarray = None):
+        self.dates = pd.Index(dates, name="date")
+        self.symbols = pd.Index(symbols, name="symbol")
+        self.fields: Dict[str, np.ndarray] = {}
+        self.present = np.ones(self.shape, dtype=bool) if present is None else present
+        for name, values in (fields or {}).items():
+            self[name] = values
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, columns: Optional[List[str]] = None, dtype=np.float64) -> "Panel":
+        """
+        Builds a panel from a long frame with `symbol` and `date` index levels or columns.
+
+        Args:
+            columns: Fields to keep; defaults to every numeric column
+            dtype: Field dtype, e.g. np.float32 to halve memory
+        """
+        symbol_values = cls._labels(df, "symbol")
+        date_values = cls._labels(df, "date")
+        if columns is None:
+            columns = [col for col in df.select_dtypes("number").columns if col not in ("symbol", "date")]
+        symbol_codes, symbols = pd.factorize(symbol_values, sort=True)
+        date_codes, dates = pd.factorize(date_values, sort=True)
+        n_dates, n_symbols = len(dates), len(symbols)
+        panel = cls(dates, symbols, present=np.zeros((n_dates, n_symbols), dtype=bool))
+
+        rows = np.arange(len(df))
+        if len(df) == n_dates * n_symbols and n_dates and np.array_equal(symbol_codes * n_dates + date_codes, rows):
+            # Complete grid sorted by (symbol, date): (symbol x date) blocks are views
+            panel.present[:] = True
+            for col in columns:
+                panel.fields[col] = df[col].to_numpy(dtype=dtype).reshape(n_symbols, n_dates).T
+            return panel
+        if len(df) == n_dates * n_symbols and n_dates and np.array_equal(date_codes * n_symbols + symbol_codes, rows):
+            panel.present[:] = True
+            for col in columns:
+                panel.fields[col] = df[col].to_numpy(dtype=dtype).reshape(n_dates, n_symbols)
+            return panel
+
+        # Rows without a symbol or date have no cell; duplicated cells keep the last row
+        valid = (symbol_codes >= 0) & (date_codes >= 0)
+        date_codes, symbol_codes = date_codes[valid], symbol_codes[valid]
+        panel.present[date_codes, symbol_codes] = True
+        for col in columns:
+            values = np.full((n_dates, n_symbols), np.nan, dtype=dtype)
+            values[date_codes, symbol_codes] = df[col].to_numpy(dtype=dtype)[valid]
+            panel.fields[col] = values
+        return panel
+
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Long frame indexed by (symbol, date), one row per present cell, as ValueFactorFetch returns."""
+        columns = list(self.fields) if columns is None else columns
+        symbol_codes, date_codes = np.nonzero(self.present.T)
+        index = pd.MultiIndex(levels=[self.symbols, self.dates], codes=[symbol_codes, date_codes], names=["symbol", "date"])
+        complete = len(symbol_codes) == self.present.size
+        data = {}
+        for col in columns:
+            values = self.fields[col].T
+            # A symbol-major complete field flattens without copying
+            data[col] = values.reshape(-1) if complete else values[symbol_codes, date_codes]
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def to_wide(self, field: str) -> pd.DataFrame:
+        """One field as a (date x symbol) DataFrame over the panel's array."""
+        return pd.DataFrame(self.fields[field], index=self.dates, columns=self.symbols, copy=False)
+
+    def astype(self, dtype) -> "Panel":
+        """Panel with every field cast to `dtype`, sharing axes and the presence mask."""
+        return Panel(self.dates, self.symbols, {k: v.astype(dtype, copy=False) for k, v in self.fields.items()}, self.present)
+
+    def select(self, columns: Iterable[str]) -> "Panel":
+        """Panel with a subset of fields (arrays are shared, not copied)."""
+        return Panel(self.dates, self.symbols, {col: self.fields[col] for col in columns}, self.present)
+
+    def mask(self, field: str) -> np.ndarray:
+        """Cells of `field` holding a value."""
+        return ~np.isnan(self.fields[field])
+
+    def stack(self, columns: List[str]) -> np.ndarray:
+        """Fields as one (date x symbol x column) array."""
+        return np.stack([self.fields[col] for col in columns], axis=-1)
+
+    def apply_rows(self, fn: Callable[[pd.DataFrame], np.ndarray], columns: List[str]) -> np.ndarray:
+        """
+        Calls `fn` once on the (present cells x columns) frame of `columns`, e.g. a model's
+        predict, and scatters its per-row output back into a (date x symbol) array.
+        """
+        date_codes, symbol_codes = np.nonzero(self.present)
+        X = pd.DataFrame({col: self.fields[col][date_codes, symbol_codes] for col in columns})
+        out = np.full(self.shape, np.nan)
+        if len(X):
+            out[date_codes, symbol_codes] = np.asarray(fn(X), dtype=float)
+        return out
+
+    def shift(self, field: str, periods: int = 1) -> np.ndarray:
+        """`field` shifted along the date axis (positive = values from earlier dates), NaN filled."""
+        values = self.fields[field]
+        out = np.full(values.shape, np.nan, dtype=np.result_type(values, np.float32))
+        if periods > 0:
+            out[periods:] = values[:-periods]
+        elif periods < 0:
+            out[:periods] = values[-periods:]
+        else:
+            out[:] = values
+        return out
+
+    @property
+    def shape(self):
+        return (len(self.dates), len(self.symbols))
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.fields)
+
+    def get(self, field: str, default=None):
+        return self.fields.get(field, default)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    def __setitem__(self, field: str, values):
+        values = np.asarray(values)
+        if values.shape != self.shape:
+            raise ValueError(f"Field {field!r} has shape {values.shape}, panel is {self.shape}")
+        self.fields[field] = values
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.fields
+
+    def __len__(self) -> int:
+        return int(self.present.sum())
+
+    def __repr__(self) -> str:
+        return f"Panel({len(self.dates)} dates x {len(self.symbols)} symbols, fields={self.columns})"
+
+    @staticmethod
+    def _labels(df: pd.DataFrame, name: str) -> np.ndarray:
+        if name in df.columns:
+            return df[name].to_numpy()
+        if name in (df.index.names or []):
+            return df.index.get_level_values(name).to_numpy()
+        raise KeyError(f"Long frame needs a '{name}' column or index level")
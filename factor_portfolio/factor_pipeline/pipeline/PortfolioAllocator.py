@@ -1,25 +1,41 @@
+from typing import Union
 import pandas as pd
+from . import selection
+from .Panel import Panel
 
 class PortfolioAllocator:
     """
     Utility to generate portfolio weights from factor scores.
     """
 
-    def __init__(self, df: pd.DataFrame, score_col: str = "value_score"):
+    def __init__(self, df: Union[pd.DataFrame, Panel], score_col: str = "value_score"):
         self.df = df
         self.score_col = score_col
 
-    def allocate(self, method: str = "equal", top_quantile: float = 0.2) -> pd.DataFrame:
-        df = self.df.copy()
-        df["rank"] = df.groupby("date")[self.score_col].rank(ascending=False, pct=True)
-        df["selected"] = df["rank"] <= top_quantile
+    def allocate(self, method: str = "equal", top_quantile: float = 0.2, top_n: int = None) -> Union[pd.DataFrame, Panel]:
+        """
+        Per-date weights of the top `top_quantile` (or `top_n`) scores.
 
-        if method == "equal":
-            df["weight"] = df.groupby("date")["selected"].transform(lambda x: 1 / x.sum()) * df["selected"]
-        elif method == "score":
-            df["weight"] = df[self.score_col] * df["selected"]
-            df["weight"] /= df.groupby("date")["weight"].transform("sum")
-        else:
+        Returns date/symbol/score/weight rows for a DataFrame, or a Panel with the
+        score and weight fields for a Panel.
+        """
+        if method not in ("equal", "score"):
             raise ValueError("Unsupported allocation method: choose 'equal' or 'score'")
+        if isinstance(self.df, Panel):
+            scores = self.df[self.score_col].astype(float, copy=False)
+            weights = self._weights(scores, method, top_quantile, top_n)
+            return Panel(self.df.dates, self.df.symbols, {self.score_col: self.df[self.score_col], "weight": weights}, self.df.present)
 
+        df = self.df.copy()
+        _, _, matrices, positions = selection.to_dense(df, [self.score_col])
+        scores = matrices[self.score_col]
+        df["weight"] = selection.from_dense(self._weights(scores, method, top_quantile, top_n), positions)
         return df[["date", "symbol", self.score_col, "weight"]]
+
+    @staticmethod
+    def _weights(scores, method: str, top_quantile: float, top_n: int):
+        if top_n is not None:
+            selected = selection.top_n(scores, top_n)
+        else:
+            selected = selection.top_quantile(scores, top_quantile)
+        return selection.weights(selected, scores, method)
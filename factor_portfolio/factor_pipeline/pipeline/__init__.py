@@ -1,15 +1,22 @@
 from .Backtester import Backtester
 from .FeatureTransformer import FeatureTransformer
 from .PortfolioAllocator import PortfolioAllocator
-from .utils import load_yaml_config, compute_cagr, compute_sharpe, compute_drawdown
+from .Panel import Panel
+from . import selection
+from . import rebalance
+from .utils import load_yaml_config, compute_cagr, compute_sharpe, compute_drawdown, infer_periods_per_year
 
 __all__ = [
     "Backtester",
     "FeatureTransformer",
     "PortfolioAllocator",
+    "Panel",
+    "selection",
+    "rebalance",
     "load_yaml_config",
     "compute_cagr",
     "compute_sharpe",
-    "compute_drawdown"
+    "compute_drawdown",
+    "infer_periods_per_year"
 ]
 
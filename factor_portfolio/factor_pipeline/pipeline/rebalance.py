@@ -0,0 +1,111 @@
+"""
+Rebalance calendars and the holdings simulation behind Backtester.simulate.
+
+Target weights are (date x symbol) matrices from the selection kernel; the simulation
+walks the date axis once, trading to target on rebalance dates, charging turnover
+costs and letting holdings drift with returns in between. Every step is vectorized
+across symbols, and across any leading variant axes of the targets.
+"""
+from typing import Dict, Optional, Union
+import numpy as np
+import pandas as pd
+
+# Calendar rebalance frequencies -> pandas period; "threshold" only trades on drift
+REBALANCE_FREQUENCIES = {
+    "daily": "D",
+    "weekly": "W",
+    "monthly": "M",
+    "quarterly": "Q",
+    "annual": "Y",
+    "threshold": None,
+}
+# Drift (share of the portfolio that would have to trade, sum |held - target| / 2)
+# that triggers a trade for rebalance="threshold"
+DEFAULT_DRIFT_THRESHOLD = 0.05
+
+def calendar(dates: pd.Index, frequency: str) -> np.ndarray:
+    """
+    Rebalance mask over `dates`: the first date of each calendar period (and always the
+    first date, which opens the portfolio).
+    """
+    if frequency not in REBALANCE_FREQUENCIES:
+        raise ValueError(f"frequency must be one of {list(REBALANCE_FREQUENCIES)}, got {frequency!r}")
+    mask = np.zeros(len(dates), dtype=bool)
+    mask[:1] = True
+    period = REBALANCE_FREQUENCIES[frequency]
+    if period is not None and len(dates) > 1:
+        periods = pd.DatetimeIndex(pd.to_datetime(dates)).to_period(period).asi8
+        mask[1:] = periods[1:] != periods[:-1]
+    return mask
+
+
+def simulate(
+    targets: np.ndarray,
+    returns: np.ndarray,
+    rebalance: np.ndarray,
+    threshold: Optional[Union[float, np.ndarray]] = None,
+    cost_bps: Union[float, np.ndarray] = 0.0,
+    target_index: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Walks holdings through the date axis.
+
+    On each date the portfolio trades to that date's target weights if it is a rebalance
+    date, or if `threshold` is set and the holdings have drifted more than `threshold`
+    from the target (sum |held - target| / 2, the share of the portfolio that would
+    trade). Dates with no target (nothing selected) never trade. Trades cost `cost_bps`
+    per unit of turnover (sum of |weight change|). Holdings then earn `returns` (forward
+    returns, date t to t+1; NaN earns 0) and drift with them.
+
+    Args:
+        targets: (..., date, symbol) target weights; leading axes are variants
+        returns: (date, symbol) forward returns
+        rebalance: (..., date) calendar rebalance mask, broadcastable to the variants
+        threshold: drift trigger, scalar or per variant
+        cost_bps: cost per unit turnover in basis points, scalar or per variant
+        target_index: For (target, date, symbol) targets shared by several variants, the
+            target row of each variant; variants that differ only in calendar, threshold
+            or costs then reuse one target matrix
+
+    Returns:
+        (..., date) arrays: gross_return, cost, net_return, turnover, rebalanced
+    """
+    targets = np.asarray(targets, dtype=float)
+    if np.isnan(targets).any():
+        targets = np.nan_to_num(targets, nan=0.0)
+    returns = np.nan_to_num(np.asarray(returns, dtype=float), nan=0.0)
+    n_dates, n_symbols = targets.shape[-2:]
+    variants = targets.shape[:-2] if target_index is None else np.shape(target_index)
+    rebalance = np.broadcast_to(rebalance, variants + (n_dates,))
+    cost_rate = np.broadcast_to(np.asarray(cost_bps, dtype=float) / 1e4, variants)
+    threshold = None if threshold is None else np.broadcast_to(np.asarray(threshold, dtype=float), variants)
+    has_target = np.abs(targets).sum(axis=-1) > 0
+    if target_index is not None:
+        has_target = has_target[target_index]
+
+    out = {name: np.zeros(variants + (n_dates,)) for name in ("gross_return", "cost", "net_return", "turnover")}
+    out["rebalanced"] = np.zeros(variants + (n_dates,), dtype=bool)
+    held = np.zeros(variants + (n_symbols,))
+    for t in range(n_dates):
+        target = targets[..., t, :] if target_index is None else targets[target_index, t]
+        trade = rebalance[..., t].copy()
+        if threshold is not None:
+            trade |= np.abs(held - target).sum(axis=-1) / 2 > threshold
+        trade &= has_target[..., t]
+
+        change = np.where(trade[..., None], target - held, 0.0)
+        turnover = np.abs(change).sum(axis=-1)
+        held = held + change
+        gross = (held * returns[t]).sum(axis=-1)
+        cost = turnover * cost_rate
+
+        out["rebalanced"][..., t] = trade
+        out["turnover"][..., t] = turnover
+        out["gross_return"][..., t] = gross
+        out["cost"][..., t] = cost
+        out["net_return"][..., t] = gross - cost
+        # Drift: each holding's share of the portfolio after the period's returns
+        growth = 1 + gross
+        with np.errstate(invalid="ignore", divide="ignore"):
+            held = np.where(growth[..., None] > 0, held * (1 + returns[t]) / growth[..., None], 0.0)
+    return out
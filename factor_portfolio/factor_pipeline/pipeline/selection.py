@@ -0,0 +1,196 @@
+"""
+Cross-sectional selection kernel shared by Backtester and PortfolioAllocator.
+
+Everything works on dense (date x symbol) matrices with NaN for missing data, ranking
+along the last axis. Extra leading axes are parameter variants: pass an array of
+quantiles (or N) and a whole grid is selected, weighted and evaluated in one NumPy pass.
+"""
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+def to_dense(
+    df: pd.DataFrame, columns: List[str], date_col: str = "date", symbol_col: str = "symbol"
+) -> Tuple[pd.Index, pd.Index, Dict[str, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Pivots long-format columns into (date x symbol) float matrices.
+
+    Returns:
+        dates (sorted), symbols, {column: matrix}, and the (date, symbol) position of
+        every df row (-1 for rows without a date or symbol) for mapping results back.
+    """
+    date_codes, dates = pd.factorize(df[date_col], sort=True)
+    symbol_codes, symbols = pd.factorize(df[symbol_col], sort=True)
+    valid = (date_codes >= 0) & (symbol_codes >= 0)
+    matrices = {}
+    for col in columns:
+        matrix = np.full((len(dates), len(symbols)), np.nan)
+        matrix[date_codes[valid], symbol_codes[valid]] = df[col].to_numpy(dtype=float)[valid]
+        matrices[col] = matrix
+    return pd.Index(dates, name=date_col), pd.Index(symbols, name=symbol_col), matrices, (date_codes, symbol_codes)
+
+
+def from_dense(matrix: np.ndarray, positions: Tuple[np.ndarray, np.ndarray], fill: float = np.nan) -> np.ndarray:
+    """Reads a (date x symbol) matrix back out at the row positions returned by `to_dense`."""
+    date_codes, symbol_codes = positions
+    valid = (date_codes >= 0) & (symbol_codes >= 0)
+    out = np.full(len(date_codes), fill)
+    out[valid] = matrix[date_codes[valid], symbol_codes[valid]]
+    return out
+
+
+def average_ranks(values: np.ndarray) -> np.ndarray:
+    """1-based ascending ranks along the last axis with ties averaged (as pandas rank), NaN for NaN."""
+    values = np.ascontiguousarray(values, dtype=float)
+    order = np.argsort(values, axis=-1)
+    ordered = np.take_along_axis(values, order, axis=-1)
+    n = values.shape[-1]
+    index = np.broadcast_to(np.arange(n), values.shape)
+
+    # Runs of equal values in sorted order share the mean of their first and last position
+    run_start = np.ones(values.shape, dtype=bool)
+    run_start[..., 1:] = ordered[..., 1:] != ordered[..., :-1]
+    run_end = np.ones(values.shape, dtype=bool)
+    run_end[..., :-1] = run_start[..., 1:]
+    first = np.maximum.accumulate(np.where(run_start, index, 0), axis=-1)
+    last = np.minimum.accumulate(np.where(run_end, index, n)[..., ::-1], axis=-1)[..., ::-1]
+
+    ranks = np.empty(values.shape)
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=-1)
+    ranks[np.isnan(values)] = np.nan
+    return ranks
+
+
+def descending_pct_ranks(scores: np.ndarray) -> np.ndarray:
+    """Per-date percentile rank with the highest score at 1/n, as rank(ascending=False, pct=True)."""
+    counts = (~np.isnan(scores)).sum(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (counts + 1 - average_ranks(scores)) / counts
+
+
+def top_quantile(scores: np.ndarray, quantile: Union[float, np.ndarray], pct_ranks: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Selects the top `quantile` of each date's scores.
+
+    `quantile` may be an array of variants; the result then gains its shape as leading axes.
+    Pass precomputed `descending_pct_ranks(scores)` to reuse them across calls.
+    """
+    pct_ranks = descending_pct_ranks(scores) if pct_ranks is None else pct_ranks
+    quantile = np.asarray(quantile, dtype=float)
+    with np.errstate(invalid="ignore"):
+        return pct_ranks <= quantile.reshape(quantile.shape + (1,) * pct_ranks.ndim)
+
+
+def top_n(scores: np.ndarray, n: Union[int, np.ndarray]) -> np.ndarray:
+    """Selects the `n` highest scores per date (ties broken by symbol order); `n` may be an array of variants."""
+    order = np.argsort(-scores, axis=-1, kind="stable")  # NaN sorts last
+    positions = np.empty(scores.shape)
+    np.put_along_axis(positions, order, np.broadcast_to(np.arange(1, scores.shape[-1] + 1), scores.shape), axis=-1)
+    n = np.asarray(n)
+    return (positions <= n.reshape(n.shape + (1,) * scores.ndim)) & ~np.isnan(scores)
+
+
+def quantile_weights(
+    scores: np.ndarray,
+    quantiles: Union[float, np.ndarray],
+    score_weighted: Union[bool, np.ndarray] = False,
+    long_short: Union[bool, np.ndarray] = False,
+    ranks: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Target weights of top-quantile portfolios, with per-variant weighting and long-short flags.
+
+    The long leg holds the top `quantile` of each date's scores and sums to 1; long-short
+    variants also short the bottom `quantile` with weights summing to -1 (score weighting
+    uses -score on that leg). Dates with nothing selected get all-zero weights.
+    `quantiles`, `score_weighted` and `long_short` broadcast to the variant axes prepended
+    to the result. Pass precomputed `average_ranks(scores)` to reuse them across calls.
+    """
+    ranks = average_ranks(scores) if ranks is None else ranks
+    counts = (~np.isnan(scores)).sum(axis=-1, keepdims=True)
+    variants = np.broadcast_shapes(np.shape(quantiles), np.shape(score_weighted), np.shape(long_short))
+    shape = variants + (1,) * scores.ndim
+    quantiles = np.broadcast_to(np.asarray(quantiles, dtype=float), variants).reshape(shape)
+    score_weighted = np.broadcast_to(score_weighted, variants).reshape(shape)
+    long_short = np.broadcast_to(long_short, variants).reshape(shape)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        top = (counts + 1 - ranks) / counts <= quantiles
+        bottom = ranks / counts <= quantiles
+    weights = _leg_weights(top, scores, score_weighted)
+    if long_short.any():
+        weights -= np.where(long_short, _leg_weights(bottom, -scores, score_weighted), 0.0)
+    return weights
+
+
+def _leg_weights(selected: np.ndarray, scores: np.ndarray, score_weighted: np.ndarray) -> np.ndarray:
+    raw = np.where(selected, np.where(score_weighted, scores, 1.0), 0.0)
+    total = raw.sum(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total != 0, raw / total, 0.0)
+
+
+def weights(selected: np.ndarray, scores: Optional[np.ndarray] = None, method: str = "equal") -> np.ndarray:
+    """
+    Per-date portfolio weights of the selected symbols, summing to 1 on dates with a selection.
+
+    method:
+        "equal": 1 / number selected
+        "score": score / sum of selected scores
+    """
+    if method == "equal":
+        raw = selected.astype(float)
+    elif method == "score":
+        if scores is None:
+            raise ValueError("scores are required for score weighting")
+        raw = np.where(selected, scores, 0.0)
+    else:
+        raise ValueError("method must be 'equal' or 'score'")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return raw / raw.sum(axis=-1, keepdims=True)
+
+
+def portfolio_returns(weights: np.ndarray, returns: np.ndarray) -> np.ndarray:
+    """Weighted return per date (and variant); symbols without a return contribute nothing."""
+    return np.nansum(weights * returns, axis=-1)
+
+
+def quantile_sweep(scores: np.ndarray, returns: np.ndarray, quantiles: np.ndarray, method: str = "equal") -> np.ndarray:
+    """
+    Portfolio return per (quantile, date) of top-quantile portfolios, for any number of quantiles.
+
+    Each date's names are sorted by rank once; a top-quantile portfolio is then a prefix of
+    that order, so its return is read off prefix sums instead of re-selecting per quantile.
+    Matches top_quantile + weights + portfolio_returns for every quantile.
+    """
+    if method not in ("equal", "score"):
+        raise ValueError("method must be 'equal' or 'score'")
+    pct_ranks = descending_pct_ranks(scores)
+    order = np.argsort(pct_ranks, axis=-1)  # best first, NaN scores last
+    sorted_pct = np.take_along_axis(pct_ranks, order, axis=-1)
+    sorted_returns = np.take_along_axis(np.nan_to_num(returns, nan=0.0), order, axis=-1)
+    if method == "equal":
+        sorted_weights = (~np.isnan(sorted_pct)).astype(float)
+    else:
+        sorted_weights = np.take_along_axis(np.nan_to_num(scores, nan=0.0), order, axis=-1)
+
+    # Prefix sums with a leading 0 so that a portfolio of k names reads position k
+    zeros = np.zeros(scores.shape[:-1] + (1,))
+    weighted = np.concatenate([zeros, np.cumsum(sorted_weights * sorted_returns, axis=-1)], axis=-1)
+    total = np.concatenate([zeros, np.cumsum(sorted_weights, axis=-1)], axis=-1)
+
+    quantiles = np.asarray(quantiles, dtype=float).ravel()
+    # Names selected per (quantile, date), from one searchsorted over all dates: each date's
+    # sorted ranks are shifted into their own disjoint interval [date * span, (date + 1) * span),
+    # with NaN moved past every quantile, so the flattened array stays sorted
+    n_dates, n_symbols = sorted_pct.shape
+    span = max(np.nanmax(quantiles, initial=1.0), 1.0) + 2.0
+    offsets = np.arange(n_dates) * span
+    flat = (np.nan_to_num(sorted_pct.astype(float), nan=span - 1.0) + offsets[:, None]).ravel()
+    bounds = np.clip(quantiles, 0.0, None)[:, None] + offsets
+    sizes = np.searchsorted(flat, bounds, side="right") - np.arange(n_dates) * n_symbols
+    date_index = np.arange(n_dates)
+    numerator = weighted[date_index, sizes]
+    denominator = total[date_index, sizes]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(denominator != 0, numerator / denominator, 0.0)
@@ -11,9 +11,14 @@ def compute_cagr(series: pd.Series) -> float:
     n_years = (series.index[-1] - series.index[0]).days / 365.25
     return (end_val / start_val) ** (1 / n_years) - 1
 
-def compute_sharpe(returns: pd.Series, risk_free_rate: float = 0.0) -> float:
+def compute_sharpe(returns: pd.Series, risk_free_rate: float = 0.0, periods_per_year: float = 12) -> float:
     excess_returns = returns - risk_free_rate
-    return (excess_returns.mean() / excess_returns.std()) * (12 ** 0.5)
+    return (excess_returns.mean() / excess_returns.std()) * (periods_per_year ** 0.5)
+
+def infer_periods_per_year(index: pd.DatetimeIndex) -> float:
+    """Observations per year of a date index, e.g. ~252 for trading days."""
+    n_years = (index[-1] - index[0]).days / 365.25
+    return (len(index) - 1) / n_years
 
 def compute_drawdown(cumulative_returns: pd.Series) -> pd.Series:
     peak = cumulative_returns.cummax()
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import pandas as pd
+from typing import List
 
 import os, sys
 from pathlib import Path
@@ -48,39 +49,53 @@ class BaseFetcher(ABC):
         """
         if periodic_df.empty:
             return price_df.set_index(["symbol", "date"])
+        return self.expand_periodic_sources(price_df, [periodic_df])
 
-        # Ensure proper types and sort
-        price_df = price_df.copy()
-        periodic_df = periodic_df.copy()
-        price_df["date"] = pd.to_datetime(price_df["date"])
-        periodic_df["date"] = pd.to_datetime(periodic_df["date"])
-        price_df.sort_values(["symbol", "date"], inplace=True)
-        periodic_df.sort_values(["symbol", "date"], inplace=True)
+    def expand_periodic_sources(self, price_df: pd.DataFrame, periodic_dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Aligns several periodic sources to the price calendar in one pass.
 
-        # Columns to propagate
-        value_cols = [col for col in periodic_df.columns if col not in {"symbol", "date"}]
+        The calendar is sorted once; each source is then matched for all symbols with a
+        single `merge_asof(..., by=symbol)` (latest row on or before each price date).
+        A column already provided by price_df or an earlier source is not taken again.
 
-        # Output rows
-        expanded = []
+        Args:
+            price_df: Daily price data. Must contain 'symbol' and 'date'.
+            periodic_dfs: Periodic sources, each with 'symbol', 'date' and value columns.
 
-        for symbol in price_df["symbol"].unique():
-            price_sym = price_df[price_df["symbol"] == symbol].copy()
-            periodic_sym = periodic_df[periodic_df["symbol"] == symbol].copy()
+        Returns:
+            price_df columns plus every source's value columns, indexed and sorted by (symbol, date).
+        """
+        calendar = price_df.copy()
+        calendar["date"] = pd.to_datetime(calendar["date"])
+        # Shared integer symbol codes: merge_asof needs identical `by` dtypes on both sides
+        symbols = pd.Index(pd.unique(calendar["symbol"].astype(str)))
+        calendar["_symbol"] = symbols.get_indexer(calendar["symbol"].astype(str))
+        calendar = calendar.sort_values("date", kind="stable")
 
-            if periodic_sym.empty:
-                price_sym.set_index(["symbol", "date"], inplace=True)
-                expanded.append(price_sym)
+        aligned = [calendar]
+        seen = set(calendar.columns)
+        for periodic_df in periodic_dfs:
+            value_cols = [col for col in periodic_df.columns if col not in seen]
+            if periodic_df.empty or not value_cols:
                 continue
+            seen.update(value_cols)
+
+            periodic = periodic_df[["symbol", "date"] + value_cols].copy()
+            periodic["date"] = pd.to_datetime(periodic["date"])
+            periodic["_symbol"] = symbols.get_indexer(periodic["symbol"].astype(str))
+            periodic = periodic[periodic["_symbol"] >= 0].sort_values("date", kind="stable")
 
-            # Merge on date, forward-fill values
             merged = pd.merge_asof(
-                price_sym.sort_values("date"),
-                periodic_sym[["date"] + value_cols].sort_values("date"),
+                calendar[["date", "_symbol"]],
+                periodic[["date", "_symbol"] + value_cols],
                 on="date",
+                by="_symbol",
                 direction="backward"
             )
-            merged["symbol"] = symbol
-            merged.set_index(["symbol", "date"], inplace=True)
-            expanded.append(merged)
+            # merge_asof keeps the calendar's row order
+            merged.index = calendar.index
+            aligned.append(merged[value_cols])
 
-        return pd.concat(expanded).sort_index()
+        expanded = pd.concat(aligned, axis=1).drop(columns=["_symbol"])
+        return expanded.set_index(["symbol", "date"]).sort_index()
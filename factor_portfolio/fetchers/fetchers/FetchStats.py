@@ -0,0 +1,46 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, List
+import pandas as pd
+
+@dataclass
+class QueryStat:
+    name: str
+    rows: int
+    seconds: float
+
+
+@dataclass
+class FetchStats:
+    """
+    What one fetch() call did: every source query with its row count and duration,
+    whether the panel came from cache, and the wall time of the whole call.
+    """
+    queries: List[QueryStat] = field(default_factory=list)
+    cache_hit: bool = False
+    seconds: float = 0.0
+
+    def run(self, name: str, query: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call `query(*args, **kwargs)` and record its duration and result size under `name`."""
+        start = time.perf_counter()
+        result = query(*args, **kwargs)
+        self.queries.append(QueryStat(name, len(result), time.perf_counter() - start))
+        return result
+
+    @property
+    def total_rows(self) -> int:
+        return sum(query.rows for query in self.queries)
+
+    @property
+    def query_seconds(self) -> float:
+        return sum(query.seconds for query in self.queries)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([vars(query) for query in self.queries], columns=["name", "rows", "seconds"])
+
+    def __str__(self) -> str:
+        if self.cache_hit:
+            return f"panel cache hit in {self.seconds:.3f}s"
+        lines = [f"{len(self.queries)} queries, {self.total_rows} rows, {self.query_seconds:.3f}s querying / {self.seconds:.3f}s total"]
+        lines += [f"  {query.name:<20} {query.rows:>9} rows {query.seconds:8.3f}s" for query in self.queries]
+        return "\n".join(lines)
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, Dict, Optional
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+class PanelCache:
+    """
+    On-disk cache of fetched (symbol, date) feature panels.
+
+    Each request (fetcher, symbols, date range, ...) maps to one pickle file holding the
+    panel together with the fetcher's `version` and the `stamp` of its data source
+    (e.g. the database file's size and mtime). A load whose version or stamp no longer
+    matches is a miss, and the next `store` overwrites the stale file, so entries are
+    invalidated as soon as the underlying data changes.
+
+    Entries of requests that are never repeated (e.g. built from an older stamp) are
+    evicted least recently used first once the files exceed `max_bytes`; a hit
+    refreshes the file's mtime.
+
+    Args:
+        cache_dir: Directory holding the cached panels.
+        version: Bumped by the fetcher whenever its output for the same request changes.
+        max_bytes: Upper bound on the size of all cached panel files.
+    """
+    def __init__(self, cache_dir: str, version: int = 1, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.version = version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Stable key for a request dict (order of keys does not matter)."""
+        payload = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def _path(self, request: Dict[str, Any]) -> str:
+        return os.path.join(self.cache_dir, f"{self.make_key(request)}.pkl")
+
+    def load(self, request: Dict[str, Any], stamp: Any) -> Optional[pd.DataFrame]:
+        """Cached panel for `request` if it was built from data with the same `stamp`."""
+        path = self._path(request)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable panel cache entry {path}: {e}")
+            self.misses += 1
+            return None
+
+        if entry.get("version") != self.version or entry.get("stamp") != stamp:
+            self.stale += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        os.utime(path)
+        return entry["frame"]
+
+    def store(self, request: Dict[str, Any], stamp: Any, frame: pd.DataFrame):
+        """
+        Write the panel atomically, replacing any stale entry for the same request, then
+        evict least recently used entries over `max_bytes`.
+        """
+        entry = {"version": self.version, "stamp": stamp, "request": request, "frame": frame}
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(request))
+        except Exception as e:
+            logger.warning(f"Failed to write panel cache entry: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict(keep=self._path(request))
+
+    def _evict(self, keep: str):
+        """Remove the least recently used entries (never `keep`) until the cache fits in `max_bytes`."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".pkl"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((info.st_mtime, info.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        files = [name for name in os.listdir(self.cache_dir) if name.endswith(".pkl")]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(files),
+            "bytes": sum(os.path.getsize(os.path.join(self.cache_dir, name)) for name in files),
+        }
@@ -1,17 +1,95 @@
 from fetchers.fetchers.BaseFetcher import BaseFetcher
+from fetchers.fetchers.PanelCache import PanelCache
+from fetchers.fetchers.FetchStats import FetchStats
+import logging
+import os
+import time
+import numpy as np
 import pandas as pd
+from pathlib import Path
 from typing import Union, List
 from dateutil.relativedelta import relativedelta
+from database.database.services import ParquetGetter, ParquetSnapshot
+from database.database.services.ParquetSnapshot import MANIFEST_FILE
+from factor_pipeline.pipeline.Panel import Panel
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever fetch() would return a different panel for the same request and data
+PANEL_VERSION = 2
+DEFAULT_PANEL_CACHE_DIR = Path(__file__).parent.parent.parent.parent / 'database' / 'cache' / 'value_panel'
+DEFAULT_PANEL_CACHE_MAX_BYTES = 2 * 1024 ** 3
+# Value columns read from each source table (besides symbol and date)
+EARNINGS_COLUMNS = ["eps_actual"]
+KEY_METRICS_COLUMNS = [
+    "earnings_yield", "free_cash_flow_yield", "graham_number",
+    "return_on_equity", "return_on_assets", "enterprise_value"
+]
+# book_value_per_share is only read to backfill graham_number, not returned
+RATIO_COLUMNS = [
+    "price_to_earnings_ratio", "price_to_book_ratio",
+    "price_to_sales_ratio", "price_to_free_cash_flow_ratio", "book_value_per_share"
+]
+# fetch_date ignores prices and market caps older than this many days before the as-of date
+AS_OF_PRICE_LOOKBACK_DAYS = 7
 
 class ValueFactorFetch(BaseFetcher):
     def __init__(self, config: dict = None):
         super().__init__(config=config)
+        # Columnar getters: typed DataFrames straight from the cursor (or a Parquet snapshot), no dict per row
+        self.snapshot_path = self.config.get("snapshot_path")
+        self.frames = ParquetGetter(ParquetSnapshot(self.snapshot_path)) if self.snapshot_path else self.getter.with_format("frame")
+        # Aligned panels are kept on disk and reused until the source data changes
+        self.panel_cache = None
+        if self.config.get("panel_cache", True):
+            cache_dir = self.config.get("panel_cache_dir") or DEFAULT_PANEL_CACHE_DIR
+            max_bytes = self.config.get("panel_cache_max_bytes", DEFAULT_PANEL_CACHE_MAX_BYTES)
+            self.panel_cache = PanelCache(str(cache_dir), version=PANEL_VERSION, max_bytes=max_bytes)
+        self.last_stats = FetchStats()
 
     def fetch(self, symbol: Union[str, List[str]], start_date: str = None, end_date: str = None) -> pd.DataFrame:
         start_date = pd.to_datetime(start_date or self.default_start_date)
         end_date = pd.to_datetime(end_date or self.default_end_date)
         symbols = [symbol] if isinstance(symbol, str) else symbol
+        # Queries, rows and timings of this call; kept until the next fetch
+        self.last_stats = FetchStats()
+        started = time.perf_counter()
+
+        if self.panel_cache is None:
+            panel = self._build_panel(symbols, start_date, end_date)
+        else:
+            request = {
+                "fetcher": type(self).__name__,
+                "source": self.snapshot_path or self.getter.db.db_path,
+                "symbols": sorted(set(symbols)),
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+            }
+            # Taken before reading, so data written during the build leaves the entry stale
+            stamp = self._source_stamp()
+            panel = self.panel_cache.load(request, stamp)
+            self.last_stats.cache_hit = panel is not None
+            if panel is None:
+                panel = self._build_panel(symbols, start_date, end_date)
+                self.panel_cache.store(request, stamp, panel)
+
+        self.last_stats.seconds = time.perf_counter() - started
+        logger.debug(f"ValueFactorFetch stats for {len(symbols)} symbols: {self.last_stats}")
+        return panel
 
+    def fetch_panel(self, symbol: Union[str, List[str]], start_date: str = None, end_date: str = None,
+                    columns: List[str] = None, dtype=np.float64) -> Panel:
+        """
+        Same data as `fetch`, as a dense date x symbol Panel for the factor pipeline.
+
+        Args:
+            columns: Fields to keep; defaults to every numeric column
+            dtype: Field dtype, e.g. np.float32 to halve memory
+        """
+        return Panel.from_frame(self.fetch(symbol, start_date, end_date), columns, dtype=dtype)
+
+    def _build_panel(self, symbols: List[str], start_date: pd.Timestamp, end_date: pd.Timestamp) -> pd.DataFrame:
+        # Query plan: each table is read once; the price frame doubles as the alignment calendar
         prices = self._fetch_prices(symbols, start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
         data_sources_start_date = (start_date - relativedelta(years=1)).strftime("%Y-%m-%d")
         data_sources = self._fetch_all_data_sources(symbols, data_sources_start_date, end_date.strftime("%Y-%m-%d"))
@@ -24,116 +102,160 @@ class ValueFactorFetch(BaseFetcher):
 
         if combined_df.empty:
             raise ValueError("No data available after combining all sources")
+        # Categorical symbols from the columnar getters; callers get plain string labels
+        symbol_level = combined_df.index.levels[0]
+        if isinstance(symbol_level, pd.CategoricalIndex):
+            combined_df.index = combined_df.index.set_levels(symbol_level.astype(str), level=0)
         return combined_df
 
+    def fetch_date(self, symbol: Union[str, List[str]] = None, date: str = None) -> pd.DataFrame:
+        """
+        Cross-sectional snapshot for rebalance scoring: one row per symbol with its latest
+        price, fundamentals and market cap as of `date`, from one as-of query per table.
+
+        Args:
+            symbol: Symbol or list of symbols; None takes every symbol with a recent price
+            date: As-of date (default: default_end_date)
+
+        Returns:
+            DataFrame indexed by (symbol, date) with fetch()'s columns, date set to `date`.
+        """
+        as_of = pd.to_datetime(date or self.default_end_date)
+        symbols = [symbol] if isinstance(symbol, str) else symbol
+        self.last_stats = FetchStats()
+        started = time.perf_counter()
+
+        day = as_of.strftime("%Y-%m-%d")
+        price_start = (as_of - pd.Timedelta(days=AS_OF_PRICE_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+        fundamentals_start = (as_of - relativedelta(years=1)).strftime("%Y-%m-%d")
+        as_of_query = self.frames.market_data.get_as_of
+
+        prices = self.last_stats.run("price", as_of_query, "price", day, symbols, ["symbol", "close"], price_start)
+        if prices.empty:
+            raise ValueError(f"No prices found on or before {day}")
+        earnings = self.last_stats.run("earnings", as_of_query, "earnings", day, symbols, ["symbol", "date"] + EARNINGS_COLUMNS, fundamentals_start)
+        key_metrics = self.last_stats.run("key_metrics", as_of_query, "key_metrics", day, symbols, ["symbol", "date"] + KEY_METRICS_COLUMNS, fundamentals_start)
+        ratios = self.last_stats.run("financial_ratios", as_of_query, "financial_ratios", day, symbols, ["symbol", "date"] + RATIO_COLUMNS, fundamentals_start)
+
+        if not key_metrics.empty and not earnings.empty:
+            cleaned = self._clean_null_graham_number(key_metrics, earnings, ratios)
+            # A latest row whose graham number can't be filled is dropped; fetch() then uses the
+            # symbol's previous usable row, so look those symbols up over the whole window
+            dropped = sorted(set(key_metrics["symbol"].astype(str)) - set(cleaned["symbol"].astype(str)))
+            if dropped:
+                cleaned = pd.concat([cleaned, self._latest_usable_key_metrics(dropped, fundamentals_start, day)])
+            key_metrics = cleaned
+        sources = [earnings, key_metrics, ratios.drop(columns=["book_value_per_share"])]
+        if key_metrics.empty:
+            sources.append(self.last_stats.run(
+                "enterprise_values", as_of_query, "enterprise_values", day, symbols, ["symbol", "date", "enterprise_value"], fundamentals_start
+            ))
+        sources.append(self.last_stats.run("market_cap", as_of_query, "market_cap", day, symbols, ["symbol", "market_cap"], price_start))
+
+        # Same column precedence as _combine_data_sources: earlier sources win
+        snapshot = prices.assign(symbol=prices["symbol"].astype(str)).set_index("symbol")
+        for src in sources:
+            value_cols = [col for col in src.columns if col not in {"symbol", "date"} and col not in snapshot.columns]
+            if src.empty or not value_cols:
+                continue
+            snapshot = snapshot.join(src.assign(symbol=src["symbol"].astype(str)).set_index("symbol")[value_cols], how="left")
+
+        snapshot = snapshot.assign(date=as_of).set_index("date", append=True).sort_index()
+        self.last_stats.seconds = time.perf_counter() - started
+        logger.debug(f"ValueFactorFetch fetch_date stats for {len(snapshot)} symbols: {self.last_stats}")
+        return snapshot
+
+    def _latest_usable_key_metrics(self, symbols: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+        """Latest key_metrics row per symbol that survives _clean_null_graham_number, as fetch() aligns it."""
+        metrics = self.frames.financial_metrics
+        key_metrics = self.last_stats.run("key_metrics", metrics.get_key_metrics, symbols, start_date, end_date, ["symbol", "date"] + KEY_METRICS_COLUMNS)
+        earnings = self.last_stats.run("earnings", metrics.get_earnings, symbols, start_date, end_date, ["symbol", "date"] + EARNINGS_COLUMNS)
+        ratios = self.last_stats.run("financial_ratios", metrics.get_financial_ratios, symbols, start_date, end_date, ["symbol", "date"] + RATIO_COLUMNS)
+        if not key_metrics.empty and not earnings.empty:
+            key_metrics = self._clean_null_graham_number(key_metrics, earnings, ratios)
+        return key_metrics.sort_values("date").groupby("symbol", observed=True).tail(1)
+
+    def _source_stamp(self) -> List[list]:
+        """Size and mtime of the files backing the data source; any write changes it."""
+        if self.snapshot_path:
+            paths = [os.path.join(self.snapshot_path, MANIFEST_FILE)]
+        else:
+            db_path = self.getter.db.db_path
+            paths = [db_path, db_path + "-wal"]
+        stamp = []
+        for path in paths:
+            # An empty WAL only means a connection is open, not that data changed
+            if os.path.exists(path) and os.path.getsize(path) > 0:
+                stat = os.stat(path)
+                stamp.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+        return stamp
 
     def _fetch_prices(self, symbols: List[str], start_date: str, end_date: str) -> pd.DataFrame:
         # Include 1 day prior to ensure the first row has prior price
         padded_start = (pd.to_datetime(start_date) - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
-        prices = self.getter.market_data.get_price_data(symbols, padded_start, end_date, ["symbol", "date", "close"])
-        if not prices:
+        prices_df = self.last_stats.run(
+            "price", self.frames.market_data.get_price_data,
+            symbols, padded_start, end_date, ["symbol", "date", "close"]
+        )
+        if prices_df.empty:
             raise ValueError(f"No prices data found for {symbols}")
-        prices_df = pd.DataFrame(prices)
-        prices_df["date"] = pd.to_datetime(prices_df["date"])
         return prices_df
     
     def _fetch_market_cap(self, symbols, start_date, end_date):
-        raw = self.getter.market_data.get_market_cap(
+        # Aligned to the price calendar together with the periodic sources in _combine_data_sources
+        return self.last_stats.run(
+            "market_cap", self.frames.market_data.get_market_cap,
             symbols,
             (pd.to_datetime(start_date) - pd.Timedelta(days=5)).strftime("%Y-%m-%d"),
             end_date,
             ["symbol", "date", "market_cap"]
         )
-        mc = pd.DataFrame(raw)
-        if mc.empty:
-            return mc
-        mc["date"] = pd.to_datetime(mc["date"])
-        mc = mc.sort_values(["date", "symbol"])   # date PRIMARY, symbol SECONDARY
-
-        prices = self._fetch_prices(symbols, start_date, end_date)
-        calendar = (
-            prices[["symbol", "date"]]
-            .drop_duplicates()
-            .assign(date=lambda df: pd.to_datetime(df["date"]))
-            .sort_values(["date", "symbol"])        # same ordering!
-        )
-
-        merged = pd.merge_asof(
-            calendar,
-            mc,
-            on="date",
-            by="symbol",
-            direction="backward",
-            allow_exact_matches=True
-        )
-        return merged[["symbol", "date", "market_cap"]]
 
     def _fetch_all_data_sources(self, symbols: List[str], start_date: str, end_date: str) -> List[pd.DataFrame]:
-        sources = [
-            self.getter.financial_metrics.get_earnings(symbols, start_date, end_date, ["symbol", "date", "eps_actual"]),
-            self.getter.financial_metrics.get_key_metrics(symbols, start_date, end_date, [
-                "symbol", "date", "earnings_yield", "free_cash_flow_yield", "graham_number", 
-                "return_on_equity", "return_on_assets", "enterprise_value"
-            ]),
-            self.getter.financial_metrics.get_financial_ratios(symbols, start_date, end_date, [
-                "symbol", "date", "price_to_earnings_ratio", "price_to_book_ratio",
-                "price_to_sales_ratio", "price_to_free_cash_flow_ratio"
-            ]),
-            self.getter.valuation.get_enterprise_values(symbols, start_date, end_date, [
-                "symbol", "date", "enterprise_value"
-            ])
-        ]
-        dfs = [pd.DataFrame(df) for df in sources if df]
-
-        if len(dfs) >= 2 and not dfs[1].empty and not dfs[0].empty:
-            dfs[1] = self._clean_null_graham_number(dfs[1], dfs[0])
+        metrics = self.frames.financial_metrics
+        earnings = self.last_stats.run("earnings", metrics.get_earnings, symbols, start_date, end_date, ["symbol", "date"] + EARNINGS_COLUMNS)
+        key_metrics = self.last_stats.run("key_metrics", metrics.get_key_metrics, symbols, start_date, end_date, ["symbol", "date"] + KEY_METRICS_COLUMNS)
+        ratios = self.last_stats.run("financial_ratios", metrics.get_financial_ratios, symbols, start_date, end_date, ["symbol", "date"] + RATIO_COLUMNS)
+
+        if not key_metrics.empty and not earnings.empty:
+            key_metrics = self._clean_null_graham_number(key_metrics, earnings, ratios)
+        ratios = ratios.drop(columns=["book_value_per_share"])
+
+        dfs = [df for df in (earnings, key_metrics, ratios) if not df.empty]
+        # key_metrics already carries enterprise_value; the enterprise_values table is only a fallback
+        if key_metrics.empty:
+            enterprise_values = self.last_stats.run(
+                "enterprise_values", self.frames.valuation.get_enterprise_values,
+                symbols, start_date, end_date, ["symbol", "date", "enterprise_value"]
+            )
+            if not enterprise_values.empty:
+                dfs.append(enterprise_values)
         for df in dfs:
-            if not df.empty:
-                df["date"] = pd.to_datetime(df["date"])
-        if len(dfs) >= 4 and "enterprise_value" in dfs[3].columns:
-            dfs[3] = dfs[3].drop(columns=["enterprise_value"])
+            df["date"] = pd.to_datetime(df["date"])
         return dfs
     
     def _combine_data_sources(self, prices, data_sources, market_cap_df=None):
-        df = prices.set_index(["symbol", "date"])
-        for src in data_sources:
-            if src.empty:
-                continue
-            aligned = self.expand_periodic_data(prices, src)
-            aligned = aligned.drop(columns=["close"], errors="ignore")
-            overlap = df.columns.intersection(aligned.columns)
-            if len(overlap):
-                aligned = aligned.drop(columns=overlap)
-            df = df.join(aligned, how="left")
-
+        # All periodic sources (and market cap) aligned against one sorted price calendar;
+        # earlier sources win on shared columns
+        sources = [src for src in data_sources if not src.empty]
         if market_cap_df is not None and not market_cap_df.empty:
-            mc_idx = market_cap_df.set_index(["symbol", "date"])
-            df = df.join(mc_idx, how="left")
-        df = df.groupby(level=0).ffill().bfill()
+            sources.append(market_cap_df)
+        df = self.expand_periodic_sources(prices, sources)
+        df = df.groupby(level=0, observed=True).ffill().bfill()
         return df
     
-    def _clean_null_graham_number(self, key_metrics_df: pd.DataFrame, earnings_df: pd.DataFrame) -> pd.DataFrame:
+    def _clean_null_graham_number(self, key_metrics_df: pd.DataFrame, earnings_df: pd.DataFrame, ratios_df: pd.DataFrame) -> pd.DataFrame:
         missing_rows = key_metrics_df[key_metrics_df["graham_number"].isnull()]
         if missing_rows.empty:
             return key_metrics_df
 
-        symbols = missing_rows["symbol"].unique().tolist()
         missing_rows = missing_rows.copy()
         missing_rows["date"] = pd.to_datetime(missing_rows["date"])
-        start_date = missing_rows["date"].min().strftime("%Y-%m-%d")
-        end_date = missing_rows["date"].max().strftime("%Y-%m-%d")
 
-        # Fetch book value per share
-        bvps_raw = self.getter.financial_metrics.get_financial_ratios(
-            symbols,
-            start_date,
-            end_date,
-            ["symbol", "date", "book_value_per_share"]
-        )
-        bvps_df = pd.DataFrame(bvps_raw)
-        if bvps_df.empty or "symbol" not in bvps_df.columns:
+        # Book value per share comes from the financial_ratios rows already fetched
+        if ratios_df.empty or "book_value_per_share" not in ratios_df.columns:
             return key_metrics_df
-        bvps_df["date"] = pd.to_datetime(bvps_df["date"])
+        bvps_df = ratios_df[["symbol", "date", "book_value_per_share"]]
 
         # Make sure earnings_df is usable
         earnings_df = earnings_df.copy()
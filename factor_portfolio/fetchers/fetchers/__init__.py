@@ -4,4 +4,6 @@ __all__ = [
     "BaseFetcher",
     "ValueFactorFetch",
     "SP500TickersFetcher",
+    "PanelCache",
+    "FetchStats",
 ]
@@ -0,0 +1,91 @@
+"""
+ValueFactorFetch.fetch_date against fetch on a small synthetic database.
+
+Usage:
+    python -m pytest factor_portfolio/tests
+"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent.parent))
+sys.path.append(str(Path(__file__).parent.parent))
+from database.database.StockDatabase import StockDatabase
+from database.database.db_getters import GetFinancialMetrics, GetMarketData, GetValuation
+from database.database.db_writers import StoreFinancialMetrics, StoreMarketData
+from fetchers.fetchers.FetchStats import FetchStats
+from fetchers.fetchers.ValueFactorFetch import KEY_METRICS_COLUMNS, ValueFactorFetch
+
+QUARTERS = ["2021-09-30", "2021-12-31", "2022-03-31"]
+AS_OF = "2022-06-15"
+
+
+def build_db(path: Path) -> StockDatabase:
+    """
+    Two symbols with daily prices and quarterly fundamentals. T0003's latest key_metrics
+    row has no graham number and negative EPS, so it cannot be backfilled.
+    """
+    db = StockDatabase(db_name=str(path))
+    db.initialize()
+    conn = db._get_connection()
+    market_data, metrics = StoreMarketData(conn), StoreFinancialMetrics(conn)
+    dates = pd.bdate_range("2022-01-03", AS_OF).strftime("%Y-%m-%d")
+    for t, symbol in enumerate(["T0001", "T0003"]):
+        market_data.store_price_bulk([
+            {"symbol": symbol, "date": date, "open": 10.0, "high": 10.0, "low": 10.0, "close": 10.0 + t + i / 100,
+             "volume": 1000, "change": 0.0, "change_percent": 0.0, "vwap": 10.0}
+            for i, date in enumerate(dates)
+        ])
+        market_data.store_market_cap_bulk([{"symbol": symbol, "date": date, "market_cap": 1e9} for date in dates])
+        latest = len(QUARTERS) - 1
+        unfillable = [symbol == "T0003" and q == latest for q in range(len(QUARTERS))]
+        metrics.store_earnings_bulk([
+            {"symbol": symbol, "date": date, "eps_actual": -1.0 if unfillable[q] else 2.0 + q}
+            for q, date in enumerate(QUARTERS)
+        ])
+        metrics.store_key_metrics_bulk([
+            {"symbol": symbol, "date": date, "reported_currency": "USD",
+             "earnings_yield": 0.05 + q / 100, "free_cash_flow_yield": 0.04 + q / 100,
+             "graham_number": None if unfillable[q] else 30.0 + q,
+             "return_on_equity": 0.1 + q / 100, "return_on_assets": 0.05 + q / 100, "enterprise_value": 1e9 * (q + 1)}
+            for q, date in enumerate(QUARTERS)
+        ])
+        metrics.store_financial_ratios_bulk([
+            {"symbol": symbol, "date": date, "reported_currency": "USD",
+             "price_to_earnings_ratio": 15.0 + q, "price_to_book_ratio": 2.0 + q,
+             "price_to_sales_ratio": 3.0 + q, "price_to_free_cash_flow_ratio": 20.0 + q, "book_value_per_share": 12.0 + q}
+            for q, date in enumerate(QUARTERS)
+        ])
+    conn.close()
+    return db
+
+
+def value_fetch(db: StockDatabase) -> ValueFactorFetch:
+    """ValueFactorFetch reading `db`, without BaseFetcher's default database and ticker lookup."""
+    fetcher = ValueFactorFetch.__new__(ValueFactorFetch)
+    fetcher.config = {}
+    fetcher.snapshot_path = None
+    fetcher.panel_cache = None
+    fetcher.last_stats = FetchStats()
+    fetcher.frames = SimpleNamespace(
+        market_data=GetMarketData(db.pool, "frame"),
+        financial_metrics=GetFinancialMetrics(db.pool, "frame"),
+        valuation=GetValuation(db.pool, "frame"),
+    )
+    return fetcher
+
+
+def test_fetch_date_falls_back_to_previous_usable_key_metrics(tmp_path):
+    fetcher = value_fetch(build_db(tmp_path / "stocks.db"))
+    symbols = ["T0001", "T0003"]
+
+    snapshot = fetcher.fetch_date(symbols, AS_OF)
+    panel = fetcher.fetch(symbols, AS_OF, AS_OF)
+
+    assert not snapshot.loc["T0003", KEY_METRICS_COLUMNS].isna().any(axis=None)
+    columns = panel.columns
+    assert set(snapshot.columns) == set(columns)
+    np.testing.assert_allclose(snapshot[columns].to_numpy(dtype=float), panel.to_numpy(dtype=float))
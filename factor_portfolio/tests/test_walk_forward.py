@@ -0,0 +1,43 @@
+"""
+BaseTrainer.walk_forward window model cache, through ValueFactorTrainer on a synthetic frame.
+
+Usage:
+    python -m pytest factor_portfolio/tests
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from factor_pipeline.factors.value.ValueFactorTrainer import ValueFactorTrainer
+
+
+def synthetic_frame(features: list, symbols: int = 20, dates: int = 120, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    n = symbols * dates
+    df = pd.DataFrame({
+        "symbol": np.repeat([f"T{s:04d}" for s in range(symbols)], dates),
+        "date": np.tile(pd.bdate_range("2020-01-01", periods=dates), symbols),
+    })
+    for feature in features:
+        df[feature] = rng.standard_normal(n)
+    returns = 0.002 * df[features[0]] + rng.normal(0, 0.02, n)
+    df["close"] = 100 * np.exp(returns.groupby(df["symbol"]).cumsum())
+    return df
+
+
+def test_rerun_on_same_frame_reloads_windows(tmp_path):
+    trainer = ValueFactorTrainer(None, "linear", {})
+    training_cols = ["z_" + feature for feature in trainer.features]
+    df = synthetic_frame(trainer.features)
+    original = df.copy()
+
+    first = trainer.walk_forward(df, training_cols, n_jobs=1, cache_dir=str(tmp_path))
+    assert trainer.last_walk_forward["cached"] == 0
+    second = trainer.walk_forward(df, training_cols, n_jobs=1, cache_dir=str(tmp_path))
+
+    assert trainer.last_walk_forward["cached"] == trainer.last_walk_forward["windows"]
+    pd.testing.assert_frame_equal(first, second)
+    pd.testing.assert_frame_equal(df, original)
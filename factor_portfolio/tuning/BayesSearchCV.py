@@ -0,0 +1,168 @@
+import time
+import warnings
+from numbers import Number
+from typing import Optional
+import numpy as np
+from scipy.stats import norm
+from sklearn.base import clone
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import ConstantKernel, Matern, WhiteKernel
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import ParameterGrid, check_cv, cross_validate
+
+# Marks a parameter absent from a candidate (list-of-dicts grids)
+_MISSING = object()
+
+class BayesSearchCV:
+    """
+    Sequential model-based search over a parameter grid, with early stopping.
+
+    After `n_initial` random candidates, a Gaussian process fitted to the scores seen so
+    far picks the candidate with the highest expected improvement, one at a time, until
+    `n_iter` candidates are evaluated or the best score has not improved by more than
+    `tol` for `n_iter_no_change` evaluations. Each candidate is cross-validated on the
+    same folds; the folds of one candidate run in parallel over `n_jobs`.
+
+    Takes the same `param_grid` (dict or list of dicts of value lists) as GridSearchCV
+    and exposes the same results: best_params_, best_score_, best_index_, cv_results_
+    and, with `refit`, best_estimator_.
+    """
+
+    def __init__(
+        self,
+        estimator,
+        param_grid,
+        n_iter: int = 30,
+        n_initial: int = 5,
+        cv=5,
+        scoring: Optional[str] = None,
+        n_jobs: Optional[int] = None,
+        refit: bool = True,
+        random_state: Optional[int] = None,
+        n_iter_no_change: int = 5,
+        tol: float = 1e-4,
+        verbose: int = 0,
+    ):
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.n_iter = n_iter
+        self.n_initial = n_initial
+        self.cv = cv
+        self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.refit = refit
+        self.random_state = random_state
+        self.n_iter_no_change = n_iter_no_change
+        self.tol = tol
+        self.verbose = verbose
+
+    def fit(self, X, y):
+        candidates = list(ParameterGrid(self.param_grid))
+        features = self._encode(candidates)
+        folds = list(check_cv(self.cv, y).split(X, y))
+        scorer = check_scoring(self.estimator, scoring=self.scoring)
+        rng = np.random.default_rng(self.random_state)
+        budget = min(self.n_iter, len(candidates))
+        queue = list(rng.choice(len(candidates), size=min(self.n_initial, budget), replace=False))
+        n_random = len(queue)
+
+        evaluated, fold_scores, fit_times = [], [], []
+        best, since_improved = -np.inf, 0
+        self.stopped_early_ = False
+        while len(evaluated) < budget:
+            index = queue.pop(0) if queue else self._next_candidate(features, evaluated, fold_scores, rng)
+            estimator = clone(self.estimator).set_params(**candidates[index])
+            result = cross_validate(estimator, X, y, cv=folds, scoring=scorer, n_jobs=self.n_jobs)
+            evaluated.append(index)
+            fold_scores.append(result["test_score"])
+            fit_times.append(result["fit_time"])
+
+            score = np.mean(result["test_score"])
+            if self.verbose:
+                print(f"[{len(evaluated)}/{budget}] {candidates[index]} score={score:.6g}")
+            if score > best + self.tol:
+                best, since_improved = score, 0
+            elif len(evaluated) > n_random:
+                # Only model-guided picks count towards early stopping
+                since_improved += 1
+                if since_improved >= self.n_iter_no_change:
+                    self.stopped_early_ = True
+                    break
+
+        self.n_candidates_ = len(candidates)
+        self.n_splits_ = len(folds)
+        self.cv_results_ = self._results(candidates, evaluated, fold_scores, fit_times)
+        means = np.nan_to_num(self.cv_results_["mean_test_score"], nan=-np.inf)
+        self.best_index_ = int(np.argmax(means))
+        self.best_params_ = self.cv_results_["params"][self.best_index_]
+        self.best_score_ = self.cv_results_["mean_test_score"][self.best_index_]
+        if self.refit:
+            start = time.perf_counter()
+            self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+            self.refit_time_ = time.perf_counter() - start
+        return self
+
+    def _next_candidate(self, features: np.ndarray, evaluated: list, fold_scores: list, rng) -> int:
+        """Unevaluated candidate with the highest expected improvement under the surrogate."""
+        remaining = np.setdiff1d(np.arange(len(features)), evaluated)
+        scores = np.array([np.mean(s) for s in fold_scores])
+        finite = np.isfinite(scores)
+        if finite.sum() < 2:
+            return int(rng.choice(remaining))
+
+        kernel = ConstantKernel() * Matern(length_scale=np.ones(features.shape[1]), nu=2.5) + WhiteKernel()
+        surrogate = GaussianProcessRegressor(kernel=kernel, normalize_y=True, random_state=self.random_state)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ConvergenceWarning)
+            surrogate.fit(features[np.array(evaluated)[finite]], scores[finite])
+        mean, std = surrogate.predict(features[remaining], return_std=True)
+        improvement = mean - scores[finite].max()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.where(std > 0, improvement / std, 0.0)
+        expected = improvement * norm.cdf(z) + std * norm.pdf(z)
+        return int(remaining[np.argmax(expected)])
+
+    @staticmethod
+    def _encode(candidates: list) -> np.ndarray:
+        """
+        Candidates as numeric surrogate inputs: numeric params by their rank among the
+        grid's values (scaled to [0, 1], suiting log-spaced grids), others one-hot.
+        """
+        names = sorted({name for params in candidates for name in params})
+        columns = []
+        for name in names:
+            values = [params.get(name, _MISSING) for params in candidates]
+            present = [v for v in values if v is not _MISSING]
+            if all(isinstance(v, Number) and not isinstance(v, bool) for v in present):
+                levels = sorted(set(present))
+                scale = max(len(levels) - 1, 1)
+                columns.append([levels.index(v) / scale if v is not _MISSING else -1.0 for v in values])
+            else:
+                for level in sorted({repr(v) for v in values}):
+                    columns.append([float(repr(v) == level) for v in values])
+        return np.array(columns, dtype=float).T.reshape(len(candidates), -1)
+
+    def _results(self, candidates: list, evaluated: list, fold_scores: list, fit_times: list) -> dict:
+        """cv_results_ in GridSearchCV's layout, one entry per evaluated candidate in order."""
+        scores = np.array(fold_scores)
+        means = scores.mean(axis=1)
+        ranks = np.empty(len(means), dtype=int)
+        ranks[np.argsort(-np.nan_to_num(means, nan=-np.inf), kind="stable")] = np.arange(1, len(means) + 1)
+        results = {
+            "params": [candidates[i] for i in evaluated],
+            "iter": np.arange(len(evaluated)),
+            "mean_fit_time": np.array(fit_times).mean(axis=1),
+            "mean_test_score": means,
+            "std_test_score": scores.std(axis=1),
+            "rank_test_score": ranks,
+        }
+        for k in range(scores.shape[1]):
+            results[f"split{k}_test_score"] = scores[:, k]
+        for name in sorted({name for params in results["params"] for name in params}):
+            column = np.ma.MaskedArray(np.empty(len(evaluated), dtype=object), mask=True)
+            for row, params in enumerate(results["params"]):
+                if name in params:
+                    column[row] = params[name]
+            results[f"param_{name}"] = column
+        return results
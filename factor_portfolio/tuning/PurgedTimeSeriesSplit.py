@@ -0,0 +1,75 @@
+from typing import Iterator, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+class PurgedTimeSeriesSplit:
+    """
+    Cross-validation splitter over dates instead of rows, for (symbol, date) panels.
+
+    The unique dates are cut into contiguous blocks and all rows of a date land in the
+    same block, so no date is shared between training and testing. With `forward_only`
+    (default) fold k tests block k + 1 and trains on the blocks before it, like
+    TimeSeriesSplit on dates; otherwise every block is tested once with all the others
+    as training data (purged k-fold).
+
+    The `purge` training dates right before a test block are dropped, because their
+    forward returns are realized inside it; `embargo` drops the dates right after a test
+    block from training (only relevant without `forward_only`).
+
+    Dates come from `groups` if given, else from X's "date" index level or column.
+    Usable anywhere scikit-learn takes a `cv` splitter; outside Tuner, which drops it,
+    a "date" column would also reach the estimator as a feature, so pass the dates as
+    `groups` (or as an index level) instead.
+    """
+
+    def __init__(self, n_splits: int = 5, purge: int = 1, embargo: int = 0, forward_only: bool = True, max_train_dates: Optional[int] = None):
+        if n_splits < 2:
+            raise ValueError("n_splits must be at least 2")
+        self.n_splits = n_splits
+        self.purge = purge
+        self.embargo = embargo
+        self.forward_only = forward_only
+        self.max_train_dates = max_train_dates
+
+    def get_n_splits(self, X=None, y=None, groups=None) -> int:
+        return self.n_splits
+
+    def split(self, X, y=None, groups=None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Yields (train, test) row positions, each sorted."""
+        codes, dates = pd.factorize(np.asarray(self.dates_of(X, groups)), sort=True)
+        n_dates = len(dates)
+        n_blocks = self.n_splits + 1 if self.forward_only else self.n_splits
+        if n_dates < n_blocks:
+            raise ValueError(f"{n_dates} dates cannot be split into {n_blocks} date blocks")
+
+        # Rows grouped by date: the rows of dates [a, b) are order[row_starts[a]:row_starts[b]]
+        order = np.argsort(codes, kind="stable")
+        row_starts = np.searchsorted(codes[order], np.arange(n_dates + 1))
+
+        def rows(start: int, stop: int) -> np.ndarray:
+            return order[row_starts[start]:row_starts[stop]]
+
+        bounds = np.linspace(0, n_dates, n_blocks + 1).astype(int)
+
+        for k in range(1 if self.forward_only else 0, n_blocks):
+            test_start, test_stop = bounds[k], bounds[k + 1]
+            train_stop = max(0, test_start - self.purge)
+            train_start = 0 if self.max_train_dates is None else max(0, train_stop - self.max_train_dates)
+            train = [rows(train_start, train_stop)]
+            if not self.forward_only:
+                train.append(rows(min(n_dates, test_stop + self.embargo), n_dates))
+            train = np.sort(np.concatenate(train))
+            if not len(train):
+                raise ValueError(f"Fold {k} has no training dates left after purging; use fewer splits or a smaller purge")
+            yield train, np.sort(rows(test_start, test_stop))
+
+    @staticmethod
+    def dates_of(X, groups=None) -> np.ndarray:
+        """Row dates from `groups`, or X's "date" index level or column; raises if there are none."""
+        if groups is not None:
+            return np.asarray(groups)
+        if isinstance(X, pd.DataFrame) and "date" in X.columns:
+            return X["date"].to_numpy()
+        if hasattr(X, "index") and "date" in (X.index.names or []):
+            return X.index.get_level_values("date").to_numpy()
+        raise ValueError("PurgedTimeSeriesSplit needs row dates: pass groups or give X a 'date' index level or column")
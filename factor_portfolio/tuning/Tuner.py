@@ -1,12 +1,44 @@
+import copy
+import os
+import shutil
+import tempfile
+import time
+import warnings
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
 from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from xgboost import XGBRegressor
-from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import GridSearchCV, RandomizedSearchCV, HalvingGridSearchCV, HalvingRandomSearchCV, cross_val_score
+from .BayesSearchCV import BayesSearchCV
+from .PurgedTimeSeriesSplit import PurgedTimeSeriesSplit
+
+SEARCH_TYPES = ("grid", "random", "halving_grid", "halving_random", "bayes")
+# Largest n_estimators budget for halving over n_estimators when the grid gives none
+DEFAULT_MAX_ESTIMATORS = 500
 
 class Tuner:
     """
     Universal hyperparameter tuner for all supported model types.
-    Supports 'grid' or 'random' search.
+
+    search_type:
+        "grid" / "random":                 exhaustive or `n_iter` sampled candidates, full budget each
+        "halving_grid" / "halving_random": successive halving; candidates race on a growing
+                                           `resource` ("n_samples" rows, or "n_estimators" for
+                                           the tree ensembles) and the best 1/`factor` advance
+        "bayes":                           BayesSearchCV, up to `n_iter` candidates picked by a
+                                           Gaussian-process surrogate, stopping after
+                                           `n_iter_no_change` evaluations without improvement
+
+    An integer `cv` means that many PurgedTimeSeriesSplit folds over the rows' dates
+    (X's "date" index level or column, or `dates` passed to tune), so no fold trains on
+    data from after its test dates; a "date" column only defines the folds and is dropped
+    from the features. The folds are computed once per tune call and kept in
+    `self.folds`. A PurgedTimeSeriesSplit `cv` is split on the same dates; any other `cv`
+    (a splitter or a list of folds) is used as given.
     """
     def __init__(
         self,
@@ -14,11 +46,20 @@ class Tuner:
         param_grid: dict,
         cv: int = 5,
         scoring: str = None,
-        search_type: str = "grid",       # "grid" or "random"
-        n_iter: int = 10,                # only for randomized
+        search_type: str = "grid",       # one of SEARCH_TYPES
+        n_iter: int = 10,                # candidates for random, halving_random and bayes
         random_state: int = 42,
-        n_jobs: int = -1
+        n_jobs: int = -1,
+        purge: int = 1,                  # dates dropped before each test block
+        embargo: int = 0,                # dates dropped after each test block
+        shared_memory: bool = True,      # memory-map X/y once for parallel workers
+        factor: int = 3,                 # halving: 1/factor of candidates advance per round
+        resource: str = "n_samples",     # halving: "n_samples" or "n_estimators"
+        n_iter_no_change: int = 5,       # bayes: early stopping patience
+        tol: float = 1e-4                # bayes: minimum improvement that resets patience
     ):
+        if search_type not in SEARCH_TYPES:
+            raise ValueError(f"search_type must be one of {SEARCH_TYPES}, got {search_type!r}")
         self.model_type   = model_type
         self.param_grid   = param_grid
         self.cv           = cv
@@ -27,7 +68,15 @@ class Tuner:
         self.n_iter       = n_iter
         self.random_state = random_state
         self.n_jobs       = n_jobs
+        self.purge        = purge
+        self.embargo      = embargo
+        self.shared_memory = shared_memory
+        self.factor       = factor
+        self.resource     = resource
+        self.n_iter_no_change = n_iter_no_change
+        self.tol          = tol
         self.searcher     = None
+        self.folds        = None
 
     def _make_base_estimator(self):
         """Instantiate an un-parameterized estimator of the right class."""
@@ -41,34 +90,166 @@ class Tuner:
             return GradientBoostingRegressor(random_state=self.random_state)
         raise ValueError(f"Unsupported model_type: {self.model_type}")
 
-    def tune(self, X, y):
+    def make_folds(self, X, y, dates=None):
+        """(train, test) row positions for each fold, split by date when `cv` is an integer."""
+        if isinstance(self.cv, PurgedTimeSeriesSplit):
+            return list(self.cv.split(X, y, dates))
+        if not isinstance(self.cv, int):
+            return self.cv
+        try:
+            dates = PurgedTimeSeriesSplit.dates_of(X, dates)
+        except ValueError as e:
+            warnings.warn(f"Falling back to {self.cv}-fold row CV: {e}")
+            return self.cv
+        splitter = PurgedTimeSeriesSplit(n_splits=self.cv, purge=self.purge, embargo=self.embargo)
+        return list(splitter.split(X, y, dates))
+
+    def _make_searcher(self, estimator, cv, refit: bool):
+        common = dict(cv=cv, scoring=self.scoring, n_jobs=self.n_jobs, refit=refit)
+        if self.search_type == "grid":
+            return GridSearchCV(estimator, self.param_grid, verbose=1, **common)
+        if self.search_type == "random":
+            return RandomizedSearchCV(estimator, self.param_grid, n_iter=self.n_iter, random_state=self.random_state, verbose=1, **common)
+        if self.search_type == "bayes":
+            return BayesSearchCV(
+                estimator, self.param_grid,
+                n_iter=self.n_iter,
+                random_state=self.random_state,
+                n_iter_no_change=self.n_iter_no_change,
+                tol=self.tol,
+                verbose=1,
+                **common
+            )
+
+        param_grid, resources = self._halving_resources(estimator)
+        if self.search_type == "halving_grid":
+            return HalvingGridSearchCV(estimator, param_grid, factor=self.factor, random_state=self.random_state, verbose=1, **resources, **common)
+        return HalvingRandomSearchCV(
+            estimator, param_grid,
+            n_candidates=self.n_iter,
+            factor=self.factor,
+            random_state=self.random_state,
+            verbose=1,
+            **resources,
+            **common
+        )
+
+    def _halving_resources(self, estimator):
+        """
+        Param grid without the halving resource, and the resource bounds taken from it.
+
+        The budget is every row for "n_samples", else the largest grid value, and
+        `min_resources="exhaust"` sizes the first round so the last one uses all of it;
+        starting from the smallest possible budget instead lets sklearn stop once few
+        candidates remain, before any of them reach the budget.
+        """
+        if self.resource == "n_samples":
+            return self.param_grid, {"resource": "n_samples", "min_resources": "exhaust"}
+        if self.resource not in estimator.get_params():
+            raise ValueError(f"{self.model_type} has no '{self.resource}' parameter to use as the halving resource")
+        grids = self.param_grid if isinstance(self.param_grid, list) else [self.param_grid]
+        values = [value for grid in grids for value in grid.get(self.resource, [])]
+        grids = [{key: value for key, value in grid.items() if key != self.resource} for grid in grids]
+        resources = {
+            "resource": self.resource,
+            "min_resources": "exhaust",
+            "max_resources": max(values) if values else DEFAULT_MAX_ESTIMATORS,
+        }
+        return (grids if isinstance(self.param_grid, list) else grids[0]), resources
+
+    def tune(self, X, y, dates=None):
         """
         Run hyperparameter search. 
         Returns: (best_params, best_estimator_, cv_results_)
         """
         estimator = self._make_base_estimator()
-        if self.search_type == "grid":
-            self.searcher = GridSearchCV(
-                estimator, self.param_grid,
-                cv=self.cv,
-                scoring=self.scoring,
-                n_jobs=self.n_jobs,
-                verbose=1
+        X, dates = self._split_dates(X, dates)
+        self.folds = self.make_folds(X, y, dates)
+
+        shared_dir = None
+        X_fit, y_fit = X, y
+        if self.shared_memory and self.n_jobs != 1:
+            # Workers map one on-disk copy instead of receiving X/y pickled per task
+            shared_dir = tempfile.mkdtemp(prefix="tuner_")
+            X_fit = self._memmap(np.asarray(X, dtype=float), os.path.join(shared_dir, "X.mmap"))
+            y_fit = self._memmap(np.asarray(y, dtype=float), os.path.join(shared_dir, "y.mmap"))
+        try:
+            # Refit below on the original X so the estimator keeps its feature names
+            self.searcher = self._make_searcher(estimator, self.folds, refit=shared_dir is None)
+            self.searcher.fit(X_fit, y_fit)
+        finally:
+            if shared_dir:
+                shutil.rmtree(shared_dir, ignore_errors=True)
+
+        if self._reduced_budget(self.searcher):
+            warnings.warn(
+                f"{self.search_type} stopped at {self.searcher.n_resources_[-1]} of "
+                f"{self.searcher.max_resources_} {self.resource}; the best params were scored on a reduced budget"
             )
+        if shared_dir is None:
+            best_estimator = self.searcher.best_estimator_
         else:
-            self.searcher = RandomizedSearchCV(
-                estimator, self.param_grid,
-                n_iter=self.n_iter,
-                cv=self.cv,
-                scoring=self.scoring,
-                random_state=self.random_state,
-                n_jobs=self.n_jobs,
-                verbose=1
-            )
-
-        self.searcher.fit(X, y)
+            best_estimator = clone(estimator).set_params(**self.searcher.best_params_).fit(X, y)
         return (
             self.searcher.best_params_,
-            self.searcher.best_estimator_,
+            best_estimator,
             self.searcher.cv_results_
         )
+
+    def compare(self, X, y, search_types=SEARCH_TYPES, dates=None) -> pd.DataFrame:
+        """
+        Tuning report: runs each search type with this tuner's settings on the same data and
+        folds, and tabulates wall time, fits and best score.
+
+        `cv_score` is the best params' score on every fold at the full budget: all the rows,
+        and the largest `resource` value when halving over n_estimators. It equals
+        `best_score` unless halving stopped before the last round reached that budget.
+        """
+        features, _ = self._split_dates(X)
+        rows = []
+        for search_type in search_types:
+            tuner = copy.copy(self)
+            tuner.search_type = search_type
+            start = time.perf_counter()
+            best_params, best_estimator, cv_results = tuner.tune(X, y, dates)
+            seconds = time.perf_counter() - start
+
+            n_folds = len(tuner.folds) if isinstance(tuner.folds, list) else tuner.searcher.n_splits_
+            best_score = tuner.searcher.best_score_
+            cv_score = best_score
+            if self._reduced_budget(tuner.searcher):
+                full_budget = clone(best_estimator)
+                if self.resource != "n_samples":
+                    full_budget.set_params(**{self.resource: tuner.searcher.max_resources_})
+                cv_score = cross_val_score(full_budget, features, y, cv=tuner.folds, scoring=self.scoring, n_jobs=self.n_jobs).mean()
+            rows.append({
+                "search_type": search_type,
+                "seconds": seconds,
+                "candidates": len({str(params) for params in cv_results["params"]}),
+                "fits": len(cv_results["params"]) * n_folds,
+                "best_score": best_score,
+                "cv_score": cv_score,
+                "stopped_early": getattr(tuner.searcher, "stopped_early_", False),
+                "best_params": best_params,
+            })
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _reduced_budget(searcher) -> bool:
+        """Whether a halving search's last round used less than its full resource budget."""
+        n_resources = getattr(searcher, "n_resources_", None)
+        return bool(n_resources) and n_resources[-1] < searcher.max_resources_
+
+    @staticmethod
+    def _split_dates(X, dates=None):
+        """X without a "date" column, which only defines the folds, and the row dates."""
+        if isinstance(X, pd.DataFrame) and "date" in X.columns:
+            if dates is None:
+                dates = X["date"].to_numpy()
+            X = X.drop(columns="date")
+        return X, dates
+
+    @staticmethod
+    def _memmap(values: np.ndarray, path: str) -> np.ndarray:
+        joblib.dump(values, path)
+        return joblib.load(path, mmap_mode="r")
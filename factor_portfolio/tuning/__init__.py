@@ -1,5 +1,10 @@
-from .Tuner import Tuner
+from .Tuner import Tuner, SEARCH_TYPES
+from .BayesSearchCV import BayesSearchCV
+from .PurgedTimeSeriesSplit import PurgedTimeSeriesSplit
 
 __all__ = [
     "Tuner",
+    "SEARCH_TYPES",
+    "BayesSearchCV",
+    "PurgedTimeSeriesSplit",
 ]